@@ -0,0 +1,81 @@
+"""
+GitWars - Entity Memory Benchmark
+=================================
+Compares the slotted entity classes against dict-backed copies of the
+same classes (identical __init__ and methods, just without __slots__).
+
+Run with: python bench_entities.py [--count 20000]
+
+For each class it prints bytes per instance (tracemalloc, including the
+values the instance owns) and attribute reads and writes per second.
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from gitwars.effects import Particle, Trail
+from gitwars.entities import Bullet, Coin, Tank, Wall
+
+# How to build one instance of each class, and 6 attribute accesses to time
+# (reads and writes in the style of the physics loop; walls are read-only)
+MOVE = "obj.x = obj.x + obj.y; obj.y = obj.y - obj.x"
+FACTORIES = {
+    Tank: (lambda cls, i: cls(i % 8, 100.0 + i, 200.0, (255, 0, 0)), MOVE),
+    Bullet: (lambda cls, i: cls(100.0 + i, 200.0, 45.0, i % 8, (255, 255, 0)), MOVE),
+    Coin: (lambda cls, i: cls(100.0 + i, 200.0), MOVE),
+    Wall: (lambda cls, i: cls(100.0 + i, 200.0, 40.0, 20.0),
+           "obj.x + obj.y + obj.width + obj.height + obj.x + obj.y"),
+    Trail: (lambda cls, i: cls((0, 255, 0)),
+            "obj.max_length = obj.max_length; obj.color = obj.color; obj.positions; obj.positions"),
+    Particle: (lambda cls, i: cls(100.0 + i, 200.0, 1.0, -1.0, (255, 128, 0), 3.0), MOVE),
+}
+
+
+def dict_backed(cls):
+    """Copy of a slotted class that stores attributes in a per-instance __dict__."""
+    namespace = {name: value for name, value in cls.__dict__.items()
+                 if name not in ("__slots__", "__dict__", "__weakref__", *cls.__slots__)}
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+def bytes_per_instance(cls, factory, count: int) -> float:
+    """Average traced allocation per instance while `count` are alive."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [factory(cls, i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    list_bytes = instances.__sizeof__()  # The holding list is not the entity's
+    del instances
+    return (after - before - list_bytes) / count
+
+
+def accesses_per_second(instance, stmt: str) -> float:
+    """Attribute accesses per second for one instance."""
+    loops = 200_000
+    seconds = min(timeit.repeat(stmt, number=loops, repeat=5, globals={"obj": instance}))
+    return loops * 6 / seconds
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Slotted vs dict-backed entity benchmark")
+    parser.add_argument("--count", type=int, default=20000, help="Instances per class for memory")
+    args = parser.parse_args()
+
+    header = ["class", "dict B", "slots B", "saved", "dict M/s", "slots M/s"]
+    print("  ".join(f"{h:>10}" for h in header))
+    for cls, (factory, stmt) in FACTORIES.items():
+        plain = dict_backed(cls)
+        dict_bytes = bytes_per_instance(plain, factory, args.count)
+        slot_bytes = bytes_per_instance(cls, factory, args.count)
+        dict_rate = accesses_per_second(factory(plain, 0), stmt)
+        slot_rate = accesses_per_second(factory(cls, 0), stmt)
+        row = [cls.__name__, f"{dict_bytes:.0f}", f"{slot_bytes:.0f}",
+               f"{1 - slot_bytes / dict_bytes:.0%}", f"{dict_rate / 1e6:.1f}", f"{slot_rate / 1e6:.1f}"]
+        print("  ".join(f"{c:>10}" for c in row))
+
+
+if __name__ == "__main__":
+    main()
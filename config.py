@@ -10,14 +10,16 @@ Change GAME_MODE to switch between tournament rounds:
 - 3: The Duel (1v1 Finals)
 """
 
-import pygame
-
 # =============================================================================
 # DISPLAY SETTINGS
 # =============================================================================
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+
+# Arena size, independent of the window. Bigger arenas scroll with the camera.
+WORLD_WIDTH = SCREEN_WIDTH
+WORLD_HEIGHT = SCREEN_HEIGHT
 TITLE = "GitWars - CONSOLE Tank Tournament"
 
 # =============================================================================
@@ -64,6 +66,7 @@ TANK_ROTATION_SPEED = 5.0           # Degrees per frame
 TANK_MAX_HEALTH = 1000
 TANK_STARTING_AMMO = 1500
 TANK_RECOIL = 3.0                   # Pushback when shooting
+TANK_COLLISIONS = True              # Tanks block each other (sweep-and-prune broadphase)
 
 # =============================================================================
 # BULLET SETTINGS
@@ -91,6 +94,15 @@ PARTICLE_SIZE_RANGE = (4, 12)       # Min/max particle size
 MUZZLE_FLASH_SIZE = 20
 MUZZLE_FLASH_DURATION = 5           # Frames
 
+# =============================================================================
+# QUALITY GOVERNOR (windowed game)
+# =============================================================================
+QUALITY_GOVERNOR_ENABLED = True     # Shed cosmetic effects when frames run long
+QUALITY_FRAME_BUDGET_MS = 12.0      # Update + draw time per frame (excl. FPS cap wait)
+QUALITY_RECOVER_RATIO = 0.6         # Raise quality again below budget * ratio
+QUALITY_WINDOW = 30                 # Frames in the rolling average
+QUALITY_HOLD_FRAMES = 60            # Min frames between quality changes
+
 # =============================================================================
 # SCREEN SHAKE SETTINGS
 # =============================================================================
@@ -98,6 +110,16 @@ SHAKE_INTENSITY = 8                 # Max pixel offset
 SHAKE_DURATION = 0.5                # Seconds
 SHAKE_DECAY = 0.9                   # Intensity decay per frame
 
+# =============================================================================
+# CAMERA SETTINGS
+# =============================================================================
+CAMERA_MIN_ZOOM = 0.25              # Furthest zoom-out (1.0 = one world pixel per screen pixel)
+CAMERA_MAX_ZOOM = 1.0               # Closest zoom-in (> 1 zooms in on small fights)
+CAMERA_FOLLOW_ZOOM = 1.0            # Zoom when following a selected tank
+CAMERA_PADDING = 150                # World pixels kept around the live tanks
+CAMERA_SMOOTHING = 0.1              # Fraction of the way to the target per frame
+CAMERA_ZOOM_STEP = 1.25             # +/- keys multiply the zoom by this
+
 # =============================================================================
 # GAME MODE SETTINGS
 # =============================================================================
@@ -123,6 +145,7 @@ DANGER_ZONE_RADIUS = 120            # Size of the circle
 DANGER_ZONE_DAMAGE = 25             # Damage per blast hit
 DANGER_ZONE_KNOCKBACK = 40.0       # Knockback force from blasts
 DANGER_ZONE_BLAST_INTERVAL = 0.5    # Seconds between explosions
+DANGER_ZONE_FRAME_STEPS = 16        # Pre-rendered pulse frames per phase
 COLOR_DANGER_WARNING = (255, 50, 50, 100)   # Semi-transparent red
 COLOR_DANGER_ACTIVE = (255, 150, 150, 180)  # Bright red-white
 
@@ -169,15 +192,40 @@ WALL_COLOR = (200, 200, 220)
 WALL_GLOW_COLOR = (100, 100, 150)
 GRID_CELL_SIZE = 50                 # For maze generation
 
+# Procedural Labyrinth (Mode 2)
+MAZE_PROCEDURAL = True              # False = classic hand-placed layout
+MAZE_SEED = None                    # Fixed seed, or None for a new maze each match
+MAZE_ROOM_CELLS = 3                 # Room size in grid cells (corridor width)
+MAZE_WALL_THICKNESS = 20            # Wall thickness (pixels)
+MAZE_LOOP_CHANCE = 0.35             # Fraction of extra walls removed (adds loops)
+MAZE_CACHE_DIR = ".cache/mazes"     # Generated layouts (relative to project root)
+
+# Threat prediction (context["threats"])
+THREAT_HORIZON = 2.0                # Ignore closest approaches further ahead (seconds)
+THREAT_HIT_RADIUS = TANK_SIZE // 2 + BULLET_SIZE  # Miss distance that counts as a hit
+
+# Wall distance field (built once per map)
+SDF_CELL_SIZE = 10                  # Sample spacing (pixels)
+SDF_MAX_DISTANCE = 300.0            # Distances are capped here (>= sensor range)
+SDF_MIN_STEP = 3.0                  # Smallest sphere-trace step (keep < wall thickness)
+
+# Wall broadphase grid (built once per map)
+WALL_GRID_CELL_SIZE = 80            # Bucket size (pixels); walls are listed in every bucket they touch
+
 # =============================================================================
 # BOT SETTINGS
 # =============================================================================
 BOT_TIMEOUT_MS = 100                # Max execution time for bot logic
+BOT_INIT_TIMEOUT_MS = 1000          # One-time budget for a bot's optional init(static_context)
 BOT_DEFAULT_COUNT = 3        # Number of bots in game
+BOT_THINK_INTERVAL = 1              # Frames between bot decisions (a bot may set THINK_INTERVAL)
+BOT_PLAN_SLICE_MS = 5               # Per-frame time slice for generator bots (see gitwars.bots)
 
 # =============================================================================
 # AUDIO SETTINGS
 # =============================================================================
+AUDIO_NUM_CHANNELS = 32             # Mixer channels (prevents sounds cutting out)
+AUDIO_CACHE_DIR = ".cache/audio"    # Decoded WAV cache (relative to project root)
 MUSIC_VOLUME = 0.5
 SFX_VOLUME = 0.7  # Master SFX volume (base)
 
@@ -189,9 +237,46 @@ VOL_READY = 0.9      # Loud start announcement
 VOL_WIN = 1.0        # Loud victory music
 PITCH_VARIATION = 0.2               # Random pitch shift for SFX
 
+# SFX Dispatcher (per-frame batching)
+SFX_MAX_VOICES = 4                  # Max concurrent voices per sound
+SFX_COALESCE_MS = 40                # Repeats of a sound inside this window are merged
+SFX_VOLUME_STEPS = 20               # Pre-scaled volume variants per sound
+
 # =============================================================================
 # DEBUG SETTINGS
 # =============================================================================
 DEBUG_MODE = False
 SHOW_HITBOXES = False
-SHOW_FPS = True
\ No newline at end of file
+SHOW_FPS = True
+
+# =============================================================================
+# SHARED-MEMORY WORLD STATE (Out-of-process bots)
+# =============================================================================
+SHARED_STATE_ENABLED = False        # Publish world state for bot worker processes
+SHARED_STATE_NAME = "gitwars_world" # Block name prefix (the engine's PID is appended)
+SHARED_STATE_MAX_TANKS = 64         # Fixed record capacities (layout size)
+SHARED_STATE_MAX_BULLETS = 2048
+SHARED_STATE_MAX_COINS = 64
+SHARED_STATE_MAX_WALLS = 512
+
+# =============================================================================
+# SPECTATOR STREAM (Keyframes + deltas over TCP)
+# =============================================================================
+SPECTATOR_STREAM_ENABLED = False    # Serve the stream from main.py too (server.py always does)
+SPECTATOR_HOST = "0.0.0.0"          # Interface to listen on
+SPECTATOR_PORT = 47800
+SPECTATOR_KEYFRAME_INTERVAL = 120   # Frames between full keyframes
+SPECTATOR_MAX_BACKLOG = 1 << 20     # Bytes queued per viewer before it is dropped
+
+# =============================================================================
+# REPLAYS (Seekable keyframe + delta recordings)
+# =============================================================================
+REPLAY_RECORD_ENABLED = False       # Record every match to REPLAY_DIR (one file each, never pruned)
+REPLAY_DIR = "replays"              # Relative to project root
+REPLAY_KEYFRAME_INTERVAL = 60       # Frames between keyframes (max deltas per seek)
+
+# =============================================================================
+# TOURNAMENT (Headless matches + result cache)
+# =============================================================================
+MATCH_CACHE_DIR = ".cache/matches"  # Results keyed by bots, config, engine, mode, seed
+MATCH_MAX_FRAMES = FPS * 300        # Safety cap for matches that never end (5 min)
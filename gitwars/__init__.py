@@ -0,0 +1,13 @@
+"""
+GitWars - Engine Package
+========================
+Support modules for the GitWars engine (main.py).
+
+Modules here must stay free of display/audio side effects at import time
+so they can be used from bot worker processes and tooling.
+"""
+
+import os
+
+# Importing pygame (for Rect/Vector2) should not print a banner in workers
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
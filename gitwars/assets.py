@@ -0,0 +1,157 @@
+"""
+GitWars - Lazy Asset Loading
+============================
+Sounds and music are loaded on first use, never at import time.
+
+The mixer is initialized the first time something actually needs it, so
+headless runs and tooling that import the engine never open an audio device.
+
+Decoding MP3s is the slow part of startup, so the first decode of each
+sound is written to an on-disk WAV cache keyed by the source file's hash
+and the mixer format. Later launches load the WAV directly.
+"""
+
+import hashlib
+import os
+import wave
+from typing import Dict, Optional
+
+import pygame
+
+from config import MUSIC_VOLUME, AUDIO_CACHE_DIR, AUDIO_NUM_CHANNELS
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(ROOT_DIR, "assets")
+CACHE_DIR = os.path.join(ROOT_DIR, AUDIO_CACHE_DIR)
+
+_sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
+_audio_state = {"ready": None, "music": None}
+_critical_channel: Optional[pygame.mixer.Channel] = None
+
+
+# =============================================================================
+# MIXER
+# =============================================================================
+
+def init_audio() -> bool:
+    """Initialize the mixer on first call. Returns False if audio is unavailable."""
+    if _audio_state["ready"] is not None:
+        return _audio_state["ready"]
+
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        pygame.mixer.set_num_channels(AUDIO_NUM_CHANNELS)  # Prevent sounds cutting out
+        pygame.mixer.set_reserved(1)  # Channel 0 is for critical sounds only
+        _audio_state["ready"] = True
+    except pygame.error as e:
+        print(f"Warning: Audio unavailable: {e}")
+        _audio_state["ready"] = False
+    return _audio_state["ready"]
+
+
+def disable_audio():
+    """Never initialize the mixer in this process (headless runs)."""
+    _audio_state["ready"] = False
+
+
+def critical_channel() -> Optional[pygame.mixer.Channel]:
+    """Reserved channel for sounds that should NEVER be cut off (win, ready)."""
+    global _critical_channel
+    if _critical_channel is None and init_audio():
+        _critical_channel = pygame.mixer.Channel(0)
+    return _critical_channel
+
+
+# =============================================================================
+# DECODED PCM CACHE
+# =============================================================================
+
+def _cache_path(path: str) -> str:
+    """Cache file for a source file under the current mixer format."""
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    freq, size, channels = pygame.mixer.get_init()
+    return os.path.join(CACHE_DIR, f"{digest}_{freq}_{size}_{channels}.wav")
+
+
+def _write_cache(cache_path: str, sound: pygame.mixer.Sound):
+    """Store a decoded sound as a WAV matching the mixer format."""
+    freq, size, channels = pygame.mixer.get_init()
+    if size not in (8, -16, 16):
+        return  # WAV can't hold float/32-bit mixer formats verbatim
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = cache_path + ".tmp"
+    with wave.open(tmp_path, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(abs(size) // 8)
+        w.setframerate(freq)
+        w.writeframes(sound.get_raw())
+    os.replace(tmp_path, cache_path)
+
+
+def load_sound(filename: str) -> Optional[pygame.mixer.Sound]:
+    """Load a sound file, going through the decoded WAV cache."""
+    path = os.path.join(ASSETS_DIR, filename)
+    if not os.path.exists(path) or not init_audio():
+        return None
+
+    try:
+        cache_path = _cache_path(path)
+        if os.path.exists(cache_path):
+            return pygame.mixer.Sound(cache_path)
+
+        sound = pygame.mixer.Sound(path)
+        try:
+            _write_cache(cache_path, sound)
+        except OSError:
+            pass  # Read-only checkout - just skip caching
+        return sound
+    except (pygame.error, OSError):
+        print(f"Warning: Could not load sound {filename}")
+    return None
+
+
+def get_sound(filename: str) -> Optional[pygame.mixer.Sound]:
+    """Get a sound, loading it on first use."""
+    if filename not in _sounds:
+        _sounds[filename] = load_sound(filename)
+    return _sounds[filename]
+
+
+# =============================================================================
+# MUSIC
+# =============================================================================
+
+def play_music(*filenames: str):
+    """
+    Loop the first existing track from `filenames`.
+    Does nothing if that track is already playing (no restart on reset).
+    """
+    for filename in filenames:
+        path = os.path.join(ASSETS_DIR, filename)
+        if os.path.exists(path):
+            break
+    else:
+        return
+
+    if not init_audio():
+        return
+    if _audio_state["music"] == path and pygame.mixer.music.get_busy():
+        return
+
+    try:
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.set_volume(MUSIC_VOLUME)
+        pygame.mixer.music.play(-1)  # -1 = loop forever
+        _audio_state["music"] = path
+    except pygame.error as e:
+        print(f"Warning: Could not load music {filename}: {e}")
+
+
+def stop_music():
+    """Stop the music stream (if the mixer was ever started)."""
+    if pygame.mixer.get_init():
+        pygame.mixer.music.stop()
+    _audio_state["music"] = None
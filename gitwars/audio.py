@@ -0,0 +1,103 @@
+"""
+GitWars - Sound Effect Dispatcher
+=================================
+Batches sound-effect requests per frame so heavy fights don't churn the mixer.
+
+- Requests are queued during update() and flushed once per frame
+- Duplicate requests in the same frame (and within a short window across
+  frames) are coalesced into a single play at the loudest requested volume
+- Each sound has a cap on concurrent voices
+- Volume-scaled copies of each sound are built once and reused, so play()
+  never calls set_volume() on a shared Sound
+
+Requests are made by asset name and resolved through a loader on flush,
+so nothing touches the mixer until something actually plays.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from config import SFX_MAX_VOICES, SFX_COALESCE_MS, SFX_VOLUME_STEPS
+
+
+class SfxDispatcher:
+    """Per-frame, rate-limited sound effect player."""
+
+    def __init__(self, loader: Callable[[str], Optional[pygame.mixer.Sound]],
+                 max_voices: int = SFX_MAX_VOICES,
+                 coalesce_ms: float = SFX_COALESCE_MS,
+                 volume_steps: int = SFX_VOLUME_STEPS):
+        self.loader = loader
+        self.max_voices = max_voices
+        self.coalesce_window = coalesce_ms / 1000.0
+        self.volume_steps = volume_steps
+
+        # sound name -> loudest requested volume this frame
+        self._pending: Dict[str, float] = {}
+        # sound name -> time it was last played
+        self._last_played: Dict[str, float] = {}
+        # (sound name, volume step) -> pre-scaled copy
+        self._variants: Dict[Tuple[str, int], pygame.mixer.Sound] = {}
+        # sound name -> channels currently playing one of its variants
+        self._voices: Dict[str, List[Tuple[pygame.mixer.Channel, pygame.mixer.Sound]]] = {}
+
+    def request(self, name: Optional[str], volume: float):
+        """Queue a sound for this frame (merged with any duplicate request)."""
+        if name is None or volume <= 0:
+            return
+
+        if volume > self._pending.get(name, 0.0):
+            self._pending[name] = volume
+
+    def _variant(self, name: str, sound: pygame.mixer.Sound, volume: float) -> pygame.mixer.Sound:
+        """Get (or build once) a copy of `sound` with its volume baked in."""
+        step = max(1, min(self.volume_steps, round(volume * self.volume_steps)))
+        key = (name, step)
+        variant = self._variants.get(key)
+        if variant is None:
+            variant = pygame.mixer.Sound(buffer=sound.get_raw())
+            variant.set_volume(step / self.volume_steps)
+            self._variants[key] = variant
+        return variant
+
+    def _active_voices(self, key: str) -> List[Tuple[pygame.mixer.Channel, pygame.mixer.Sound]]:
+        """Channels still playing this sound (finished ones are dropped)."""
+        voices = [(ch, snd) for ch, snd in self._voices.get(key, [])
+                  if ch.get_busy() and ch.get_sound() is snd]
+        self._voices[key] = voices
+        return voices
+
+    def flush(self, now: Optional[float] = None):
+        """Play everything queued this frame. Call once per frame."""
+        if not self._pending:
+            return
+
+        now = time.perf_counter() if now is None else now
+
+        for key, volume in self._pending.items():
+            # Coalesce repeats across frames
+            if now - self._last_played.get(key, -1e9) < self.coalesce_window:
+                continue
+
+            # Cap concurrent voices per sound
+            voices = self._active_voices(key)
+            if len(voices) >= self.max_voices:
+                continue
+
+            sound = self.loader(key)
+            if sound is None:
+                continue
+
+            variant = self._variant(key, sound, volume)
+            channel = variant.play()
+            if channel is not None:
+                voices.append((channel, variant))
+                self._last_played[key] = now
+
+        self._pending.clear()
+
+    def clear(self):
+        """Drop queued requests (e.g. on restart)."""
+        self._pending.clear()
@@ -0,0 +1,269 @@
+"""
+GitWars - Bot Loader (Sandboxed Execution)
+==========================================
+Loads student bot scripts and runs their update() with a time budget.
+
+Context modes (a bot opts in with a module-level CONTEXT_MODE = "delta"):
+- "full"   (default) the whole context every frame
+- "delta"  the whole context once (context["full"] is True), then per frame
+           only what changed. "enemies", "bullets" and "coins" become
+           {"added": [entries], "removed": [ids], "moved": [entries]}
+           keyed by each entry's stable "id". "walls" is left out because
+           it never changes. Every other key is sent in full.
+
+Think rate (a bot opts in with a module-level THINK_INTERVAL = N):
+update() runs every N frames (default BOT_THINK_INTERVAL) and its last
+decision is repeated in between (a LAG penalty is served once, and the
+bot idles until it thinks again). ThinkScheduler staggers bots with the
+same interval across frames, so each frame runs about 1/N of them.
+
+Generator bots: update(context) may be a generator for work that spans
+frames (path planning, interception solutions). Each frame the engine
+resumes it once with send(context) (the newest context) and stops at the
+first (action, param) it yields. Yield None to keep working: the engine
+steps on with next() until an action comes out or BOT_PLAN_SLICE_MS is
+used up, and meanwhile repeats the last action. A generator that yields
+an action every frame is stepped exactly once per frame (reproducible);
+how far None steps get depends on the clock. When the generator returns
+(its return value may be a final action), the next frame calls update()
+again. The usual BOT_TIMEOUT_MS LAG penalty applies
+to a frame's total time, so a single long step still counts as lag.
+
+Init hook: a bot may define init(static_context), called once per match
+after the arena is built, with BOT_INIT_TIMEOUT_MS instead of the
+per-frame budget. static_context holds "walls", "arena" ({"width",
+"height"}), "game_mode" and "my_id". Once init() succeeds, "walls" and
+"game_mode" are left out of that bot's per-frame contexts. A bot that
+overruns the init budget is penalised with LAG on its first frame.
+"""
+
+import copy
+import importlib.util
+import inspect
+import os
+import time
+from typing import Callable, Dict, Generator, Optional, Tuple
+
+from config import BOT_INIT_TIMEOUT_MS, BOT_PLAN_SLICE_MS, BOT_THINK_INTERVAL, BOT_TIMEOUT_MS
+
+VALID_ACTIONS = ("MOVE", "SHOOT", "STOP", "MOVE_AND_SHOOT")
+
+# Per-frame context keys handed over once through init() instead
+STATIC_KEYS = ("walls", "game_mode")
+
+
+def parse_action(result) -> Tuple[Optional[str], Optional[any]]:
+    """(action, param) if result is a valid bot decision, else (None, None)."""
+    if isinstance(result, tuple) and len(result) == 2 and result[0] in VALID_ACTIONS:
+        return result
+    return None, None
+
+
+class DeltaContext:
+    """Turns one bot's full contexts into added/removed/moved deltas."""
+
+    KEYED = ("enemies", "bullets", "coins")
+
+    def __init__(self):
+        self.known: Optional[Dict[str, Dict]] = None  # {section: {id: entry}}
+
+    def build(self, context: Dict) -> Dict:
+        """Delta against the previous frame (full context the first time)."""
+        current = {section: {entry["id"]: entry for entry in context[section]}
+                   for section in self.KEYED}
+        if self.known is None:
+            self.known = current
+            return dict(context, full=True)
+
+        delta = {key: value for key, value in context.items()
+                 if key not in self.KEYED and key != "walls"}
+        delta["full"] = False
+        for section in self.KEYED:
+            old, new = self.known[section], current[section]
+            delta[section] = {
+                "added": [entry for i, entry in new.items() if i not in old],
+                "removed": [i for i in old if i not in new],
+                "moved": [entry for i, entry in new.items() if i in old and old[i] != entry],
+            }
+        self.known = current
+        return delta
+
+
+class ThinkScheduler:
+    """Decides which bots think on each frame and remembers their decisions."""
+
+    def __init__(self, bots: Dict[int, 'BotLoader']):
+        self.frame = 0
+        self.intervals: Dict[int, int] = {}
+        self.phases: Dict[int, int] = {}
+        self.decisions: Dict[int, Tuple] = {}  # Last (action, param) per tank id
+
+        # Spread bots that share an interval evenly over its frames
+        counts: Dict[int, int] = {}
+        for tank_id, bot in sorted(bots.items()):
+            interval = bot.think_interval
+            self.intervals[tank_id] = interval
+            self.phases[tank_id] = counts.get(interval, 0) % interval
+            counts[interval] = counts.get(interval, 0) + 1
+
+    def due(self, tank_id: int) -> bool:
+        """True if this tank's bot decides on the current frame."""
+        interval = self.intervals.get(tank_id, 1)
+        return (self.frame + self.phases.get(tank_id, 0)) % interval == 0
+
+    def remember(self, tank_id: int, decision: Tuple):
+        """
+        Keep a fresh decision to repeat until the bot thinks again. LAG is a
+        one-frame penalty, so the bot idles in between instead.
+        """
+        self.decisions[tank_id] = (None, None) if decision[0] == "LAG" else decision
+
+    def decision(self, tank_id: int) -> Tuple:
+        """Decision to repeat on a frame the bot does not think."""
+        return self.decisions.get(tank_id, (None, None))
+
+    def advance(self):
+        """Move on to the next frame."""
+        self.frame += 1
+
+
+class BotLoader:
+    """Safely loads and executes student bot scripts."""
+
+    def __init__(self, bot_path: str):
+        self.bot_path = bot_path
+        self.bot_name = os.path.basename(bot_path)
+        self.update_func: Optional[Callable] = None
+        self.init_func: Optional[Callable] = None
+        self.has_static = False   # init() succeeded: static keys are not resent
+        self.init_lag = False     # init() overran its budget: LAG on the first frame
+        self.error_message: Optional[str] = None
+        self.error_logged = False  # Prevent spam - log each error once
+        self.delta: Optional[DeltaContext] = None  # Set if the bot opts into deltas
+        self.think_interval = BOT_THINK_INTERVAL   # Frames between decisions
+        self.plan: Optional[Generator] = None       # Running generator update()
+        self.plan_action: Tuple = (None, None)      # Its most recent yielded action
+        self.load_bot()
+
+    def _log_error(self, error_type: str, error: Exception, show_traceback: bool = True):
+        """Print error to terminal with formatting."""
+        if self.error_logged:
+            return  # Don't spam the same error
+
+        import traceback
+        print(f"\n{'='*60}")
+        print(f"🚨 BOT ERROR: {self.bot_name}")
+        print(f"{'='*60}")
+        print(f"Error Type: {error_type}")
+        print(f"Message: {str(error)}")
+        if show_traceback:
+            print(f"\nTraceback:")
+            traceback.print_exc()
+        print(f"{'='*60}\n")
+        self.error_logged = True
+
+    def load_bot(self):
+        """Load the bot module."""
+        try:
+            spec = importlib.util.spec_from_file_location("bot", self.bot_path)
+            if spec and spec.loader:
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+
+                if hasattr(module, 'update'):
+                    self.update_func = module.update
+                    if getattr(module, 'CONTEXT_MODE', "full") == "delta":
+                        self.delta = DeltaContext()
+                    self.think_interval = max(1, int(getattr(module, 'THINK_INTERVAL', BOT_THINK_INTERVAL)))
+                    if callable(getattr(module, 'init', None)):
+                        self.init_func = module.init
+                    print(f"✅ Loaded bot: {self.bot_name}")
+                else:
+                    self.error_message = "Bot missing update() function"
+                    print(f"⚠️  {self.bot_name}: Missing update() function!")
+        except Exception as e:
+            self.error_message = f"Bot load error: {str(e)}"
+            self._log_error("LOAD ERROR", e)
+
+    def initialize(self, static_context: Dict):
+        """Call the bot's optional init() once per match with its larger budget."""
+        if not (self.update_func and self.init_func):
+            return
+
+        try:
+            start_time = time.time()
+            self.init_func(copy.deepcopy(static_context))
+            elapsed_ms = (time.time() - start_time) * 1000
+            self.has_static = True
+            if elapsed_ms > BOT_INIT_TIMEOUT_MS:
+                self.init_lag = True
+                print(f"⚠️  {self.bot_name}: init() took {elapsed_ms:.0f} ms "
+                      f"(budget {BOT_INIT_TIMEOUT_MS} ms) - LAG on first frame")
+        except Exception as e:
+            # The bot keeps running with full per-frame contexts
+            self.error_message = f"Bot init error: {str(e)}"
+            self._log_error("INIT ERROR", e)
+
+    def execute(self, context: Dict) -> Tuple[Optional[str], Optional[any]]:
+        """Execute bot update with timeout and error handling."""
+        if not self.update_func:
+            return None, None
+
+        if self.init_lag:
+            self.init_lag = False
+            return "LAG", None
+
+        # Static data was handed over once through init()
+        if self.has_static:
+            context = {key: value for key, value in context.items() if key not in STATIC_KEYS}
+
+        # Delta bots only get what changed since their last frame
+        if self.delta:
+            context = self.delta.build(context)
+
+        # Pass a DEEP COPY to prevent cheating
+        safe_context = copy.deepcopy(context)
+
+        try:
+            start_time = time.time()
+            if self.plan is not None:
+                result = self._resume_plan(safe_context, start_time)
+            else:
+                result = self.update_func(safe_context)
+                if inspect.isgenerator(result):
+                    self.plan = result
+                    self.plan_action = (None, None)  # Nothing from the last plan
+                    result = self._resume_plan(safe_context, start_time)
+            elapsed_ms = (time.time() - start_time) * 1000
+
+            if elapsed_ms > BOT_TIMEOUT_MS:
+                return "LAG", None
+
+            return parse_action(result)
+
+        except Exception as e:
+            self.plan = None
+            self.error_message = f"Bot error: {str(e)}"
+            self._log_error("RUNTIME ERROR", e)
+            return None, None
+
+    def _resume_plan(self, context: Dict, start_time: float) -> Tuple:
+        """
+        Step the running generator until it yields an action or its time
+        slice is used up. Only the first step of a frame gets the context.
+        """
+        deadline = start_time + BOT_PLAN_SLICE_MS / 1000
+        try:
+            if inspect.getgeneratorstate(self.plan) == inspect.GEN_CREATED:
+                value = next(self.plan)  # It already has this frame's context
+            else:
+                value = self.plan.send(context)
+            while not parse_action(value)[0] and time.time() < deadline:
+                value = next(self.plan)  # Still working (yielded None)
+            if parse_action(value)[0]:
+                self.plan_action = value
+        except StopIteration as done:
+            self.plan = None
+            if parse_action(done.value)[0]:
+                self.plan_action = done.value
+        return self.plan_action
@@ -0,0 +1,126 @@
+"""
+GitWars - Tank Broadphase
+=========================
+Keeps tanks from driving through each other.
+
+SweepAndPrune keeps the live tanks in a list sorted by x between frames.
+Tanks move a few pixels per frame, so the list is almost sorted already
+and an insertion sort fixes it in close to O(n). The sweep then only
+tests tanks whose x extents overlap (a window of about TANK_SIZE), so
+even packed 100-tank Scramble heats avoid the all-pairs check.
+
+Overlapping tanks are pushed apart along the axis of least overlap, half
+each (equal masses). On that axis their closing velocities are replaced
+by the shared average, which conserves momentum and stops the pair from
+sinking back into each other.
+
+Separation never moves a tank into a wall: a push that would overlap a
+wall (checked through the wall grid) is refused and the other tank takes
+the whole push instead. If both are blocked the pair stays overlapping
+until they drive apart.
+"""
+
+from typing import List
+
+import pygame
+
+from config import *
+from gitwars.utils import clamp
+
+
+class SweepAndPrune:
+    """Tank-vs-tank overlap resolution over a persistent x-sorted list."""
+
+    def __init__(self, size: float = TANK_SIZE, wall_grid=None):
+        self.size = size
+        self.wall_grid = wall_grid
+        self._probe = pygame.Rect(0, 0, size, size)  # Reused for wall checks
+        self.order: List = []
+        self.swaps = 0   # Insertion-sort moves last frame (small when coherent)
+        self.pairs = 0   # Overlapping pairs resolved last frame
+
+    def _refresh(self, tanks: List):
+        """Drop dead tanks and add new ones, keeping the previous order."""
+        alive = [t for t in tanks if t.alive]
+        order = [t for t in self.order if t.alive]
+        if len(order) != len(alive):
+            known = {id(t) for t in order}
+            order.extend(t for t in alive if id(t) not in known)
+        self.order = order
+
+    def _sort(self):
+        """Insertion sort by x - cheap on last frame's nearly sorted order."""
+        order = self.order
+        swaps = 0
+        for i in range(1, len(order)):
+            tank = order[i]
+            x = tank.x
+            j = i - 1
+            while j >= 0 and order[j].x > x:
+                order[j + 1] = order[j]
+                j -= 1
+            if j != i - 1:
+                order[j + 1] = tank
+                swaps += i - 1 - j
+        self.swaps = swaps
+
+    def resolve(self, tanks: List) -> int:
+        """Separate every overlapping pair of live tanks. Returns the pair count."""
+        self._refresh(tanks)
+        self._sort()
+
+        size = self.size
+        order = self.order
+        count = len(order)
+        pairs = 0
+        for i in range(count):
+            a = order[i]
+            for j in range(i + 1, count):
+                b = order[j]
+                dx = b.x - a.x
+                if dx >= size:
+                    break  # Sorted by x: nothing further right can touch a
+                dy = b.y - a.y
+                if -size < dy < size:
+                    self._separate(a, b, dx, dy)
+                    pairs += 1
+
+        self.pairs = pairs
+        return pairs
+
+    def _separate(self, a, b, dx: float, dy: float):
+        """Push one overlapping pair apart (b is at or right of a)."""
+        overlap_x = self.size - abs(dx)
+        overlap_y = self.size - abs(dy)
+
+        if overlap_x < overlap_y:
+            push_x, push_y = overlap_x / 2, 0.0
+            if b.velocity.x < a.velocity.x:  # Closing along x
+                a.velocity.x = b.velocity.x = (a.velocity.x + b.velocity.x) / 2
+        else:
+            sign = 1 if dy >= 0 else -1
+            push_x, push_y = 0.0, overlap_y / 2 * sign
+            if (b.velocity.y - a.velocity.y) * sign < 0:  # Closing along y
+                a.velocity.y = b.velocity.y = (a.velocity.y + b.velocity.y) / 2
+
+        # Half each; a tank blocked by a wall hands its half to the other
+        a_moved = self._try_move(a, -push_x, -push_y)
+        b_moved = self._try_move(b, push_x, push_y)
+        if a_moved and not b_moved:
+            self._try_move(a, -push_x, -push_y)
+        elif b_moved and not a_moved:
+            self._try_move(b, push_x, push_y)
+
+    def _try_move(self, tank, dx: float, dy: float) -> bool:
+        """Move a tank unless that would put it inside a wall. Returns success."""
+        x = clamp(tank.pos.x + dx, TANK_SIZE, WORLD_WIDTH - TANK_SIZE)
+        y = clamp(tank.pos.y + dy, TANK_SIZE, WORLD_HEIGHT - TANK_SIZE)
+        if self.wall_grid is not None:
+            probe = self._probe
+            probe.update(x - TANK_SIZE // 2, y - TANK_SIZE // 2, TANK_SIZE, TANK_SIZE)
+            if self.wall_grid.collides(probe):
+                return False
+        tank.x = tank.pos.x = x
+        tank.y = tank.pos.y = y
+        tank.sync_rect()
+        return True
@@ -0,0 +1,328 @@
+"""
+GitWars - Cosmetic Effect State
+===============================
+Camera (follow, zoom, screen shake), particles, bullet trails and the
+quality governor.
+
+These are pure state containers updated by the engine; drawing lives in
+gitwars.render. Nothing here affects the simulation outcome: effects draw
+from their own RNG, so spawning fewer particles never shifts the random
+sequence the simulation uses.
+"""
+
+import math
+import random
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from config import *
+from gitwars.utils import clamp
+
+_rng = random.Random()  # Cosmetic randomness only
+
+# =============================================================================
+# QUALITY GOVERNOR
+# =============================================================================
+
+class EffectQuality:
+    """Current cosmetic quality settings (read by effects and the renderer)."""
+
+    # (trail length, particle scale, glows, juggernaut spin) per level
+    LEVELS = [
+        (BULLET_TRAIL_LENGTH, 1.0, True, True),          # 0: full
+        (BULLET_TRAIL_LENGTH // 2, 0.5, True, True),     # 1: shorter trails, half particles
+        (BULLET_TRAIL_LENGTH // 4, 0.25, False, True),   # 2: no glows
+        (0, 0.0, False, False),                          # 3: no trails/particles/spin
+    ]
+
+    def __init__(self):
+        self.set_level(0)
+
+    def set_level(self, level: int):
+        """Apply one of the LEVELS presets."""
+        self.level = level
+        self.trail_length, self.particle_scale, self.glows, self.spin = self.LEVELS[level]
+
+
+quality = EffectQuality()
+
+
+class QualityGovernor:
+    """
+    Watches a rolling average of frame work time and steps the shared
+    EffectQuality down when over budget, and back up once it recovers.
+    """
+
+    def __init__(self, budget_ms: float = QUALITY_FRAME_BUDGET_MS,
+                 window: int = QUALITY_WINDOW, hold_frames: int = QUALITY_HOLD_FRAMES):
+        self.budget_ms = budget_ms
+        self.recover_ms = budget_ms * QUALITY_RECOVER_RATIO
+        self.samples = deque(maxlen=window)
+        self.hold_frames = hold_frames
+        self.frames_since_change = 0
+
+    @property
+    def average_ms(self) -> float:
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def record(self, frame_ms: float):
+        """Record one frame's work time and adjust quality if needed."""
+        self.samples.append(frame_ms)
+        self.frames_since_change += 1
+        if len(self.samples) < self.samples.maxlen or self.frames_since_change < self.hold_frames:
+            return
+
+        average = self.average_ms
+        level = quality.level
+        if average > self.budget_ms and level < len(EffectQuality.LEVELS) - 1:
+            quality.set_level(level + 1)
+        elif average < self.recover_ms and level > 0:
+            quality.set_level(level - 1)
+        else:
+            return
+
+        # Let the new level settle before judging it
+        self.samples.clear()
+        self.frames_since_change = 0
+
+# =============================================================================
+# CAMERA (Follow, Zoom, Screen Shake)
+# =============================================================================
+
+class Camera:
+    """
+    Viewport onto the arena plus screen shake.
+
+    follow() eases the view towards every live tank (or one selected tank)
+    and picks a zoom that fits them, clamped to CAMERA_MIN_ZOOM..MAX_ZOOM and
+    never wider than the whole arena. apply() maps world positions into the
+    unzoomed view (the renderer scales it to the window when zoom != 1).
+    """
+
+    def __init__(self, view_width: int = SCREEN_WIDTH, view_height: int = SCREEN_HEIGHT):
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.shake_intensity = 0.0
+        self.shake_timer = 0.0
+
+        self.view_width = view_width
+        self.view_height = view_height
+        self.follow_id = None    # Tank to follow, or None for the whole fight
+        self.zoom_scale = 1.0    # Manual zoom on top of the automatic one (+/- keys)
+
+        # Zoom at which the whole arena fits the window
+        fit = min(view_width / WORLD_WIDTH, view_height / WORLD_HEIGHT)
+        self.min_zoom = max(CAMERA_MIN_ZOOM, min(fit, CAMERA_MAX_ZOOM))
+        self.zoom = self.min_zoom
+        self.center_x = WORLD_WIDTH / 2
+        self.center_y = WORLD_HEIGHT / 2
+        self.left = 0.0
+        self.top = 0.0
+        self._update_view()
+
+    def shake(self, intensity: float = SHAKE_INTENSITY, duration: float = SHAKE_DURATION):
+        """Trigger screen shake."""
+        self.shake_intensity = max(self.shake_intensity, intensity)
+        self.shake_timer = max(self.shake_timer, duration)
+
+    def update(self, dt: float):
+        """Update camera shake."""
+        if self.shake_timer > 0:
+            self.shake_timer -= dt
+            self.offset_x = _rng.uniform(-self.shake_intensity, self.shake_intensity)
+            self.offset_y = _rng.uniform(-self.shake_intensity, self.shake_intensity)
+            self.shake_intensity *= SHAKE_DECAY
+        else:
+            self.offset_x = 0
+            self.offset_y = 0
+            self.shake_intensity = 0
+
+    @property
+    def world_width(self) -> float:
+        """Width of the visible part of the arena (world pixels)."""
+        return self.view_width / self.zoom
+
+    @property
+    def world_height(self) -> float:
+        """Height of the visible part of the arena (world pixels)."""
+        return self.view_height / self.zoom
+
+    def cycle_follow(self, tanks: List, step: int = 1):
+        """Follow the next live tank; wraps back to the whole-fight view."""
+        ids = [None] + [t.id for t in tanks if t.alive]
+        index = ids.index(self.follow_id) if self.follow_id in ids else 0
+        self.follow_id = ids[(index + step) % len(ids)]
+
+    def adjust_zoom(self, factor: float):
+        """Scale the manual zoom (clamped by follow())."""
+        self.zoom_scale = clamp(self.zoom_scale * factor, CAMERA_MIN_ZOOM, 1 / CAMERA_MIN_ZOOM)
+
+    def follow(self, tanks: List):
+        """Ease the view towards its target (call once per drawn frame)."""
+        alive = [t for t in tanks if t.alive]
+        target = next((t for t in alive if t.id == self.follow_id), None)
+
+        if target is not None:
+            center_x, center_y, zoom = target.x, target.y, CAMERA_FOLLOW_ZOOM
+        elif alive:
+            x0 = min(t.x for t in alive) - CAMERA_PADDING
+            x1 = max(t.x for t in alive) + CAMERA_PADDING
+            y0 = min(t.y for t in alive) - CAMERA_PADDING
+            y1 = max(t.y for t in alive) + CAMERA_PADDING
+            center_x, center_y = (x0 + x1) / 2, (y0 + y1) / 2
+            zoom = min(self.view_width / (x1 - x0), self.view_height / (y1 - y0))
+        else:
+            center_x, center_y, zoom = WORLD_WIDTH / 2, WORLD_HEIGHT / 2, self.min_zoom
+
+        zoom = clamp(zoom * self.zoom_scale, self.min_zoom, CAMERA_MAX_ZOOM)
+        self.zoom += (zoom - self.zoom) * CAMERA_SMOOTHING
+        if abs(self.zoom - zoom) < 1e-3:
+            self.zoom = zoom  # Settle exactly (zoom 1.0 skips scaling)
+        self.center_x += (center_x - self.center_x) * CAMERA_SMOOTHING
+        self.center_y += (center_y - self.center_y) * CAMERA_SMOOTHING
+        self._update_view()
+
+    def _update_view(self):
+        """Keep the view inside the arena (centered if the arena is smaller)."""
+        half_w, half_h = self.world_width / 2, self.world_height / 2
+        if half_w * 2 >= WORLD_WIDTH:
+            self.center_x = WORLD_WIDTH / 2
+        else:
+            self.center_x = clamp(self.center_x, half_w, WORLD_WIDTH - half_w)
+        if half_h * 2 >= WORLD_HEIGHT:
+            self.center_y = WORLD_HEIGHT / 2
+        else:
+            self.center_y = clamp(self.center_y, half_h, WORLD_HEIGHT - half_h)
+        self.left = self.center_x - half_w
+        self.top = self.center_y - half_h
+
+    def apply(self, pos: Tuple[float, float]) -> Tuple[int, int]:
+        """World position -> view position (camera scroll plus shake)."""
+        return (int(pos[0] - self.left + self.offset_x), int(pos[1] - self.top + self.offset_y))
+
+    def sees(self, x: float, y: float, margin: float = 0) -> bool:
+        """True if a point (grown by margin) is inside the view."""
+        return (self.left - margin <= x <= self.left + self.world_width + margin and
+                self.top - margin <= y <= self.top + self.world_height + margin)
+
+    def sees_rect(self, x: float, y: float, width: float, height: float) -> bool:
+        """True if a world rectangle overlaps the view."""
+        return (x < self.left + self.world_width and x + width > self.left and
+                y < self.top + self.world_height and y + height > self.top)
+
+# =============================================================================
+# PARTICLE SYSTEM
+# =============================================================================
+
+@dataclass(slots=True)
+class Particle:
+    """A single particle with physics."""
+    x: float
+    y: float
+    vx: float
+    vy: float
+    color: Tuple[int, int, int]
+    size: float
+    alpha: int = 255
+    alive: bool = True
+
+    def update(self):
+        """Update particle position and fade."""
+        self.x += self.vx
+        self.y += self.vy
+        self.vx *= PARTICLE_FRICTION
+        self.vy *= PARTICLE_FRICTION
+        self.alpha -= PARTICLE_FADE_SPEED
+        self.size *= 0.98
+
+        if self.alpha <= 0 or self.size < 1:
+            self.alive = False
+
+
+class ParticleSystem:
+    """Manages all particles in the game."""
+
+    def __init__(self):
+        self.particles: List[Particle] = []
+        self.max_particles = 200  # Cap max particles
+
+    def spawn_explosion(self, x: float, y: float, color: Tuple[int, int, int], count: int = PARTICLE_DEATH_COUNT):
+        """Spawn an explosion of particles."""
+        # Limit particles to prevent lag (and thin them under load)
+        count = min(int(count * quality.particle_scale), self._capacity())
+
+        for _ in range(count):
+            angle = _rng.uniform(0, 2 * math.pi)
+            speed = _rng.uniform(2, PARTICLE_DEATH_SPEED)
+            size = _rng.uniform(*PARTICLE_SIZE_RANGE)
+
+            # Vary the color slightly
+            r = clamp(color[0] + _rng.randint(-30, 30), 0, 255)
+            g = clamp(color[1] + _rng.randint(-30, 30), 0, 255)
+            b = clamp(color[2] + _rng.randint(-30, 30), 0, 255)
+
+            self.particles.append(Particle(
+                x=x,
+                y=y,
+                vx=math.cos(angle) * speed,
+                vy=math.sin(angle) * speed,
+                color=(int(r), int(g), int(b)),
+                size=size
+            ))
+
+    def spawn_muzzle_flash(self, x: float, y: float, angle: float, color: Tuple[int, int, int]):
+        """Spawn muzzle flash particles."""
+        # Limit particles
+        count = min(round(3 * quality.particle_scale), self._capacity())  # Reduced from 5
+
+        for _ in range(count):
+            spread = _rng.uniform(-0.3, 0.3)
+            speed = _rng.uniform(3, 6)
+
+            self.particles.append(Particle(
+                x=x,
+                y=y,
+                vx=math.cos(math.radians(angle) + spread) * speed,
+                vy=math.sin(math.radians(angle) + spread) * speed,
+                color=color,
+                size=_rng.uniform(3, 6),
+                alpha=200
+            ))
+
+    def _capacity(self) -> int:
+        """Free particle slots (the cap shrinks with quality)."""
+        return max(0, int(self.max_particles * quality.particle_scale) - len(self.particles))
+
+    def update(self):
+        """Update all particles."""
+        for particle in self.particles:
+            particle.update()
+
+        # Remove dead particles
+        self.particles = [p for p in self.particles if p.alive]
+
+# =============================================================================
+# BULLET TRAIL
+# =============================================================================
+
+class Trail:
+    """Fading trail effect for bullets (recent positions)."""
+
+    __slots__ = ("positions", "color", "max_length")
+
+    def __init__(self, color: Tuple[int, int, int]):
+        self.positions: List[Tuple[float, float]] = []
+        self.color = color
+        self.max_length = BULLET_TRAIL_LENGTH
+
+    def add_point(self, x: float, y: float):
+        """Add a new point to the trail (shortened under load)."""
+        limit = min(self.max_length, quality.trail_length)
+        if limit <= 0:
+            if self.positions:
+                self.positions.clear()
+            return
+        self.positions.append((x, y))
+        while len(self.positions) > limit:
+            self.positions.pop(0)
@@ -0,0 +1,759 @@
+"""
+GitWars - Simulation Engine
+===========================
+Runs a match: spawns tanks and bots, steps physics, bullets, hazards and
+scoring. Has no display or audio dependencies; gitwars.render draws it and
+gitwars.sounds forwards its sound requests only when audio is enabled.
+
+Usage (headless):
+    engine = GitWarsEngine(game_mode=2)
+    while not engine.game_over:
+        engine.update(1 / FPS)
+"""
+
+import glob
+import math
+import os
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from config import *
+from gitwars.bots import BotLoader, ThinkScheduler
+from gitwars.broadphase import SweepAndPrune
+from gitwars.distance_field import DistanceField
+from gitwars.effects import Camera, ParticleSystem
+from gitwars.entities import Bullet, Coin, Tank, Wall, reset_entity_ids
+from gitwars.hazards import DangerZone, Juggernaut, Zone, evaluate_hazards
+from gitwars.maze import load_maze_layout
+from gitwars.navigation import FlowFieldManager
+from gitwars.replay import ReplayWriter
+from gitwars.snapshot import capture
+from gitwars.sounds import (
+    play_sound, play_critical_sound, play_music, stop_music,
+    SFX_COIN, SFX_DEATH, SFX_READY, SFX_SHOOT, SFX_WIN_1, SFX_WIN_2, SFX_WIN_3,
+)
+from gitwars.utils import angle_to, distance
+from gitwars.wall_grid import WallGrid
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class GitWarsEngine:
+    """Main game engine (simulation only)."""
+
+    def __init__(self, game_mode: int = GAME_MODE, bot_paths: Optional[List[str]] = None,
+                 record_replays: bool = REPLAY_RECORD_ENABLED, spectator_server=None):
+        # Explicit bot files (one tank each) instead of scanning bots/
+        self.bot_paths = list(bot_paths) if bot_paths is not None else None
+        self.camera = Camera()
+        self.particles = ParticleSystem()
+
+        self.tanks: List[Tank] = []
+        self.bullets: List[Bullet] = []
+        self.coins: List[Coin] = []
+        self.walls: List[Wall] = []
+        self.bots: Dict[int, BotLoader] = {}
+        self.scheduler = ThinkScheduler(self.bots)  # Rebuilt per match
+
+        self.zone = Zone()
+        self.juggernaut = None  # Spawned in Mode 3
+        self.maze_seed = None  # Seed of the current Labyrinth layout
+
+        # Line of sight between alive tanks, rebuilt once per frame
+        self.visible_pairs = set()  # {(id_a, id_b), ...} stored both ways
+        self.threats: Dict[int, List[Dict]] = {}  # Incoming bullets per tank id
+        self.frame_sensors: Dict[int, Tuple] = {}  # (pose, sensor readings) handed to bots this frame
+
+        # Danger Zones (Orbital Strikes - Mode 2)
+        self.danger_zones: List[DangerZone] = []
+        self.danger_zone_timer = 0.0
+
+        # Shared-memory world state for out-of-process bots (imported lazily)
+        self.state_publisher = None
+        if SHARED_STATE_ENABLED:
+            from gitwars.shared_state import WorldStatePublisher
+            self.state_publisher = WorldStatePublisher()
+
+        # Match recording (a new file per match, see start_replay)
+        self.replay_writer = None
+        self.record_replays = record_replays
+
+        # Live spectator stream for remote viewers (imported lazily). A host
+        # that owns its own server (server.py) passes it in instead.
+        self.spectator_server = spectator_server
+        if spectator_server is None and SPECTATOR_STREAM_ENABLED:
+            from gitwars.spectate import SpectatorServer
+            self.spectator_server = SpectatorServer()
+
+        self.game_mode = game_mode
+        self.game_timer = 0.0
+        self.coin_spawn_timer = 0.0
+        self.game_over = False
+        self.winner_text = ""
+
+        # Kill feed for Level 2 death messages
+        self.kill_feed = []  # List of {"text": str, "timer": float, "alpha": int}
+
+        # Initialize game
+        self.setup_game()
+
+    def setup_game(self):
+        """Set up game based on current mode."""
+        self.tanks.clear()
+        self.bullets.clear()
+        self.coins.clear()
+        self.walls.clear()
+        self.bots.clear()
+        self.particles.particles.clear()  # Clear particles too
+        reset_entity_ids()
+        self.last_top5 = []  # Track top 5 ranking for coin sound on rank change
+
+        # Spawn tanks in circle
+        num_tanks = BOT_DEFAULT_COUNT if self.game_mode != 3 else 2
+        center_x, center_y = WORLD_WIDTH // 2, WORLD_HEIGHT // 2
+        radius = min(WORLD_WIDTH, WORLD_HEIGHT) // 3
+
+        # Scan bots folder for all bot_*.py files (or use the given ones)
+        bots_dir = os.path.join(ROOT_DIR, "bots")
+        if self.bot_paths is not None:
+            bot_files = self.bot_paths
+            num_tanks = len(bot_files)
+        else:
+            bot_files = sorted(glob.glob(os.path.join(bots_dir, "bot_*.py")))
+
+        # Extract team names from filenames (bot_teamname.py -> teamname)
+        bot_info = []
+        for bot_file in bot_files:
+            team_name = os.path.splitext(os.path.basename(bot_file))[0]
+            if team_name.startswith("bot_"):
+                team_name = team_name[4:]  # Remove "bot_" prefix
+            bot_info.append((bot_file, team_name))
+
+        # Fallback to my_bot.py if not enough bots
+        default_bot_path = os.path.join(bots_dir, "my_bot.py")
+
+        for i in range(num_tanks):
+            angle = (2 * math.pi * i) / num_tanks
+            x = center_x + math.cos(angle) * radius
+            y = center_y + math.sin(angle) * radius
+            color = TANK_COLORS[i % len(TANK_COLORS)]
+
+            tank = Tank(i, x, y, color)
+            tank.angle = math.degrees(math.atan2(center_y - y, center_x - x))
+
+            # Apply Level 3 health multiplier
+            if self.game_mode == 3:
+                new_health = int(TANK_MAX_HEALTH * LEVEL3_HEALTH_MULTIPLIER)
+                tank.health = new_health
+                tank.max_health = new_health
+
+            # Load bot and assign team name
+            if i < len(bot_info):
+                bot_path, team_name = bot_info[i]
+                tank.team_name = team_name
+                self.bots[i] = BotLoader(bot_path)
+            elif os.path.exists(default_bot_path):
+                tank.team_name = f"Bot_{i}"
+                self.bots[i] = BotLoader(default_bot_path)
+
+            self.tanks.append(tank)
+
+        # Staggered bot think rates
+        self.scheduler = ThinkScheduler(self.bots)
+
+        # Mode-specific setup
+        if self.game_mode == 2:
+            self.generate_maze()
+            self.zone = Zone()  # Reset zone
+
+        # Shared flow fields, wall distance field, wall grid and wall context
+        # (walls are static for the rest of the match)
+        self.wall_context = [wall.get_context() for wall in self.walls]
+        self.navigation = FlowFieldManager(self.walls)
+        self.distance_field = DistanceField(self.walls)
+        self.wall_grid = WallGrid(self.walls)
+        self.tank_broadphase = SweepAndPrune(wall_grid=self.wall_grid)
+
+        # Spawn ring points can land on a generated wall - move those tanks
+        for tank in self.tanks:
+            x, y = self.clear_spawn(tank.x, tank.y)
+            if (x, y) != (tank.x, tank.y):
+                tank.x = tank.pos.x = x
+                tank.y = tank.pos.y = y
+                tank.sync_rect()
+                tank.angle = math.degrees(math.atan2(center_y - y, center_x - x))
+
+        # One-time bot setup now that the arena is final
+        for tank_id, bot in self.bots.items():
+            bot.initialize(self.build_static_context(tank_id))
+
+        # Reset timers
+        if self.game_mode == 1:
+            self.game_timer = SCRAMBLE_DURATION
+        elif self.game_mode == 2:
+            self.danger_zones = []  # Reset danger zones
+            self.danger_zone_timer = 0.0
+        elif self.game_mode == 3:
+            self.juggernaut = Juggernaut(
+                WORLD_WIDTH // 2,
+                WORLD_HEIGHT // 2,
+                self.particles
+            )
+
+        # Start recording this match
+        if self.record_replays:
+            self.start_replay()
+
+        # Play Level-Specific BGM (falls back to generic "bgm.mp3").
+        # Keeps streaming if the same track is already playing.
+        play_music(f"bgm{self.game_mode}.mp3", "bgm.mp3")
+
+        # Play Start Sound (on reserved channel so it won't get cut off)
+        play_critical_sound(SFX_READY, VOL_READY)
+
+    def generate_maze(self):
+        """Generate walls for labyrinth mode."""
+        if MAZE_PROCEDURAL:
+            # Seeded maze (cached on disk per seed + arena size)
+            self.maze_seed = MAZE_SEED if MAZE_SEED is not None else random.randrange(2 ** 31)
+            for x, y, w, h in load_maze_layout(self.maze_seed):
+                self.walls.append(Wall(x, y, w, h))
+            return
+
+        # Classic simple symmetrical maze
+        self.maze_seed = None
+        wall_positions = [
+            (200, 150, 20, 200),
+            (WORLD_WIDTH - 220, 150, 20, 200),
+            (200, WORLD_HEIGHT - 350, 20, 200),
+            (WORLD_WIDTH - 220, WORLD_HEIGHT - 350, 20, 200),
+            (400, 300, 200, 20),
+            (WORLD_WIDTH - 600, 300, 200, 20),
+            (400, WORLD_HEIGHT - 320, 200, 20),
+            (WORLD_WIDTH - 600, WORLD_HEIGHT - 320, 200, 20),
+            (WORLD_WIDTH // 2 - 10, 100, 20, 150),
+            (WORLD_WIDTH // 2 - 10, WORLD_HEIGHT - 250, 20, 150),
+        ]
+
+        for x, y, w, h in wall_positions:
+            self.walls.append(Wall(x, y, w, h))
+
+    def clear_spawn(self, x: float, y: float):
+        """
+        Nearest point to (x, y) where a tank fits without touching a wall:
+        (x, y) itself if it is clear, else the first clear point on rings
+        of growing radius around it.
+        """
+        need = TANK_SIZE * 0.75  # Beyond the tank's half-diagonal
+        field = self.distance_field
+        if field.clearance(x, y) >= need:
+            return x, y
+
+        step = GRID_CELL_SIZE / 4
+        for ring in range(1, 41):
+            r = ring * step
+            count = 8 * ring
+            for k in range(count):
+                a = 2 * math.pi * k / count
+                cx, cy = x + math.cos(a) * r, y + math.sin(a) * r
+                if (TANK_SIZE <= cx <= WORLD_WIDTH - TANK_SIZE and
+                        TANK_SIZE <= cy <= WORLD_HEIGHT - TANK_SIZE and
+                        field.clearance(cx, cy) >= need):
+                    return cx, cy
+        return x, y  # Nowhere clear nearby - the wall push-out will handle it
+
+    def spawn_coin(self):
+        """Spawn a new coin at random position."""
+        if len(self.coins) >= SCRAMBLE_MAX_COINS:
+            return
+
+        # Avoid spawning on tanks
+        for _ in range(10):
+            x = random.randint(50, WORLD_WIDTH - 50)
+            y = random.randint(50, WORLD_HEIGHT - 50)
+
+            valid = True
+            for tank in self.tanks:
+                if distance(x, y, tank.x, tank.y) < TANK_SIZE * 2:
+                    valid = False
+                    break
+
+            if valid:
+                self.coins.append(Coin(x, y))
+                break
+
+    def spawn_danger_zone(self):
+        """Spawn a new danger zone (Orbital Strike) at random position."""
+        # Ensure zone is fully inside the arena
+        margin = DANGER_ZONE_RADIUS + 50
+        x = random.randint(margin, WORLD_WIDTH - margin)
+        y = random.randint(margin, WORLD_HEIGHT - margin)
+
+        self.danger_zones.append(DangerZone(x, y, self.particles))
+
+    def build_static_context(self, tank_id: int) -> Dict:
+        """Data that never changes during a match (passed once to a bot's init())."""
+        return {
+            "walls": self.wall_context,
+            "arena": {"width": WORLD_WIDTH, "height": WORLD_HEIGHT},
+            "game_mode": self.game_mode,
+            "my_id": tank_id,
+        }
+
+    def build_context(self, tank: Tank) -> Dict:
+        """Build the context dictionary for a tank's bot."""
+        enemies = []
+        for other in self.tanks:
+            if other.id != tank.id and other.alive:
+                enemies.append({
+                    "x": other.x,
+                    "y": other.y,
+                    "id": other.id,
+                    "visible": (tank.id, other.id) in self.visible_pairs  # No wall in between
+                })
+
+        coin_data = []
+        if self.game_mode == 1:
+            for coin in self.coins:
+                if not coin.collected:
+                    coin_data.append({"id": coin.id, "x": coin.x, "y": coin.y})
+
+        bullet_data = []
+        for bullet in self.bullets:
+            if bullet.owner_id != tank.id:
+                bullet_data.append({
+                    "id": bullet.id,
+                    "x": bullet.x,
+                    "y": bullet.y,
+                    "vx": bullet.vx,
+                    "vy": bullet.vy
+                })
+
+        # Get sensor readings for obstacle avoidance (sphere-traced)
+        sensor_readings = self.distance_field.sensor_readings(tank.x, tank.y, tank.angle)
+        self.frame_sensors[tank.id] = ((tank.x, tank.y, tank.angle), sensor_readings)
+
+        return {
+            "me": tank.get_context(),
+            "enemies": enemies,
+            "coins": coin_data,
+            "walls": self.wall_context,  # Static - built once per match
+            "bullets": bullet_data,
+            "threats": self.threats.get(tank.id, []),  # Incoming bullets, soonest first
+            "sensors": sensor_readings,  # NEW: Raycast sensors for wall detection
+            "clearance": round(self.distance_field.clearance(tank.x, tank.y), 1),  # Free space to nearest wall
+            "navigation": self.navigation.context_for(tank),  # Shared flow fields
+            "juggernaut": self.juggernaut.get_context_data() if self.juggernaut and self.game_mode == 3 else None,
+            "game_mode": self.game_mode,
+            "time_left": self.game_timer
+        }
+
+    def process_bot_action(self, tank: Tank, action: str, param: any):
+        """Process a bot's action."""
+        if action == "MOVE" and param:
+            try:
+                dx, dy = param
+                tank.move(float(dx), float(dy))
+            except:
+                pass
+
+        elif action == "SHOOT" and param is not None:
+            try:
+                angle = float(param)
+                bullet = tank.shoot(angle)
+                if bullet:
+                    self.bullets.append(bullet)
+                    self.particles.spawn_muzzle_flash(bullet.x, bullet.y, angle, tank.color)
+                    self.particles.spawn_muzzle_flash(bullet.x, bullet.y, angle, tank.color)
+                    play_sound(SFX_SHOOT, VOL_SHOOT)  # Shoot SFX
+            except:
+                pass
+
+        elif action == "STOP":
+            tank.velocity.x = 0
+            tank.velocity.y = 0
+
+        elif action == "MOVE_AND_SHOOT" and param is not None:
+            # Strafing: Move AND shoot in the same frame!
+            try:
+                move_dir, shoot_angle = param
+
+                # Apply movement
+                if move_dir:
+                    dx, dy = move_dir
+                    tank.move(float(dx), float(dy))
+
+                # Fire bullet
+                if shoot_angle is not None:
+                    bullet = tank.shoot(float(shoot_angle))
+                    if bullet:
+                        self.bullets.append(bullet)
+                        self.particles.spawn_muzzle_flash(bullet.x, bullet.y, float(shoot_angle), tank.color)
+                        self.particles.spawn_muzzle_flash(bullet.x, bullet.y, float(shoot_angle), tank.color)
+                        play_sound(SFX_SHOOT, VOL_SHOOT)
+            except:
+                pass
+
+    def update(self, dt: float):
+        """Update game state."""
+        if self.game_over:
+            # Keep serving the final frame to viewers that join late
+            if self.spectator_server:
+                self.spectator_server.publish(self)
+            return
+
+        # Update camera
+        self.camera.update(dt)
+
+        # Update particles
+        self.particles.update()
+
+        # Update kill feed timers (fade out over time)
+        if self.game_mode == 2:
+            for msg in self.kill_feed:
+                msg["timer"] -= dt
+                # Fade alpha as timer approaches 0
+                if msg["timer"] < 1.0:
+                    msg["alpha"] = int(255 * msg["timer"])
+            # Remove expired messages
+            self.kill_feed = [m for m in self.kill_feed if m["timer"] > 0]
+
+        # =====================================================================
+        # PHYSICS LOOP REORDERING (Bullets/Collisions FIRST, then Tanks)
+        # =====================================================================
+
+        # 1. Update Bullets & Resolve Collisions (Apply Forces)
+        for bullet in self.bullets:
+            bullet.update()
+
+            # Wall collision
+            bullet_rect = bullet.get_rect()
+            if self.wall_grid.collides(bullet_rect):
+                bullet.alive = False
+
+            # Tank collision
+            for tank in self.tanks:
+                if tank.alive and tank.id != bullet.owner_id:
+                    if bullet_rect.colliderect(tank.get_rect()):
+                        bullet.alive = False
+
+                        if self.game_mode == 1:
+                            # Knockback only
+                            angle = angle_to(bullet.x, bullet.y, tank.x, tank.y)
+                            tank.apply_knockback(angle, SCRAMBLE_KNOCKBACK)
+                        else:
+                            # Damage
+                            tank.take_damage(bullet.damage)
+                            if not tank.alive:
+                                self.on_tank_death(tank)
+                        break
+
+        # Remove dead bullets
+        self.bullets = [b for b in self.bullets if b.alive]
+
+        # 2. Execute Bot Logic (Apply Input Forces BEFORE physics update)
+        # OPTIMIZED: Bots only think on their scheduled frames (no context
+        # is built otherwise) and repeat their last decision in between.
+        # The shared per-frame analysis is only done for the bots that think.
+        scheduler = self.scheduler
+        thinking = [tank for tank in self.tanks
+                    if tank.alive and tank.id in self.bots and scheduler.due(tank.id)]
+        if thinking:
+            self.navigation.update(self)
+            self.update_visibility(thinking)
+            self.update_threats(thinking)
+        self.frame_sensors = {}
+        for tank in self.tanks:
+            if tank.alive and tank.id in self.bots:
+                if scheduler.due(tank.id):
+                    context = self.build_context(tank)
+                    action, param = self.bots[tank.id].execute(context)
+                    scheduler.remember(tank.id, (action, param))
+                else:
+                    action, param = scheduler.decision(tank.id)
+                tank.last_action = action
+                if action and action != "LAG":
+                    self.process_bot_action(tank, action, param)
+        scheduler.advance()
+
+        # 3. Update Tanks (Integrate Physics - AFTER all forces applied)
+        for tank in self.tanks:
+            if tank.alive:
+                tank.update(dt, self.walls, self.distance_field, self.wall_grid)
+        if TANK_COLLISIONS:
+            self.tank_broadphase.resolve(self.tanks)
+
+        # Update timers
+        if self.game_mode == 1:
+            self.game_timer -= dt
+            self.coin_spawn_timer += dt
+
+            if self.coin_spawn_timer >= SCRAMBLE_COIN_SPAWN_INTERVAL:
+                self.coin_spawn_timer = 0
+                self.spawn_coin()
+
+            if self.game_timer <= 0:
+                self.end_scramble()
+
+        elif self.game_mode == 2:
+            self.zone.update(dt)
+
+            # Danger Zone spawning (Orbital Strikes)
+            self.danger_zone_timer += dt
+            if self.danger_zone_timer >= DANGER_ZONE_SPAWN_INTERVAL:
+                self.danger_zone_timer = 0.0
+                self.spawn_danger_zone()
+
+            # Update danger zones
+            self.danger_zones = [dz for dz in self.danger_zones if dz.update(dt)]
+
+            # Zone + active danger zones in one pass
+            self.apply_hazards(dt, zone=self.zone, danger_zones=self.danger_zones)
+
+            alive_count = sum(1 for t in self.tanks if t.alive)
+            if alive_count <= LABYRINTH_FINAL_SURVIVORS:
+                self.end_labyrinth()
+
+        elif self.game_mode == 3:
+            # Update Juggernaut (movement, AI, weapon)
+            if self.juggernaut:
+                self.juggernaut.update(dt, self.tanks, self.bullets)
+
+                # Apply melee damage to ALL tanks touching Juggernaut
+                self.apply_hazards(dt, juggernaut=self.juggernaut)
+
+        # (Bullets updated earlier)
+
+        # Coin collection (Mode 1)
+        if self.game_mode == 1:
+            for coin in self.coins:
+                if coin.collected:
+                    continue
+                coin.update(dt)
+
+                for tank in self.tanks:
+                    if tank.alive and coin.get_rect().colliderect(tank.get_rect()):
+                        coin.collected = True
+                        tank.coins += COIN_VALUE
+                        break
+
+            self.coins = [c for c in self.coins if not c.collected]
+
+            # Check if top 5 ranking changed - play coin sound only on rank change
+            sorted_tanks = sorted(self.tanks, key=lambda t: t.coins, reverse=True)
+            current_top5 = [t.id for t in sorted_tanks[:5]]
+            if current_top5 != self.last_top5:
+                play_sound(SFX_COIN, VOL_COIN)  # Ranking changed!
+                self.last_top5 = current_top5
+
+        # Check game end (Mode 3)
+        if self.game_mode == 3:
+            alive_tanks = [t for t in self.tanks if t.alive]
+            if len(alive_tanks) <= 1:
+                self.end_duel(alive_tanks[0] if alive_tanks else None)
+
+        # Publish world state for bot worker processes
+        if self.state_publisher:
+            self.publish_world_state()
+
+        # Stream this frame to spectators
+        if self.spectator_server:
+            self.spectator_server.publish(self)
+
+        # Record this frame (the recording is finalized once the match ends)
+        if self.replay_writer:
+            self.replay_writer.add_frame(capture(self))
+            if self.game_over:
+                self.stop_replay()
+
+    def apply_hazards(self, dt: float, **hazards):
+        """Evaluate hazards against all tanks at once, then apply the results."""
+        results = evaluate_hazards(self.tanks, dt, **hazards)
+        for tank, (damage, knock_x, knock_y) in zip(self.tanks, results):
+            if damage <= 0:
+                continue
+            tank.take_damage(damage)
+            if knock_x or knock_y:
+                tank.apply_knockback(math.degrees(math.atan2(knock_y, knock_x)),
+                                     math.hypot(knock_x, knock_y))
+            if not tank.alive:
+                self.on_tank_death(tank)
+
+    def update_visibility(self, viewers: Optional[List[Tank]] = None):
+        """
+        OPTIMIZED: Line-of-sight matrix for all alive tanks, computed once
+        per frame (each pair traced once) instead of by every bot.
+
+        With viewers given, only pairs involving one of them are traced
+        (the tanks whose bots build a context this frame).
+        """
+        alive = [t for t in self.tanks if t.alive]
+        if viewers is None:
+            viewers = alive
+        viewer_ids = {t.id for t in viewers}
+        visible = set()
+        for i, a in enumerate(alive):
+            for b in alive[i + 1:]:
+                if a.id not in viewer_ids and b.id not in viewer_ids:
+                    continue
+                if self.wall_grid.line_of_sight(a.x, a.y, b.x, b.y):
+                    visible.add((a.id, b.id))
+                    visible.add((b.id, a.id))
+        self.visible_pairs = visible
+
+    def update_threats(self, targets: Optional[List[Tank]] = None):
+        """
+        OPTIMIZED: Closest approach of every bullet to every tank, once per
+        frame, so bots don't each loop over the bullet list. With targets
+        given, only those tanks are checked.
+
+        Motion is relative (bullet velocity minus tank velocity), assumed
+        constant. A threat is a bullet that is still approaching and reaches
+        its closest point within THREAT_HORIZON seconds.
+        """
+        threats = {}
+        horizon = THREAT_HORIZON * FPS  # Bullets move per frame
+        if targets is None:
+            targets = self.tanks
+        tanks = [(t.id, t.x, t.y, t.velocity.x / FPS, t.velocity.y / FPS)
+                 for t in targets if t.alive]
+        for tank_id, *_ in tanks:
+            threats[tank_id] = []
+
+        for bullet in self.bullets:
+            bx, by, bvx, bvy = bullet.x, bullet.y, bullet.vx, bullet.vy
+            owner = bullet.owner_id
+            for tank_id, tx, ty, tvx, tvy in tanks:
+                if tank_id == owner:
+                    continue
+                # Bullet position/velocity relative to the tank
+                px, py = bx - tx, by - ty
+                vx, vy = bvx - tvx, bvy - tvy
+                closing = -(px * vx + py * vy)
+                if closing <= 0:
+                    continue  # Moving away
+                speed2 = vx * vx + vy * vy
+                frames = closing / speed2
+                if frames > horizon:
+                    continue
+                miss = math.hypot(px + vx * frames, py + vy * frames)
+                threats[tank_id].append({
+                    "id": bullet.id,
+                    "time": round(frames / FPS, 3),
+                    "miss_distance": round(miss, 1),
+                    "will_hit": miss < THREAT_HIT_RADIUS,
+                })
+
+        for entries in threats.values():
+            entries.sort(key=lambda t: t["time"])
+        self.threats = threats
+
+    def start_replay(self):
+        """Finish any open recording and start a new replay file."""
+        self.stop_replay()
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        millis = int(time.time() * 1000) % 1000
+        path = os.path.join(ROOT_DIR, REPLAY_DIR, f"match_{stamp}_{millis:03d}_mode{self.game_mode}.gwr")
+        try:
+            self.replay_writer = ReplayWriter(path)
+        except OSError:
+            self.replay_writer = None  # Read-only checkout - play without recording
+
+    def stop_replay(self):
+        """Write the index of the open recording, if any (empty ones are deleted)."""
+        if self.replay_writer:
+            self.replay_writer.close()
+            if self.replay_writer.frame_count == 0:
+                try:
+                    os.remove(self.replay_writer.path)
+                except OSError:
+                    pass
+            self.replay_writer = None
+
+    def publish_world_state(self):
+        """
+        Pack this frame's world state (after physics) into shared memory.
+        Sensor readings built for this frame's bot contexts are reused for
+        tanks that have not moved or turned since; every other tank is
+        traced again at its published pose.
+        """
+        sensors = {}
+        clearances = {}
+        for tank in self.tanks:
+            if tank.alive:
+                pose = (tank.x, tank.y, tank.angle)
+                cached_pose, readings = self.frame_sensors.get(tank.id, (None, None))
+                if cached_pose != pose:
+                    readings = self.distance_field.sensor_readings(*pose)
+                sensors[tank.id] = readings
+                clearances[tank.id] = round(self.distance_field.clearance(tank.x, tank.y), 1)
+        self.state_publisher.publish(self, sensors, clearances)
+
+    def on_tank_death(self, tank: Tank):
+        """Handle tank death effects."""
+        # Explosion particles
+        self.particles.spawn_explosion(tank.x, tank.y, tank.color)
+
+        # Screen shake
+        self.camera.shake()
+
+        # Explosion SFX
+        play_sound(SFX_DEATH, VOL_DEATH)
+
+        # Add kill feed message for Level 2
+        if self.game_mode == 2:
+            team_name = getattr(tank, 'team_name', f'Tank_{tank.id}')
+            self.kill_feed.append({
+                "text": f"{team_name} ELIMINATED",
+                "timer": 3.0,  # Display for 3 seconds
+                "alpha": 255
+            })
+
+    def end_scramble(self):
+        """End The Scramble mode."""
+        self.game_over = True
+        sorted_tanks = sorted(self.tanks, key=lambda t: t.coins, reverse=True)
+        winners = sorted_tanks[:SCRAMBLE_TOP_SURVIVORS]
+
+        self.winner_text = "SCRAMBLE COMPLETE!\n"
+        for i, tank in enumerate(winners):
+            name = getattr(tank, 'team_name', f'Tank_{tank.id}')
+            self.winner_text += f"\n#{i+1}: {name} - {tank.coins} coins"
+
+        stop_music()
+        play_critical_sound(SFX_WIN_1, VOL_WIN)
+
+    def end_labyrinth(self):
+        """End The Labyrinth mode."""
+        self.game_over = True
+        survivors = [t for t in self.tanks if t.alive]
+        self.winner_text = "LABYRINTH SURVIVORS:\n"
+        for tank in survivors:
+            name = getattr(tank, 'team_name', f'Tank_{tank.id}')
+            self.winner_text += f"\n{name}"
+
+        stop_music()
+        play_critical_sound(SFX_WIN_2, VOL_WIN)
+
+    def end_duel(self, winner: Optional[Tank]):
+        """End The Duel mode."""
+        self.game_over = True
+        if winner:
+            name = getattr(winner, 'team_name', f'Tank_{winner.id}')
+            self.winner_text = f"CHAMPION: {name}!"
+        else:
+            self.winner_text = "DRAW!"
+
+        stop_music()
+        play_critical_sound(SFX_WIN_3, VOL_WIN)
+
+    def shutdown(self):
+        """Release external resources (shared memory, spectator sockets, replay file)."""
+        self.stop_replay()
+        if self.state_publisher:
+            self.state_publisher.close()
+            self.state_publisher = None
+        if self.spectator_server:
+            self.spectator_server.close()
+            self.spectator_server = None
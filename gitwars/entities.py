@@ -0,0 +1,397 @@
+"""
+GitWars - Simulation Entities
+=============================
+Bullets, tanks, coins and walls.
+
+Only pygame's geometry types (Rect, Vector2) are used here - no display,
+fonts or audio - so this module imports cleanly in headless workers.
+Drawing lives in gitwars.render.
+
+OPTIMIZED: every entity uses __slots__ (no per-instance __dict__), which
+keeps headless workers small when many simulations run side by side.
+See bench_entities.py for bytes per entity and attribute access speed.
+Each moving entity also owns one collision Rect, moved in place as it
+moves, so get_rect() never allocates. Walls hand out copies of theirs;
+the hot paths read wall rects from gitwars.wall_grid instead.
+"""
+
+import itertools
+import math
+import random
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from config import *
+from gitwars.effects import Trail
+from gitwars.utils import clamp
+
+# Stable IDs for bullets and coins (bots track them across frames)
+_bullet_ids = itertools.count(1)
+_coin_ids = itertools.count(1)
+
+def reset_entity_ids():
+    """Restart bullet/coin numbering (once per match, keeps matches reproducible)."""
+    global _bullet_ids, _coin_ids
+    _bullet_ids = itertools.count(1)
+    _coin_ids = itertools.count(1)
+
+# =============================================================================
+# BULLET
+# =============================================================================
+
+class Bullet:
+    """Projectile with trail effect and critical hits."""
+
+    __slots__ = ("id", "x", "y", "angle", "owner_id", "color", "vx", "vy",
+                 "is_critical", "damage", "trail", "alive", "rect")
+
+    def __init__(self, x: float, y: float, angle: float, owner_id: int, color: Tuple[int, int, int]):
+        self.id = next(_bullet_ids)
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.owner_id = owner_id
+        self.color = color
+
+        # Velocity
+        rad = math.radians(angle)
+        self.vx = math.cos(rad) * BULLET_SPEED
+        self.vy = math.sin(rad) * BULLET_SPEED
+
+        # Critical hit check
+        self.is_critical = random.random() < CRITICAL_HIT_CHANCE
+        if self.is_critical:
+            self.color = COLOR_CRITICAL
+            self.damage = BULLET_DAMAGE * CRITICAL_HIT_MULTIPLIER
+        else:
+            self.damage = BULLET_DAMAGE
+
+        # Trail
+        self.trail = Trail(self.color)
+        self.alive = True
+
+        self.rect = pygame.Rect(x - BULLET_SIZE, y - BULLET_SIZE, BULLET_SIZE * 2, BULLET_SIZE * 2)
+
+    def update(self):
+        """Update bullet position."""
+        self.trail.add_point(self.x, self.y)
+        self.x += self.vx
+        self.y += self.vy
+        self.rect.update(self.x - BULLET_SIZE, self.y - BULLET_SIZE, BULLET_SIZE * 2, BULLET_SIZE * 2)
+
+        # Check bounds
+        if self.x < 0 or self.x > WORLD_WIDTH or self.y < 0 or self.y > WORLD_HEIGHT:
+            self.alive = False
+
+    def get_rect(self) -> pygame.Rect:
+        """Get collision rectangle (kept in sync by update())."""
+        return self.rect
+
+# =============================================================================
+# TANK
+# =============================================================================
+
+class Tank:
+    """Player/Bot controlled tank with Euler physics."""
+
+    __slots__ = ("id", "x", "y", "angle", "color", "health", "max_health", "ammo", "coins",
+                 "alive", "team_name", "mass", "pos", "velocity", "acceleration", "friction",
+                 "is_jammed", "jam_timer", "shoot_cooldown", "last_action", "muzzle_flash_timer",
+                 "rect")
+
+    def __init__(self, tank_id: int, x: float, y: float, color: Tuple[int, int, int]):
+        self.id = tank_id
+        self.x = x
+        self.y = y
+        self.angle = 0.0
+        self.color = color
+
+        self.health = TANK_MAX_HEALTH
+        self.max_health = TANK_MAX_HEALTH  # Track max for health bar display
+        self.ammo = TANK_STARTING_AMMO
+        self.coins = 0
+        self.alive = True
+        self.team_name = f"Tank_{tank_id}"  # Default, will be set from bot filename
+
+        # =====================================================================
+        # EULER PHYSICS SYSTEM
+        # =====================================================================
+        self.mass = TANK_MASS
+        self.pos = pygame.math.Vector2(x, y)
+        self.velocity = pygame.math.Vector2(0, 0)
+        self.acceleration = pygame.math.Vector2(0, 0)
+        self.friction = TANK_FRICTION
+
+        # State
+        self.is_jammed = False
+        self.jam_timer = 0.0
+        self.shoot_cooldown = 0.0
+        self.last_action = None
+
+        # Visual state
+        self.muzzle_flash_timer = 0
+
+        # Collision shape, moved in place whenever x/y change
+        self.rect = pygame.Rect(0, 0, TANK_SIZE, TANK_SIZE)
+        self.sync_rect()
+
+    def apply_force(self, force_vector: pygame.math.Vector2):
+        """
+        Apply a force to the tank. F = ma -> a = F / m
+        Multiple forces in one frame will accumulate naturally.
+        """
+        self.acceleration += force_vector / self.mass
+
+    def update(self, dt: float, walls: List['Wall'] = None, distance_field=None, wall_grid=None):
+        """
+        Update tank state with Force Accumulation physics.
+        distance_field (optional) lets the wall check be skipped in open space.
+        wall_grid (optional) narrows the wall check to nearby walls.
+        """
+        # Handle jam timer (but do NOT block physics!)
+        if self.jam_timer > 0:
+            self.jam_timer -= dt
+            self.is_jammed = self.jam_timer > 0
+
+        # =====================================================================
+        # FORCE ACCUMULATION PHYSICS (User's exact pattern)
+        # =====================================================================
+
+        # 1. APPLY FRICTION (Force opposing velocity)
+        # This naturally slows down BOTH movement and knockback smoothly.
+        if self.velocity.length() > 0.5:
+            friction_force = self.velocity.normalize() * (-self.friction) * self.velocity.length()
+            self.acceleration += friction_force
+
+        # 2. INTEGRATE PHYSICS (Euler Integration)
+        # Velocity changes by Acceleration over Time
+        self.velocity += self.acceleration * dt
+        # Position changes by Velocity over Time
+        self.pos += self.velocity * dt
+
+        # 3. RESET ACCELERATION (At END of frame, ready for next)
+        self.acceleration = pygame.math.Vector2(0, 0)
+
+        # 4. Sync x/y for compatibility
+        self.x = self.pos.x
+        self.y = self.pos.y
+
+        # Clamp to arena bounds
+        self.x = clamp(self.x, TANK_SIZE, WORLD_WIDTH - TANK_SIZE)
+        self.y = clamp(self.y, TANK_SIZE, WORLD_HEIGHT - TANK_SIZE)
+        self.pos.x = self.x
+        self.pos.y = self.y
+        self.sync_rect()
+
+        # OPTIMIZED: Far from every wall (the field's lower bound exceeds the
+        # tank's half-diagonal) there is nothing to resolve.
+        if walls and distance_field and distance_field.distance(self.x, self.y) > TANK_SIZE:
+            walls = None
+
+        # OPTIMIZED: Only walls near the tank. The margin covers one push-out
+        # (at most TANK_SIZE + 1), so walls reached by sliding are included.
+        wall_rects = None
+        if walls and wall_grid:
+            wall_rects = wall_grid.query_rects(self.rect, TANK_SIZE + 2)
+        elif walls:
+            wall_rects = [wall.get_rect() for wall in walls]
+
+        # Wall collision (SLIDING - not sticky!)
+        if wall_rects:
+            tank_rect = self.rect
+            for wall_rect in wall_rects:
+                if tank_rect.colliderect(wall_rect):
+                    # Calculate overlap on each axis
+                    overlap_left = tank_rect.right - wall_rect.left
+                    overlap_right = wall_rect.right - tank_rect.left
+                    overlap_top = tank_rect.bottom - wall_rect.top
+                    overlap_bottom = wall_rect.bottom - tank_rect.top
+
+                    # Find minimum overlap (the axis we need to resolve)
+                    min_overlap_x = min(overlap_left, overlap_right)
+                    min_overlap_y = min(overlap_top, overlap_bottom)
+
+                    # Resolve collision on the axis with smaller overlap (allows sliding!)
+                    if min_overlap_x < min_overlap_y:
+                        # Horizontal collision - push out horizontally, KEEP vertical velocity
+                        if overlap_left < overlap_right:
+                            self.pos.x -= overlap_left + 1
+                        else:
+                            self.pos.x += overlap_right + 1
+                        self.velocity.x = 0  # Stop horizontal, but slide vertically
+                    else:
+                        # Vertical collision - push out vertically, KEEP horizontal velocity
+                        if overlap_top < overlap_bottom:
+                            self.pos.y -= overlap_top + 1
+                        else:
+                            self.pos.y += overlap_bottom + 1
+                        self.velocity.y = 0  # Stop vertical, but slide horizontally
+
+                    # Sync position
+                    self.x = self.pos.x
+                    self.y = self.pos.y
+                    self.sync_rect()  # Update rect for next wall check
+
+        # Update cooldowns
+        if self.shoot_cooldown > 0:
+            self.shoot_cooldown -= dt
+
+        if self.muzzle_flash_timer > 0:
+            self.muzzle_flash_timer -= 1
+
+    def move(self, dx: float, dy: float):
+        """Move the tank in a direction (bot command). Adds force, never overwrites velocity!"""
+        if self.is_jammed:
+            return
+
+        # Random jam check
+        if random.random() < JAM_CHANCE:
+            self.is_jammed = True
+            self.jam_timer = 1.0
+            return
+
+        # Normalize and ADD as force (NEVER overwrite velocity!)
+        length = math.sqrt(dx * dx + dy * dy)
+        if length > 0:
+            input_force = pygame.math.Vector2(
+                (dx / length) * TANK_ENGINE_FORCE,
+                (dy / length) * TANK_ENGINE_FORCE
+            )
+            # ADD to acceleration, don't replace
+            self.acceleration += input_force / self.mass
+            self.angle = math.degrees(math.atan2(dy, dx))
+
+    def shoot(self, target_angle: float) -> Optional[Bullet]:
+        """Fire a bullet if possible."""
+        if self.is_jammed or self.ammo <= 0 or self.shoot_cooldown > 0:
+            return None
+
+        self.ammo -= 1
+        self.shoot_cooldown = 0.2
+        self.muzzle_flash_timer = MUZZLE_FLASH_DURATION
+
+        # Recoil as force
+        rad = math.radians(target_angle)
+        recoil_force = pygame.math.Vector2(
+            -math.cos(rad) * TANK_RECOIL * 2,
+            -math.sin(rad) * TANK_RECOIL * 2
+        )
+        self.apply_force(recoil_force)
+
+        # Create bullet at barrel tip
+        barrel_x = self.x + math.cos(rad) * (TANK_SIZE / 2 + 5)
+        barrel_y = self.y + math.sin(rad) * (TANK_SIZE / 2 + 5)
+
+        return Bullet(barrel_x, barrel_y, target_angle, self.id, self.color)
+
+    def take_damage(self, damage: float):
+        """Apply damage to the tank."""
+        self.health -= damage
+        if self.health <= 0:
+            self.health = 0
+            self.alive = False
+
+    def apply_knockback(self, angle: float, force: float):
+        """Apply knockback as IMPULSE (direct velocity change, not acceleration)."""
+        rad = math.radians(angle)
+        # Impulse: directly add to velocity (not acceleration)
+        # This gives INSTANT kick that friction will smooth out
+        impulse = pygame.math.Vector2(
+            math.cos(rad) * force * 15.0,  # Scale for impact
+            math.sin(rad) * force * 15.0
+        )
+        self.velocity += impulse  # IMPULSE: Add directly to velocity!
+
+    def sync_rect(self):
+        """Move the collision rectangle to the current x/y (no allocation)."""
+        self.rect.update(self.x - TANK_SIZE // 2, self.y - TANK_SIZE // 2, TANK_SIZE, TANK_SIZE)
+
+    def get_rect(self) -> pygame.Rect:
+        """Get collision rectangle."""
+        return self.rect
+
+    def get_context(self) -> Dict:
+        """Get context data for bot (read-only copy)."""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "angle": self.angle,
+            "health": self.health,
+            "ammo": self.ammo,
+            "coins": self.coins
+        }
+
+# =============================================================================
+# COIN
+# =============================================================================
+
+class Coin:
+    """Collectible coin for The Scramble mode."""
+
+    __slots__ = ("id", "x", "y", "collected", "pulse_phase", "rect")
+
+    def __init__(self, x: float, y: float):
+        self.id = next(_coin_ids)
+        self.x = x
+        self.y = y
+        self.collected = False
+        self.pulse_phase = random.uniform(0, 2 * math.pi)
+        self.rect = pygame.Rect(x - COIN_SIZE // 2, y - COIN_SIZE // 2, COIN_SIZE, COIN_SIZE)
+
+    def update(self, dt: float):
+        """Update coin animation."""
+        self.pulse_phase += COIN_GLOW_SPEED
+
+    def get_rect(self) -> pygame.Rect:
+        """Get collision rectangle (coins never move)."""
+        return self.rect
+
+# =============================================================================
+# WALL
+# =============================================================================
+
+class Wall:
+    """
+    Indestructible wall for maze mode.
+    Walls never move: geometry is fixed at construction. get_rect()
+    returns a copy, so callers can't move the wall through it.
+    """
+
+    __slots__ = ("_x", "_y", "_width", "_height", "_rect")
+
+    def __init__(self, x: float, y: float, width: float, height: float):
+        self._x = x
+        self._y = y
+        self._width = width
+        self._height = height
+        self._rect = pygame.Rect(x, y, width, height)
+
+    @property
+    def x(self) -> float:
+        return self._x
+
+    @property
+    def y(self) -> float:
+        return self._y
+
+    @property
+    def width(self) -> float:
+        return self._width
+
+    @property
+    def height(self) -> float:
+        return self._height
+
+    def get_rect(self) -> pygame.Rect:
+        """Get a copy of the collision rectangle."""
+        return self._rect.copy()
+
+    def get_context(self) -> Dict:
+        """Get context data for bot."""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "width": self.width,
+            "height": self.height
+        }
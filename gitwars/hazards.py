@@ -0,0 +1,367 @@
+"""
+GitWars - Arena Hazards
+=======================
+Shrinking zone (Labyrinth), sudden-death laser, orbital strikes
+(DangerZone) and the Juggernaut boss.
+
+Simulation only - drawing lives in gitwars.render.
+"""
+
+import math
+import random
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from config import *
+from gitwars.effects import ParticleSystem
+from gitwars.entities import Bullet, Tank
+from gitwars.sounds import play_sound, SFX_COIN, SFX_DEATH, SFX_SHOOT
+from gitwars.utils import lerp, distance
+
+# =============================================================================
+# ZONE
+# =============================================================================
+
+class Zone:
+    """Shrinking damage zone for The Labyrinth mode."""
+
+    def __init__(self):
+        self.margin = 0
+        self.shrink_timer = 0.0
+        self.target_margin = 0
+
+    def update(self, dt: float):
+        """Update zone shrinking."""
+        self.shrink_timer += dt
+
+        if self.shrink_timer >= LABYRINTH_ZONE_SHRINK_INTERVAL:
+            self.shrink_timer = 0
+            self.target_margin += GRID_CELL_SIZE
+
+        # Smooth shrink animation
+        if self.margin < self.target_margin:
+            self.margin = lerp(self.margin, self.target_margin, 0.02)
+
+    def is_in_danger(self, x: float, y: float) -> bool:
+        """Check if position is in the danger zone."""
+        return (x < self.margin or x > WORLD_WIDTH - self.margin or
+                y < self.margin or y > WORLD_HEIGHT - self.margin)
+
+# =============================================================================
+# LASER
+# =============================================================================
+
+class Laser:
+    """Sudden death laser for The Duel mode."""
+
+    def __init__(self):
+        self.active = False
+        self.x = 0
+        self.direction = 1  # 1 = left to right, -1 = right to left
+
+    def activate(self):
+        """Start the laser sweep."""
+        self.active = True
+        self.direction = random.choice([-1, 1])
+        self.x = 0 if self.direction == 1 else WORLD_WIDTH
+
+    def update(self, dt: float):
+        """Update laser position."""
+        if not self.active:
+            return
+
+        self.x += DUEL_LASER_SPEED * self.direction
+
+    def check_hit(self, tank: Tank) -> bool:
+        """Check if laser hits a tank."""
+        if not self.active:
+            return False
+
+        # Laser is a vertical line
+        if self.direction == 1:
+            return tank.x < self.x
+        else:
+            return tank.x > self.x
+
+# =============================================================================
+# DANGER ZONE (Orbital Strike - Mode 2)
+# =============================================================================
+
+class DangerZone:
+    """
+    Orbital Strike danger zone for Labyrinth mode.
+    Phases: WARNING (pulsing red) -> ACTIVE (explosions) -> DESPAWN
+    """
+
+    # Phase constants
+    PHASE_WARNING = 0
+    PHASE_ACTIVE = 1
+    PHASE_DEAD = 2
+
+    def __init__(self, x: float, y: float, particles: ParticleSystem):
+        self.x = x
+        self.y = y
+        self.radius = DANGER_ZONE_RADIUS
+        self.particles = particles
+
+        # Timing
+        self.phase = self.PHASE_WARNING
+        self.timer = 0.0
+        self.blast_timer = 0.0
+
+        # Visual
+        self.pulse_time = 0.0
+
+        # Play siren sound on spawn
+        play_sound(SFX_COIN)  # Use coin sound as placeholder for siren
+
+    def update(self, dt: float) -> bool:
+        """Update the danger zone. Returns False when zone should be removed."""
+        self.timer += dt
+        self.pulse_time += dt * 8  # Faster pulsing
+
+        if self.phase == self.PHASE_WARNING:
+            if self.timer >= DANGER_ZONE_WARNING_DURATION:
+                self.phase = self.PHASE_ACTIVE
+                self.timer = 0.0
+                self.blast_timer = 0.0
+
+        elif self.phase == self.PHASE_ACTIVE:
+            # Spawn explosion particles periodically
+            self.blast_timer += dt
+            if self.blast_timer >= DANGER_ZONE_BLAST_INTERVAL:
+                self.blast_timer = 0.0
+                self._spawn_blast()
+
+            if self.timer >= DANGER_ZONE_ACTIVE_DURATION:
+                self.phase = self.PHASE_DEAD
+                return False
+
+        return True
+
+    def _spawn_blast(self):
+        """Spawn explosion particles at random point inside zone."""
+        # Random point inside circle
+        angle = random.uniform(0, math.pi * 2)
+        dist = random.uniform(0, self.radius * 0.8)
+        blast_x = self.x + math.cos(angle) * dist
+        blast_y = self.y + math.sin(angle) * dist
+
+        # Spawn particles
+        self.particles.spawn_explosion(blast_x, blast_y, (255, 100, 50))
+        play_sound(SFX_DEATH, VOL_DEATH)
+
+# =============================================================================
+# BATCHED HAZARD EVALUATION
+# =============================================================================
+
+def evaluate_hazards(tanks: List, dt: float, zone: Optional[Zone] = None,
+                     danger_zones: List[DangerZone] = (),
+                     juggernaut: Optional['Juggernaut'] = None) -> List[Tuple[float, float, float]]:
+    """
+    OPTIMIZED: Evaluate every active hazard against every tank in one pass.
+
+    Circular hazards (active danger zones, Juggernaut melee) are flattened
+    into one list up front and tested with squared distances, so the square
+    root is only taken for actual hits. Returns (damage, knock_x, knock_y)
+    per tank, in the same order as tanks; knockback is a summed force vector
+    (unit direction away from each hazard times its knockback force).
+    Dead tanks get (0, 0, 0).
+    """
+    # (center_x, center_y, radius_squared, damage, knockback)
+    circles = [(dz.x, dz.y, dz.radius * dz.radius, DANGER_ZONE_DAMAGE, DANGER_ZONE_KNOCKBACK)
+               for dz in danger_zones if dz.phase == DangerZone.PHASE_ACTIVE]
+    if juggernaut:
+        reach = juggernaut.radius + TANK_SIZE // 2
+        circles.append((juggernaut.x, juggernaut.y, reach * reach,
+                        JUGGERNAUT_MELEE_DAMAGE, JUGGERNAUT_MELEE_KNOCKBACK))
+
+    zone_damage = LABYRINTH_ZONE_DAMAGE * dt
+    results = []
+    for tank in tanks:
+        if not tank.alive:
+            results.append((0.0, 0.0, 0.0))
+            continue
+
+        x, y = tank.x, tank.y
+        damage = knock_x = knock_y = 0.0
+
+        if zone and zone.is_in_danger(x, y):
+            damage += zone_damage
+
+        for cx, cy, r2, hit_damage, force in circles:
+            dx, dy = x - cx, y - cy
+            d2 = dx * dx + dy * dy
+            if d2 >= r2:
+                continue
+            damage += hit_damage
+            if d2 > 0:
+                d = math.sqrt(d2)
+                knock_x += dx / d * force
+                knock_y += dy / d * force
+            else:
+                knock_x += force  # Dead center: angle_to() gives 0 degrees
+
+        results.append((damage, knock_x, knock_y))
+    return results
+
+# =============================================================================
+# JUGGERNAUT (Boss - Mode 3)
+# =============================================================================
+
+class Juggernaut:
+    """
+    The Juggernaut - A massive AI-controlled boss that attacks all players.
+    Features:
+    - Spinning saw-blade visual (3x tank size)
+    - Creeps toward nearest player
+    - Melee contact = rapid damage + massive knockback
+    - Burst Cannon: Idle -> Charge (glow) -> 5-shot burst
+    """
+
+    # Weapon phases
+    PHASE_IDLE = 0
+    PHASE_CHARGE = 1
+    PHASE_BURST = 2
+
+    def __init__(self, x: float, y: float, particles: ParticleSystem):
+        self.x = x
+        self.y = y
+        self.radius = JUGGERNAUT_SIZE // 2
+        self.particles = particles
+
+        # Movement
+        self.vel = pygame.math.Vector2(0, 0)
+
+        # Visual rotation (spinning saw-blade effect)
+        self.rotation = 0.0
+
+        # Weapon state
+        self.weapon_phase = self.PHASE_IDLE
+        self.weapon_timer = 0.0
+        self.burst_count = 0
+        self.burst_cooldown = 0.0
+        self.target_angle = 0.0  # Turret tracking angle
+        self.target_tank = None  # Current target
+        self.all_targets = []
+
+    def find_nearest_target(self, tanks: List) -> Optional[any]:
+        """Find the nearest alive player tank."""
+        nearest = None
+        min_dist = float('inf')
+
+        for tank in tanks:
+            if tank.alive:
+                dist = distance(self.x, self.y, tank.x, tank.y)
+                if dist < min_dist:
+                    min_dist = dist
+                    nearest = tank
+
+        return nearest
+
+    def update(self, dt: float, tanks: List, bullets: List):
+        """Update Juggernaut movement, AI, and weapon."""
+        # Spin the saw-blade
+        self.rotation += JUGGERNAUT_ROTATION_SPEED * dt
+
+        # Store ALL alive tanks for omni-burst
+        self.all_targets = [t for t in tanks if t.alive]
+
+        # Find nearest target for movement
+        self.target_tank = self.find_nearest_target(tanks)
+
+        if self.target_tank:
+            # Move toward target (slow creep)
+            dx = self.target_tank.x - self.x
+            dy = self.target_tank.y - self.y
+            dist = max((dx*dx + dy*dy)**0.5, 1)
+
+            # Normalize and apply speed
+            self.vel.x = (dx / dist) * JUGGERNAUT_SPEED * dt
+            self.vel.y = (dy / dist) * JUGGERNAUT_SPEED * dt
+
+            self.x += self.vel.x
+            self.y += self.vel.y
+
+            # Update turret tracking angle (for visual)
+            self.target_angle = math.degrees(math.atan2(dy, dx))
+
+        # Keep in bounds
+        self.x = max(self.radius, min(WORLD_WIDTH - self.radius, self.x))
+        self.y = max(self.radius, min(WORLD_HEIGHT - self.radius, self.y))
+
+        # Weapon state machine
+        self._update_weapon(dt, bullets)
+
+    def _update_weapon(self, dt: float, bullets: List):
+        """Update burst cannon state machine."""
+        self.weapon_timer += dt
+
+        if self.weapon_phase == self.PHASE_IDLE:
+            if self.weapon_timer >= JUGGERNAUT_IDLE_TIME:
+                self.weapon_phase = self.PHASE_CHARGE
+                self.weapon_timer = 0.0
+
+        elif self.weapon_phase == self.PHASE_CHARGE:
+            if self.weapon_timer >= JUGGERNAUT_CHARGE_TIME:
+                self.weapon_phase = self.PHASE_BURST
+                self.weapon_timer = 0.0
+                self.burst_count = 0
+                self.burst_cooldown = 0.0
+
+        elif self.weapon_phase == self.PHASE_BURST:
+            self.burst_cooldown -= dt
+
+            if self.burst_cooldown <= 0 and self.burst_count < JUGGERNAUT_BURST_COUNT:
+                # OMNI-BURST: Fire at ALL alive tanks simultaneously!
+                self._fire_omni_burst(bullets)
+                self.burst_count += 1
+                self.burst_cooldown = JUGGERNAUT_BURST_INTERVAL
+
+            if self.burst_count >= JUGGERNAUT_BURST_COUNT:
+                self.weapon_phase = self.PHASE_IDLE
+                self.weapon_timer = 0.0
+
+    def _fire_omni_burst(self, bullets: List):
+        """Fire heavy bullets at ALL alive tanks simultaneously."""
+        if not self.all_targets:
+            return
+
+        for target in self.all_targets:
+            # Calculate angle to this specific target
+            dx = target.x - self.x
+            dy = target.y - self.y
+            target_angle = math.degrees(math.atan2(dy, dx))
+            angle_rad = math.radians(target_angle)
+
+            # Spawn bullet at turret position toward this target
+            bx = self.x + math.cos(angle_rad) * (self.radius + 10)
+            by = self.y + math.sin(angle_rad) * (self.radius + 10)
+
+            # Create bullet
+            bullet = Bullet(bx, by, target_angle, -1, (255, 100, 100))
+
+            # Override with Juggernaut's heavy bullet stats
+            bullet.vx = math.cos(angle_rad) * JUGGERNAUT_BULLET_SPEED
+            bullet.vy = math.sin(angle_rad) * JUGGERNAUT_BULLET_SPEED
+            bullet.damage = JUGGERNAUT_BULLET_DAMAGE
+            bullet.is_critical = False
+
+            bullets.append(bullet)
+
+            # Muzzle flash for each bullet
+            self.particles.spawn_muzzle_flash(bx, by, target_angle, (255, 150, 100))
+
+        # Single sound for the burst
+        play_sound(SFX_SHOOT, VOL_SHOOT)
+
+    def get_context_data(self) -> Dict:
+        """Return data for bot context."""
+        return {
+            "x": self.x,
+            "y": self.y,
+            "radius": self.radius,
+            "weapon_phase": self.weapon_phase,
+            "target_angle": self.target_angle
+        }
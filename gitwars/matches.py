@@ -0,0 +1,176 @@
+"""
+GitWars - Headless Matches and Result Cache
+===========================================
+Runs seeded matches without a window and caches their results.
+
+A result is stored under a content-addressed key, the SHA-256 of:
+- the source hash of every participating bot (in slot order)
+- the simulation-relevant config.py constants (display, audio, streaming
+  and other presentation-only settings are excluded)
+- the source hash of the gitwars package (an engine change reruns everything)
+- the game mode and RNG seed
+
+When one team pushes a fix, only the matchups that bot plays in get a new
+key, so a tournament rerun simulates just those and reuses the rest.
+
+Matches are deterministic for a given key, except for bots that trip the
+wall-clock BOT_TIMEOUT_MS lag penalty.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import random
+from typing import Dict, List, Optional, Tuple
+
+import config
+from config import *
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_DIR = os.path.join(ROOT_DIR, "gitwars")
+CACHE_DIR = os.path.join(ROOT_DIR, MATCH_CACHE_DIR)
+CACHE_VERSION = 1
+
+# Constants that never change a match outcome
+PRESENTATION_PREFIXES = (
+    "AUDIO_", "CAMERA_", "COIN_GLOW_", "COLOR_", "BULLET_TRAIL_", "DANGER_ZONE_FRAME_", "DEBUG_",
+    "MUSIC_", "MUZZLE_", "PARTICLE_", "PITCH_", "QUALITY_", "REPLAY_",
+    "SFX_", "SHAKE_", "SHARED_STATE_", "SHOW_", "SPECTATOR_", "VOL_",
+)
+PRESENTATION_NAMES = {"GAME_MODE", "TITLE", "TANK_COLORS", "MAZE_CACHE_DIR", "MATCH_CACHE_DIR"}
+
+# =============================================================================
+# CACHE KEYS
+# =============================================================================
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def simulation_config() -> Dict:
+    """The config.py constants that can affect a match outcome."""
+    values = {}
+    for name in sorted(dir(config)):
+        if not name.isupper() or name in PRESENTATION_NAMES or name.endswith("_COLOR"):
+            continue
+        if name.startswith(PRESENTATION_PREFIXES):
+            continue
+        values[name] = getattr(config, name)
+    return values
+
+
+_engine_hash: Optional[str] = None
+
+def engine_hash() -> str:
+    """Combined source hash of the gitwars package (computed once)."""
+    global _engine_hash
+    if _engine_hash is None:
+        digest = hashlib.sha256()
+        for path in sorted(glob.glob(os.path.join(PACKAGE_DIR, "*.py"))):
+            digest.update(os.path.basename(path).encode())
+            digest.update(_hash_file(path).encode())
+        _engine_hash = digest.hexdigest()
+    return _engine_hash
+
+
+def match_key(bot_paths: List[str], game_mode: int, seed: int) -> str:
+    """Content-addressed cache key for one match."""
+    payload = {
+        "version": CACHE_VERSION,
+        "bots": [_hash_file(path) for path in bot_paths],
+        "config": simulation_config(),
+        "engine": engine_hash(),
+        "mode": game_mode,
+        "seed": seed,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=repr).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+# =============================================================================
+# RUNNING
+# =============================================================================
+
+def run_match(bot_paths: List[str], game_mode: int, seed: int,
+              max_frames: Optional[int] = None) -> Dict:
+    """
+    Simulate one match headless at a fixed 1/FPS step and return its result:
+    ranking (slot indices into bot_paths, best first), per-slot stats and
+    frame count. Results hold no file names: identical bot sources share a
+    key, so callers map slots back to their own bot list.
+    """
+    from gitwars.engine import GitWarsEngine
+
+    if max_frames is None:
+        max_frames = config.MATCH_MAX_FRAMES  # Part of the cache key, read at call time
+    random.seed(seed)
+    engine = GitWarsEngine(game_mode=game_mode, bot_paths=bot_paths, record_replays=False)
+    death_frame = {}
+
+    frame = 0
+    dt = 1.0 / FPS
+    while not engine.game_over and frame < max_frames:
+        engine.update(dt)
+        frame += 1
+        for tank in engine.tanks:
+            if not tank.alive and tank.id not in death_frame:
+                death_frame[tank.id] = frame
+    engine.shutdown()
+
+    tanks = engine.tanks
+    if game_mode == 1:
+        order = sorted(tanks, key=lambda t: (-t.coins, -t.health))
+    else:
+        # Survivors by health, then the fallen by how long they lasted
+        order = sorted(tanks, key=lambda t: (not t.alive, -death_frame.get(t.id, frame), -t.health))
+
+    return {
+        "mode": game_mode,
+        "seed": seed,
+        "frames": frame,
+        "timed_out": not engine.game_over,
+        "ranking": [t.id for t in order],
+        "tanks": [{"alive": t.alive, "health": round(t.health, 1), "coins": t.coins,
+                   "death_frame": death_frame.get(t.id)} for t in tanks],
+    }
+
+# =============================================================================
+# RESULT CACHE
+# =============================================================================
+
+class MatchCache:
+    """Match results stored as JSON files named by their key."""
+
+    def __init__(self, directory: str = CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, result: Dict):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = self._path(key) + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(result, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            pass  # Read-only checkout - just skip caching
+
+    def run(self, bot_paths: List[str], game_mode: int, seed: int) -> Tuple[Dict, bool]:
+        """Cached result for a match, simulating it on a miss. Returns (result, was_cached)."""
+        key = match_key(bot_paths, game_mode, seed)
+        result = self.get(key)
+        if result is not None:
+            return result, True
+        result = run_match(bot_paths, game_mode, seed)
+        self.put(key, result)
+        return result, False
@@ -0,0 +1,204 @@
+"""
+GitWars - Procedural Maze Generator
+===================================
+Seeded Labyrinth layouts on the GRID_CELL_SIZE lattice.
+
+1. Rooms are MAZE_ROOM_CELLS x MAZE_ROOM_CELLS lattice cells. Wall lines run
+   along lattice lines between rooms.
+2. A recursive backtracker (iterative, seeded) carves a perfect maze, then
+   MAZE_LOOP_CHANCE of the remaining interior walls are knocked out so the
+   arena has loops instead of dead-end corridors.
+3. The result is rasterized to a block grid (thin wall lines / wide rooms)
+   and greedily merged into maximal rectangles, so a long corridor wall is
+   one Wall instead of many.
+
+Layouts are cached on disk by seed, arena size and generator settings, so a
+given seed loads instantly on every later match.
+"""
+
+import json
+import os
+import random
+from typing import List, Tuple
+
+from config import *
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(ROOT_DIR, MAZE_CACHE_DIR)
+CACHE_VERSION = 1
+
+Rect = Tuple[int, int, int, int]
+
+
+def _carve(cols: int, rows: int, rng: random.Random) -> Tuple[List[List[bool]], List[List[bool]]]:
+    """
+    Recursive backtracker over a cols x rows room grid.
+
+    Returns (east, south): east[r][c] is True if the wall between room (c, r)
+    and (c + 1, r) is still standing; south[r][c] likewise for (c, r + 1).
+    """
+    east = [[True] * cols for _ in range(rows)]
+    south = [[True] * cols for _ in range(rows)]
+    visited = [[False] * cols for _ in range(rows)]
+
+    start = (rng.randrange(cols), rng.randrange(rows))
+    visited[start[1]][start[0]] = True
+    stack = [start]
+
+    while stack:
+        c, r = stack[-1]
+        neighbors = []
+        for dc, dr in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            nc, nr = c + dc, r + dr
+            if 0 <= nc < cols and 0 <= nr < rows and not visited[nr][nc]:
+                neighbors.append((nc, nr))
+
+        if not neighbors:
+            stack.pop()
+            continue
+
+        nc, nr = rng.choice(neighbors)
+        if nc != c:
+            east[r][min(c, nc)] = False
+        else:
+            south[min(r, nr)][c] = False
+        visited[nr][nc] = True
+        stack.append((nc, nr))
+
+    return east, south
+
+
+def _add_loops(east: List[List[bool]], south: List[List[bool]], chance: float, rng: random.Random):
+    """Knock out a fraction of the remaining interior walls."""
+    rows, cols = len(east), len(east[0])
+    for r in range(rows):
+        for c in range(cols):
+            if c < cols - 1 and east[r][c] and rng.random() < chance:
+                east[r][c] = False
+            if r < rows - 1 and south[r][c] and rng.random() < chance:
+                south[r][c] = False
+
+
+def _rasterize(east: List[List[bool]], south: List[List[bool]]) -> List[List[bool]]:
+    """
+    Block grid of size (2 * rows + 1) x (2 * cols + 1).
+    Even indices are wall lines, odd indices are room interiors.
+    The outer border is left open (the arena edge already blocks tanks).
+    """
+    rows, cols = len(east), len(east[0])
+    grid = [[False] * (2 * cols + 1) for _ in range(2 * rows + 1)]
+
+    for r in range(rows):
+        for c in range(cols):
+            gx, gy = 2 * c + 1, 2 * r + 1
+            if c < cols - 1 and east[r][c]:
+                grid[gy][gx + 1] = True
+            if r < rows - 1 and south[r][c]:
+                grid[gy + 1][gx] = True
+
+    # Fill interior corner posts that touch a wall so merged walls join cleanly
+    for gy in range(2, 2 * rows, 2):
+        for gx in range(2, 2 * cols, 2):
+            if grid[gy - 1][gx] or grid[gy + 1][gx] or grid[gy][gx - 1] or grid[gy][gx + 1]:
+                grid[gy][gx] = True
+
+    return grid
+
+
+def merge_rectangles(grid: List[List[bool]]) -> List[Tuple[int, int, int, int]]:
+    """
+    Greedily cover all True blocks with maximal rectangles.
+    Returns (col, row, width, height) in block units.
+    """
+    height, width = len(grid), len(grid[0])
+    used = [[False] * width for _ in range(height)]
+    rects = []
+
+    for y in range(height):
+        for x in range(width):
+            if not grid[y][x] or used[y][x]:
+                continue
+
+            # Extend right
+            x1 = x
+            while x1 + 1 < width and grid[y][x1 + 1] and not used[y][x1 + 1]:
+                x1 += 1
+
+            # Extend down while the whole span is free wall
+            y1 = y
+            while y1 + 1 < height and all(grid[y1 + 1][i] and not used[y1 + 1][i] for i in range(x, x1 + 1)):
+                y1 += 1
+
+            for yy in range(y, y1 + 1):
+                for xx in range(x, x1 + 1):
+                    used[yy][xx] = True
+            rects.append((x, y, x1 - x + 1, y1 - y + 1))
+
+    return rects
+
+
+def generate_maze_layout(seed: int, width: int = WORLD_WIDTH, height: int = WORLD_HEIGHT) -> List[Rect]:
+    """Generate wall rectangles (x, y, w, h) in pixels for a seed and arena size."""
+    rng = random.Random(seed)
+    room = MAZE_ROOM_CELLS * GRID_CELL_SIZE
+    thick = MAZE_WALL_THICKNESS
+
+    cols = max(1, width // room)
+    rows = max(1, height // room)
+
+    # Center the maze, snapped to the lattice
+    origin_x = round((width - cols * room) / 2 / GRID_CELL_SIZE) * GRID_CELL_SIZE
+    origin_y = round((height - rows * room) / 2 / GRID_CELL_SIZE) * GRID_CELL_SIZE
+
+    east, south = _carve(cols, rows, rng)
+    _add_loops(east, south, MAZE_LOOP_CHANCE, rng)
+    grid = _rasterize(east, south)
+
+    # Pixel extents of each block column / row: wall lines are centered on
+    # lattice lines, rooms fill the space between them.
+    def edges(count: int, origin: int) -> List[int]:
+        bounds = [origin - thick // 2]
+        for i in range(count):
+            line = origin + i * room
+            bounds.append(line + thick // 2)            # end of wall line i
+            bounds.append(line + room - thick // 2)     # end of room i
+        bounds.append(origin + count * room + thick // 2)
+        return bounds
+
+    xs = edges(cols, origin_x)
+    ys = edges(rows, origin_y)
+
+    walls = []
+    for bx, by, bw, bh in merge_rectangles(grid):
+        x0, x1 = xs[bx], xs[bx + bw]
+        y0, y1 = ys[by], ys[by + bh]
+        walls.append((x0, y0, x1 - x0, y1 - y0))
+    return walls
+
+
+def _cache_path(seed: int, width: int, height: int) -> str:
+    """Cache file for a seed, arena size and the current generator settings."""
+    key = (f"v{CACHE_VERSION}_s{seed}_{width}x{height}_g{GRID_CELL_SIZE}"
+           f"_r{MAZE_ROOM_CELLS}_t{MAZE_WALL_THICKNESS}_l{MAZE_LOOP_CHANCE}")
+    return os.path.join(CACHE_DIR, f"maze_{key}.json")
+
+
+def load_maze_layout(seed: int, width: int = WORLD_WIDTH, height: int = WORLD_HEIGHT) -> List[Rect]:
+    """Load a layout from the disk cache, generating and storing it on a miss."""
+    path = _cache_path(seed, width, height)
+    try:
+        with open(path) as f:
+            return [tuple(rect) for rect in json.load(f)]
+    except (OSError, ValueError):
+        pass
+
+    walls = generate_maze_layout(seed, width, height)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(walls, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Read-only checkout - just skip caching
+    return walls
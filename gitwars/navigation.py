@@ -0,0 +1,189 @@
+"""
+GitWars - Flow Fields
+=====================
+Engine-side pathfinding shared by every bot.
+
+The arena is split into GRID_CELL_SIZE cells. Two neighboring cells are
+connected unless a wall crosses the segment between their centers, so thin
+maze walls on lattice lines block movement without swallowing whole cells.
+
+A FlowField is one multi-source BFS over that graph: for every cell it stores
+the distance (in cells) to the nearest source and the next cell to step to.
+Fields are kept for:
+- coins        (Mode 1) all uncollected coins
+- each tank    so every bot can path toward each enemy
+- safe zone    (Mode 2) cells outside the shrinking Zone
+
+A field is only recomputed when its sources move to a different cell, and
+looking up a position is O(1).
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import *
+
+
+class NavGrid:
+    """Cell graph of the arena with wall-blocked edges (static per map)."""
+
+    def __init__(self, walls: List, width: int = WORLD_WIDTH, height: int = WORLD_HEIGHT,
+                 cell_size: int = GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = (width + cell_size - 1) // cell_size
+        self.rows = (height + cell_size - 1) // cell_size
+        self.size = self.cols * self.rows
+
+        half = cell_size / 2
+        self.centers = [((i % self.cols) * cell_size + half, (i // self.cols) * cell_size + half)
+                        for i in range(self.size)]
+
+        rects = [wall.get_rect() for wall in walls]
+
+        # Cells whose center is inside a wall are never walkable
+        self.blocked = [any(r.collidepoint(c) for r in rects) for c in self.centers]
+
+        # Adjacency (4-connected), skipping edges a wall cuts through
+        self.neighbors: List[List[int]] = [[] for _ in range(self.size)]
+        for i in range(self.size):
+            if self.blocked[i]:
+                continue
+            col, row = i % self.cols, i // self.cols
+            for j in ((i + 1) if col + 1 < self.cols else -1,
+                      (i + self.cols) if row + 1 < self.rows else -1):
+                if j < 0 or self.blocked[j]:
+                    continue
+                a, b = self.centers[i], self.centers[j]
+                if any(r.clipline(a, b) for r in rects):
+                    continue
+                self.neighbors[i].append(j)
+                self.neighbors[j].append(i)
+
+    def cell_of(self, x: float, y: float) -> int:
+        """Index of the cell containing (x, y) (clamped to the grid)."""
+        col = min(self.cols - 1, max(0, int(x // self.cell_size)))
+        row = min(self.rows - 1, max(0, int(y // self.cell_size)))
+        return row * self.cols + col
+
+
+class FlowField:
+    """Distance and next step toward the nearest source, for every cell."""
+
+    UNREACHABLE = -1
+
+    def __init__(self, grid: NavGrid, sources: Iterable[int]):
+        self.grid = grid
+        self.dist = [self.UNREACHABLE] * grid.size
+        self.next_cell = [self.UNREACHABLE] * grid.size
+
+        queue = deque()
+        for s in sources:
+            if self.dist[s] == self.UNREACHABLE:
+                self.dist[s] = 0
+                queue.append(s)
+
+        neighbors = grid.neighbors
+        dist = self.dist
+        next_cell = self.next_cell
+        while queue:
+            i = queue.popleft()
+            d = dist[i] + 1
+            for j in neighbors[i]:
+                if dist[j] == self.UNREACHABLE:
+                    dist[j] = d
+                    next_cell[j] = i  # Step from j back toward the source
+                    queue.append(j)
+
+    def lookup(self, x: float, y: float) -> Optional[Dict]:
+        """
+        Path info for a position: {"distance": pixels, "direction": (dx, dy)}.
+        Direction is None at a source cell; returns None if unreachable.
+        """
+        grid = self.grid
+        i = grid.cell_of(x, y)
+        d = self.dist[i]
+        if d == self.UNREACHABLE:
+            return None
+
+        direction = None
+        j = self.next_cell[i]
+        if j != self.UNREACHABLE:
+            cx, cy = grid.centers[i]
+            nx, ny = grid.centers[j]
+            direction = ((nx - cx) / grid.cell_size, (ny - cy) / grid.cell_size)
+        return {"distance": d * grid.cell_size, "direction": direction}
+
+
+class FlowFieldManager:
+    """Keeps the shared flow fields current and builds the context block."""
+
+    def __init__(self, walls: List):
+        self.grid = NavGrid(walls)
+        self.coin_field: Optional[FlowField] = None
+        self.tank_fields: Dict[int, FlowField] = {}
+        self.zone_field: Optional[FlowField] = None
+
+        # Source cells the current fields were built from
+        self._coin_cells = None
+        self._tank_cells: Dict[int, int] = {}
+        self._zone_cells = None
+
+    def _zone_key(self, zone) -> Tuple[int, int, int, int]:
+        """How many cell columns/rows on each side have their center in danger."""
+        grid = self.grid
+        xs = [grid.centers[c][0] for c in range(grid.cols)]
+        ys = [grid.centers[r * grid.cols][1] for r in range(grid.rows)]
+        return (sum(1 for x in xs if x < zone.margin),
+                sum(1 for x in xs if x > WORLD_WIDTH - zone.margin),
+                sum(1 for y in ys if y < zone.margin),
+                sum(1 for y in ys if y > WORLD_HEIGHT - zone.margin))
+
+    def update(self, engine):
+        """Recompute only the fields whose sources changed cell."""
+        grid = self.grid
+
+        # Coins (Mode 1)
+        if engine.game_mode == 1:
+            coin_cells = frozenset(grid.cell_of(c.x, c.y) for c in engine.coins if not c.collected)
+            if coin_cells != self._coin_cells:
+                self._coin_cells = coin_cells
+                self.coin_field = FlowField(grid, coin_cells) if coin_cells else None
+
+        # Each alive tank (enemy pursuit)
+        alive_ids = set()
+        for tank in engine.tanks:
+            if not tank.alive:
+                continue
+            alive_ids.add(tank.id)
+            cell = grid.cell_of(tank.x, tank.y)
+            if self._tank_cells.get(tank.id) != cell:
+                self._tank_cells[tank.id] = cell
+                self.tank_fields[tank.id] = FlowField(grid, (cell,))
+        for tank_id in list(self.tank_fields):
+            if tank_id not in alive_ids:
+                del self.tank_fields[tank_id]
+                del self._tank_cells[tank_id]
+
+        # Safe area inside the shrinking zone (Mode 2)
+        if engine.game_mode == 2:
+            key = self._zone_key(engine.zone)
+            if key != self._zone_cells:
+                self._zone_cells = key
+                safe = [i for i, (x, y) in enumerate(grid.centers)
+                        if not grid.blocked[i] and not engine.zone.is_in_danger(x, y)]
+                self.zone_field = FlowField(grid, safe) if safe else None
+
+    def context_for(self, tank) -> Dict:
+        """Navigation block for one bot: lookups at that tank's position."""
+        x, y = tank.x, tank.y
+        enemies = {}
+        for tank_id, field in self.tank_fields.items():
+            if tank_id != tank.id:
+                enemies[tank_id] = field.lookup(x, y)
+
+        return {
+            "cell_size": self.grid.cell_size,
+            "coins": self.coin_field.lookup(x, y) if self.coin_field else None,
+            "enemies": enemies,
+            "safe_zone": self.zone_field.lookup(x, y) if self.zone_field else None
+        }
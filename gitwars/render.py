@@ -0,0 +1,547 @@
+"""
+GitWars - Renderer (OPTIMIZED)
+==============================
+Draws a GitWarsEngine onto a pygame surface. The simulation never imports
+this module; only the windowed game (main.py) and viewers do.
+
+PERFORMANCE OPTIMIZED:
+- Pre-rendered glow and tank body surfaces (cached per color)
+- Danger zone pulses blitted from a shared set of quantized frames
+- Direct drawing instead of per-frame surface creation
+- Efficient trail rendering using pygame.draw.aalines
+- Glows and the Juggernaut spin are dropped when the quality governor
+  lowers gitwars.effects.quality
+- Only entities inside the camera view are drawn. When the camera zooms,
+  the visible part of the arena is drawn at world scale and scaled to the
+  window in one pass (zoom 1.0 draws straight to the window)
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from config import *
+from gitwars.effects import Camera, Particle, ParticleSystem, Trail, quality
+from gitwars.entities import Bullet, Coin, Tank, Wall
+from gitwars.hazards import DangerZone, Juggernaut, Laser, Zone
+
+# Culling margins: how far outside the view each kind can still show pixels
+TANK_DRAW_MARGIN = TANK_SIZE + 40                          # Barrel, health bar, name label
+BULLET_DRAW_MARGIN = BULLET_SPEED * BULLET_TRAIL_LENGTH + BULLET_SIZE * 2  # Trail
+PARTICLE_DRAW_MARGIN = 16
+
+# =============================================================================
+# PRE-RENDERED SURFACES (Performance Optimization)
+# =============================================================================
+
+# Create reusable glow surfaces at startup
+def create_glow_surface(size: int, color: Tuple[int, int, int], alpha: int = 100) -> pygame.Surface:
+    """Create a pre-rendered glow surface."""
+    surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color, alpha), (size, size), size)
+    return surf
+
+# Pre-render common glow sizes
+GLOW_CACHE: Dict[Tuple[int, Tuple[int, int, int]], pygame.Surface] = {}
+
+def get_glow_surface(size: int, color: Tuple[int, int, int], alpha: int = 100) -> pygame.Surface:
+    """Get or create a cached glow surface."""
+    key = (size, color, alpha)
+    if key not in GLOW_CACHE:
+        GLOW_CACHE[key] = create_glow_surface(size, color, alpha)
+    return GLOW_CACHE[key]
+
+# Tank body surfaces, shared by every tank of the same color
+TANK_BODY_CACHE: Dict[Tuple[int, int, int], pygame.Surface] = {}
+TANK_ROTATION_CACHE: Dict[Tuple[Tuple[int, int, int], int], pygame.Surface] = {}
+
+def get_tank_surface(color: Tuple[int, int, int], angle: float) -> pygame.Surface:
+    """Get the tank body for a color, rotated to the nearest 5 degrees."""
+    rounded_angle = round(angle / 5) * 5  # Round to 5 degrees
+    key = (color, rounded_angle % 360)
+    rotated = TANK_ROTATION_CACHE.get(key)
+    if rotated is None:
+        base = TANK_BODY_CACHE.get(color)
+        if base is None:
+            base = pygame.Surface((TANK_SIZE, TANK_SIZE), pygame.SRCALPHA)
+            pygame.draw.rect(base, color, (2, 2, TANK_SIZE - 4, TANK_SIZE - 4), border_radius=5)
+            pygame.draw.rect(base, (255, 255, 255), (2, 2, TANK_SIZE - 4, TANK_SIZE - 4), 2, border_radius=5)
+            TANK_BODY_CACHE[color] = base
+        rotated = pygame.transform.rotate(base, -rounded_angle)
+        TANK_ROTATION_CACHE[key] = rotated
+    return rotated
+
+# Danger zone animation frames, shared by every zone: the pulse level
+# (0 to 1) is quantized to DANGER_ZONE_FRAME_STEPS frames per phase.
+DANGER_ZONE_FRAME_CACHE: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+def create_danger_zone_frame(phase: int, radius: int, level: float) -> pygame.Surface:
+    """Render one danger zone frame at a pulse level between 0 and 1."""
+    size = radius * 2 + 20
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = (radius + 10, radius + 10)
+
+    if phase == DangerZone.PHASE_WARNING:
+        # Pulsing warning circle
+        alpha = int(50 + level * 100)  # 50 to 150
+        pygame.draw.circle(surf, (255, 50, 50, alpha), center, radius)
+        pygame.draw.circle(surf, (255, 100, 100, alpha + 50), center, radius, 4)
+
+        # Draw "X" crosshair
+        cross_alpha = int(100 + level * 100)
+        pygame.draw.line(surf, (255, 0, 0, cross_alpha),
+                         (center[0] - radius, center[1]), (center[0] + radius, center[1]), 2)
+        pygame.draw.line(surf, (255, 0, 0, cross_alpha),
+                         (center[0], center[1] - radius), (center[0], center[1] + radius), 2)
+    else:
+        # Flashing active zone
+        alpha = int(100 + level * 80)
+        pygame.draw.circle(surf, (255, 150 + int(level * 100), 150, alpha), center, radius)
+        pygame.draw.circle(surf, (255, 255, 255, alpha), center, radius, 3)
+
+    return surf
+
+def get_danger_zone_frame(phase: int, radius: int, level: float) -> pygame.Surface:
+    """Get or create the cached frame nearest to a pulse level."""
+    step = round(level * (DANGER_ZONE_FRAME_STEPS - 1))
+    key = (phase, radius, step)
+    frame = DANGER_ZONE_FRAME_CACHE.get(key)
+    if frame is None:
+        frame = create_danger_zone_frame(phase, radius, step / (DANGER_ZONE_FRAME_STEPS - 1))
+        DANGER_ZONE_FRAME_CACHE[key] = frame
+    return frame
+
+def create_juggernaut_surface() -> pygame.Surface:
+    """Pre-render the saw-blade body surface."""
+    radius = JUGGERNAUT_SIZE // 2
+    size = JUGGERNAUT_SIZE + 20
+    surf = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = size // 2
+
+    # Outer glow
+    pygame.draw.circle(surf, (*JUGGERNAUT_COLOR, 80), (center, center), radius + 10)
+
+    # Main body
+    pygame.draw.circle(surf, JUGGERNAUT_COLOR, (center, center), radius)
+
+    # Saw-blade teeth (8 triangular notches)
+    for i in range(8):
+        angle = i * (math.pi / 4)
+        # Outer point
+        ox = center + math.cos(angle) * (radius + 15)
+        oy = center + math.sin(angle) * (radius + 15)
+        # Inner points
+        a1 = angle - 0.2
+        a2 = angle + 0.2
+        ix1 = center + math.cos(a1) * (radius - 5)
+        iy1 = center + math.sin(a1) * (radius - 5)
+        ix2 = center + math.cos(a2) * (radius - 5)
+        iy2 = center + math.sin(a2) * (radius - 5)
+        pygame.draw.polygon(surf, JUGGERNAUT_BLADE_COLOR, [(ox, oy), (ix1, iy1), (ix2, iy2)])
+
+    # Inner ring
+    pygame.draw.circle(surf, (100, 30, 30), (center, center), radius // 2)
+    pygame.draw.circle(surf, (60, 15, 15), (center, center), radius // 3)
+    return surf
+
+# =============================================================================
+# ENTITY DRAWING
+# =============================================================================
+
+def draw_particle(surface: pygame.Surface, camera: Camera, particle: Particle):
+    """Draw the particle - OPTIMIZED: direct drawing."""
+    if particle.alpha <= 0 or particle.size < 1:
+        return
+
+    pos = camera.apply((particle.x, particle.y))
+    size = max(1, int(particle.size))
+
+    # OPTIMIZED: Draw directly instead of creating surfaces
+    # Use color brightness to simulate alpha fade
+    fade = particle.alpha / 255.0
+    faded_color = (
+        int(particle.color[0] * fade),
+        int(particle.color[1] * fade),
+        int(particle.color[2] * fade)
+    )
+    pygame.draw.rect(surface, faded_color, (pos[0] - size, pos[1] - size, size * 2, size * 2))
+
+def draw_particles(surface: pygame.Surface, camera: Camera, particles: ParticleSystem):
+    """Draw all particles inside the view."""
+    for particle in particles.particles:
+        if camera.sees(particle.x, particle.y, PARTICLE_DRAW_MARGIN):
+            draw_particle(surface, camera, particle)
+
+def draw_trail(surface: pygame.Surface, camera: Camera, trail: Trail):
+    """Draw the fading trail - OPTIMIZED: single polyline."""
+    if len(trail.positions) < 2:
+        return
+
+    # OPTIMIZED: Draw as connected lines with direct pygame.draw
+    # No surface creation!
+    points = [camera.apply(pos) for pos in trail.positions]
+
+    # Draw trail as anti-aliased lines (hardware accelerated)
+    pygame.draw.aalines(surface, trail.color, False, points)
+
+def draw_bullet(surface: pygame.Surface, camera: Camera, bullet: Bullet):
+    """Draw bullet and trail - OPTIMIZED."""
+    # Draw trail first
+    draw_trail(surface, camera, bullet.trail)
+
+    # Draw bullet - OPTIMIZED: direct drawing
+    pos = camera.apply((bullet.x, bullet.y))
+
+    # Glow effect - simple larger circle (dropped under load)
+    if quality.glows:
+        glow_size = BULLET_SIZE * 2 if bullet.is_critical else BULLET_SIZE + 2
+        glow_color = tuple(max(0, c - 100) for c in bullet.color)  # Darker glow
+        pygame.draw.circle(surface, glow_color, pos, glow_size)
+
+    # Core
+    pygame.draw.circle(surface, bullet.color, pos, BULLET_SIZE)
+    pygame.draw.circle(surface, (255, 255, 255), pos, BULLET_SIZE // 2)
+
+def draw_tank(surface: pygame.Surface, camera: Camera, tank: Tank, name_font: pygame.font.Font):
+    """Draw the tank - OPTIMIZED."""
+    if not tank.alive:
+        return
+
+    pos = camera.apply((tank.x, tank.y))
+
+    # OPTIMIZED: Simple glow circle (no surface creation)
+    if quality.glows:
+        glow_color = tuple(max(0, c - 180) for c in tank.color)
+        pygame.draw.circle(surface, glow_color, pos, TANK_SIZE)
+
+    # OPTIMIZED: Cached rotated body (shared per color)
+    rotated = get_tank_surface(tank.color, tank.angle)
+    rect = rotated.get_rect(center=pos)
+    surface.blit(rotated, rect)
+
+    # Barrel
+    barrel_end_x = pos[0] + math.cos(math.radians(tank.angle)) * (TANK_SIZE / 2 + 10)
+    barrel_end_y = pos[1] + math.sin(math.radians(tank.angle)) * (TANK_SIZE / 2 + 10)
+    pygame.draw.line(surface, tank.color, pos, (int(barrel_end_x), int(barrel_end_y)), 6)
+    pygame.draw.line(surface, (255, 255, 255), pos, (int(barrel_end_x), int(barrel_end_y)), 2)
+
+    # Muzzle flash - OPTIMIZED: simple circle
+    if tank.muzzle_flash_timer > 0:
+        pygame.draw.circle(surface, (255, 255, 200), (int(barrel_end_x), int(barrel_end_y)), MUZZLE_FLASH_SIZE // 2)
+
+    # Health bar (always show)
+    bar_width = TANK_SIZE
+    bar_height = 6
+    bar_x = pos[0] - bar_width // 2
+    bar_y = pos[1] - TANK_SIZE // 2 - 15
+
+    max_hp = getattr(tank, 'max_health', TANK_MAX_HEALTH)
+    pygame.draw.rect(surface, COLOR_HEALTH_BG, (bar_x, bar_y, bar_width, bar_height))
+    health_width = int(bar_width * (tank.health / max_hp))
+    health_color = COLOR_HEALTH_BAR if tank.health > (max_hp * 0.3) else COLOR_DANGER
+    pygame.draw.rect(surface, health_color, (bar_x, bar_y, health_width, bar_height))
+
+    # Jam indicator
+    if tank.is_jammed:
+        # Use a simple rect indicator instead of text (text is expensive)
+        pygame.draw.rect(surface, COLOR_DANGER, (pos[0] - 15, pos[1] + TANK_SIZE // 2 + 5, 30, 5))
+
+    # Team name label below tank
+    if getattr(tank, 'team_name', None):
+        name_surface = name_font.render(tank.team_name, True, (200, 200, 200))
+        name_rect = name_surface.get_rect(center=(pos[0], pos[1] + TANK_SIZE // 2 + 18))
+        surface.blit(name_surface, name_rect)
+
+def draw_coin(surface: pygame.Surface, camera: Camera, coin: Coin):
+    """Draw coin - OPTIMIZED: direct drawing."""
+    if coin.collected:
+        return
+
+    pos = camera.apply((coin.x, coin.y))
+
+    # Pulsing glow - simple circles
+    if quality.glows:
+        pulse = abs(math.sin(coin.pulse_phase))
+        glow_size = int(COIN_SIZE // 2 + pulse * 5)
+
+        # Outer glow (darker gold)
+        pygame.draw.circle(surface, (180, 150, 0), pos, glow_size)
+
+    # Coin core
+    pygame.draw.circle(surface, COLOR_GOLD, pos, COIN_SIZE // 2)
+    pygame.draw.circle(surface, (255, 255, 200), pos, COIN_SIZE // 4)
+
+def draw_wall(surface: pygame.Surface, camera: Camera, wall: Wall):
+    """Draw wall - OPTIMIZED: direct drawing."""
+    pos = camera.apply((wall.x, wall.y))
+
+    # Wall (no glow surface - direct draw)
+    pygame.draw.rect(surface, WALL_GLOW_COLOR, (pos[0] - 3, pos[1] - 3, wall.width + 6, wall.height + 6))
+    pygame.draw.rect(surface, WALL_COLOR, (pos[0], pos[1], wall.width, wall.height))
+    pygame.draw.rect(surface, (255, 255, 255), (pos[0], pos[1], wall.width, wall.height), 2)
+
+def draw_zone(surface: pygame.Surface, camera: Camera, zone: Zone):
+    """Draw the danger zone - OPTIMIZED."""
+    if zone.margin <= 0:
+        return
+
+    margin = int(zone.margin)
+    ox, oy = camera.apply((0, 0))  # Arena origin in the view
+
+    # OPTIMIZED: Draw danger zone as rectangles directly (no surface)
+    danger_color = (150, 0, 0)
+
+    # Draw the 4 edge rectangles
+    pygame.draw.rect(surface, danger_color, (ox, oy, WORLD_WIDTH, margin))  # Top
+    pygame.draw.rect(surface, danger_color, (ox, oy + WORLD_HEIGHT - margin, WORLD_WIDTH, margin))  # Bottom
+    pygame.draw.rect(surface, danger_color, (ox, oy, margin, WORLD_HEIGHT))  # Left
+    pygame.draw.rect(surface, danger_color, (ox + WORLD_WIDTH - margin, oy, margin, WORLD_HEIGHT))  # Right
+
+    # Warning line
+    pygame.draw.rect(surface, COLOR_DANGER, (ox + margin, oy + margin,
+                    WORLD_WIDTH - 2 * margin, WORLD_HEIGHT - 2 * margin), 3)
+
+def draw_laser(surface: pygame.Surface, camera: Camera, laser: Laser):
+    """Draw the laser beam - OPTIMIZED."""
+    if not laser.active:
+        return
+
+    laser_x, top = camera.apply((laser.x, 0))
+    bottom = top + WORLD_HEIGHT
+
+    # OPTIMIZED: Simple lines instead of surfaces
+    pygame.draw.line(surface, (100, 0, 0), (laser_x - 10, top), (laser_x - 10, bottom), 8)
+    pygame.draw.line(surface, (200, 0, 0), (laser_x - 3, top), (laser_x - 3, bottom), 4)
+    pygame.draw.line(surface, (255, 255, 255), (laser_x, top), (laser_x, bottom), 2)
+    pygame.draw.line(surface, (200, 0, 0), (laser_x + 3, top), (laser_x + 3, bottom), 4)
+    pygame.draw.line(surface, (100, 0, 0), (laser_x + 10, top), (laser_x + 10, bottom), 8)
+
+def draw_danger_zone(surface: pygame.Surface, camera: Camera, dz: DangerZone):
+    """Draw the danger zone by blitting its shared pre-rendered pulse frame."""
+    if dz.phase == DangerZone.PHASE_WARNING:
+        level = (math.sin(dz.pulse_time) + 1) / 2  # 0 to 1
+    elif dz.phase == DangerZone.PHASE_ACTIVE:
+        level = (math.sin(dz.pulse_time * 3) + 1) / 2
+    else:
+        return
+
+    pos = camera.apply((dz.x, dz.y))
+    frame = get_danger_zone_frame(dz.phase, dz.radius, level)
+    surface.blit(frame, (pos[0] - dz.radius - 10, pos[1] - dz.radius - 10))
+
+def draw_juggernaut(surface: pygame.Surface, camera: Camera, jugg: Juggernaut,
+                    body_surface: pygame.Surface):
+    """Draw the Juggernaut with spinning effect."""
+    pos = camera.apply((jugg.x, jugg.y))
+
+    # Rotate and blit body (the spin is skipped under load)
+    rotated_body = pygame.transform.rotate(body_surface, -jugg.rotation) if quality.spin else body_surface
+    body_rect = rotated_body.get_rect(center=pos)
+    surface.blit(rotated_body, body_rect)
+
+    # Draw turret on top
+    turret_len = JUGGERNAUT_TURRET_SIZE
+    angle_rad = math.radians(jugg.target_angle)
+    tx = pos[0] + math.cos(angle_rad) * turret_len
+    ty = pos[1] + math.sin(angle_rad) * turret_len
+
+    # Turret color changes during charge/burst
+    if jugg.weapon_phase == Juggernaut.PHASE_CHARGE:
+        # Flashing warning glow
+        flash = abs(math.sin(jugg.weapon_timer * 10))
+        turret_color = (255, int(100 + flash * 155), int(flash * 100))
+    elif jugg.weapon_phase == Juggernaut.PHASE_BURST:
+        turret_color = (255, 255, 200)  # Bright during firing
+    else:
+        turret_color = (150, 50, 50)
+
+    pygame.draw.line(surface, turret_color, pos, (tx, ty), 8)
+    pygame.draw.circle(surface, turret_color, (int(tx), int(ty)), 6)
+
+# =============================================================================
+# RENDERER
+# =============================================================================
+
+class Renderer:
+    """Draws the whole engine state: arena, entities, UI and overlays."""
+
+    def __init__(self, screen: pygame.Surface):
+        self.screen = screen
+
+        # Fonts - pre-load once
+        self.font_large = pygame.font.Font(None, 72)
+        self.font_medium = pygame.font.Font(None, 48)
+        self.font_small = pygame.font.Font(None, 32)
+        self.font_name = pygame.font.Font(None, 20)
+
+        # Pre-render static text
+        self._mode_titles = {
+            1: self.font_medium.render("THE SCRAMBLE", True, COLOR_TEXT),
+            2: self.font_medium.render("THE LABYRINTH", True, COLOR_TEXT),
+            3: self.font_medium.render("THE JUGGERNAUT", True, COLOR_TEXT)
+        }
+
+        # Shared surfaces
+        self._juggernaut_surface = create_juggernaut_surface()
+
+        # World-scale drawing target for zoomed views (grown on demand)
+        self._view_surface: Optional[pygame.Surface] = None
+
+    def _view_target(self, camera: Camera) -> pygame.Surface:
+        """Surface the visible arena is drawn on before scaling to the window."""
+        size = (math.ceil(camera.world_width), math.ceil(camera.world_height))
+        view = self._view_surface
+        if view is None or view.get_width() < size[0] or view.get_height() < size[1]:
+            grown = (max(size[0], view.get_width() if view else 0),
+                     max(size[1], view.get_height() if view else 0))
+            view = self._view_surface = pygame.Surface(grown, 0, self.screen)
+        return view.subsurface((0, 0, *size))
+
+    def draw_background(self, surface: pygame.Surface, camera: Camera):
+        """Draw the neon grid background (visible lines only)."""
+        surface.fill(COLOR_BACKGROUND)
+
+        # Grid lines on arena multiples of GRID_CELL_SIZE inside the view
+        ox, oy = camera.apply((0, 0))
+        x_start = max(0, int(camera.left // GRID_CELL_SIZE) * GRID_CELL_SIZE)
+        x_end = min(WORLD_WIDTH, camera.left + camera.world_width)
+        y_start = max(0, int(camera.top // GRID_CELL_SIZE) * GRID_CELL_SIZE)
+        y_end = min(WORLD_HEIGHT, camera.top + camera.world_height)
+        for x in range(x_start, int(x_end) + 1, GRID_CELL_SIZE):
+            pygame.draw.line(surface, COLOR_GRID, (ox + x, oy), (ox + x, oy + WORLD_HEIGHT), 1)
+        for y in range(y_start, int(y_end) + 1, GRID_CELL_SIZE):
+            pygame.draw.line(surface, COLOR_GRID, (ox, oy + y), (ox + WORLD_WIDTH, oy + y), 1)
+
+    def draw_ui(self, engine, fps: Optional[float] = None):
+        """Draw the game UI."""
+        # Mode title (pre-rendered)
+        title = self._mode_titles.get(engine.game_mode)
+        if title:
+            self.screen.blit(title, (20, 20))
+
+        # Timer
+        if engine.game_mode in [1, 3]:
+            mins = int(engine.game_timer // 60)
+            secs = int(engine.game_timer % 60)
+            timer_text = self.font_medium.render(f"{mins}:{secs:02d}", True, COLOR_TEXT)
+            self.screen.blit(timer_text, (SCREEN_WIDTH - 120, 20))
+
+        # Scoreboard (Mode 1)
+        if engine.game_mode == 1:
+            sorted_tanks = sorted(engine.tanks, key=lambda t: t.coins, reverse=True)
+            y_offset = 80
+            for i, tank in enumerate(sorted_tanks[:5]):
+                color = tank.color if tank.alive else (100, 100, 100)
+                name = getattr(tank, 'team_name', f'Tank_{tank.id}')
+                score_text = self.font_small.render(f"{name}: {tank.coins}", True, color)
+                self.screen.blit(score_text, (20, y_offset + i * 30))
+
+        # Alive count (Mode 2)
+        if engine.game_mode == 2:
+            alive = sum(1 for t in engine.tanks if t.alive)
+            alive_text = self.font_small.render(f"Alive: {alive}", True, COLOR_TEXT)
+            self.screen.blit(alive_text, (SCREEN_WIDTH - 120, 20))
+
+            # Kill feed messages (fading death notifications)
+            y_offset = 60
+            for i, msg in enumerate(engine.kill_feed[:5]):  # Show max 5 messages
+                if msg["alpha"] > 0:
+                    alpha = msg["alpha"]
+                    text_surface = self.font_small.render(msg["text"], True, (255, 80, 80))
+                    text_surface.set_alpha(alpha)
+                    self.screen.blit(text_surface, (SCREEN_WIDTH - text_surface.get_width() - 20, y_offset + i * 28))
+
+        # FPS
+        if SHOW_FPS and fps is not None:
+            fps_text = self.font_small.render(f"FPS: {int(fps)}", True, COLOR_GRID_ACCENT)
+            self.screen.blit(fps_text, (SCREEN_WIDTH - 100, SCREEN_HEIGHT - 30))
+
+    def draw_game_over(self, engine):
+        """Draw game over screen."""
+        # Darken background - simple rect
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        overlay.fill((0, 0, 0))
+        overlay.set_alpha(180)
+        self.screen.blit(overlay, (0, 0))
+
+        # Winner text
+        lines = engine.winner_text.split('\n')
+        y_offset = SCREEN_HEIGHT // 2 - len(lines) * 25
+
+        for i, line in enumerate(lines):
+            font = self.font_large if i == 0 else self.font_medium
+            text = font.render(line, True, COLOR_GOLD if i == 0 else COLOR_TEXT)
+            x = SCREEN_WIDTH // 2 - text.get_width() // 2
+            self.screen.blit(text, (x, y_offset + i * 50))
+
+        # Restart hint
+        hint = self.font_small.render("Press R to restart | ESC to quit", True, COLOR_GRID_ACCENT)
+        self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, SCREEN_HEIGHT - 50))
+
+    def draw_world(self, surface: pygame.Surface, engine):
+        """Draw the arena and every entity inside the camera view."""
+        camera = engine.camera
+        self.draw_background(surface, camera)
+
+        # Draw zone (Mode 2)
+        if engine.game_mode == 2:
+            draw_zone(surface, camera, engine.zone)
+            # Draw danger zones (Orbital Strikes)
+            for dz in engine.danger_zones:
+                if camera.sees(dz.x, dz.y, dz.radius + 10):
+                    draw_danger_zone(surface, camera, dz)
+
+        # Draw walls
+        for wall in engine.walls:
+            if camera.sees_rect(wall.x - 3, wall.y - 3, wall.width + 6, wall.height + 6):
+                draw_wall(surface, camera, wall)
+
+        # Draw coins
+        for coin in engine.coins:
+            if camera.sees(coin.x, coin.y, COIN_SIZE):
+                draw_coin(surface, camera, coin)
+
+        # Draw bullets
+        for bullet in engine.bullets:
+            if camera.sees(bullet.x, bullet.y, BULLET_DRAW_MARGIN):
+                draw_bullet(surface, camera, bullet)
+
+        # Draw tanks
+        for tank in engine.tanks:
+            if not camera.sees(tank.x, tank.y, TANK_DRAW_MARGIN):
+                continue
+            draw_tank(surface, camera, tank, self.font_name)
+
+            # Show LAG PENALTY text if bot exceeded timeout
+            if tank.last_action == "LAG":
+                pos = camera.apply((tank.x, tank.y - 50))
+                lag_txt = self.font_small.render("LAG PENALTY!", True, (255, 50, 50))
+                surface.blit(lag_txt, (pos[0] - lag_txt.get_width() // 2, pos[1]))
+
+        # Draw particles (on top)
+        draw_particles(surface, camera, engine.particles)
+
+        # Draw Juggernaut (Mode 3)
+        jugg = engine.juggernaut
+        if engine.game_mode == 3 and jugg and camera.sees(jugg.x, jugg.y, JUGGERNAUT_SIZE):
+            draw_juggernaut(surface, camera, jugg, self._juggernaut_surface)
+
+    def draw(self, engine, fps: Optional[float] = None):
+        """Draw everything (does not flip the display)."""
+        camera = engine.camera
+        camera.follow(engine.tanks)
+
+        if camera.zoom == 1.0:
+            self.draw_world(self.screen, engine)
+        else:
+            view = self._view_target(camera)
+            self.draw_world(view, engine)
+            pygame.transform.scale(view, self.screen.get_size(), self.screen)
+
+        # Draw UI
+        self.draw_ui(engine, fps)
+
+        # Draw game over
+        if engine.game_over:
+            self.draw_game_over(engine)
@@ -0,0 +1,138 @@
+"""
+GitWars - Replay Files
+======================
+Seekable match recordings built from gitwars.snapshot records.
+
+File layout (little-endian):
+
+    HEADER | RECORD x frame_count | INDEX | FOOTER
+
+    HEADER  magic b"GWRP", version, keyframe interval, fps
+    RECORD  kind | length | zlib(JSON) - a keyframe every keyframe_interval
+            frames (frame % interval == 0), deltas in between
+    INDEX   one uint64 file offset per frame
+    FOOTER  index offset, frame count, magic b"GWRI"
+
+ReplayReader memory-maps the file. Seeking to frame n reads the index
+entry of the keyframe at or before n and applies at most keyframe_interval - 1
+deltas. The cost does not depend on how long the match is. Stepping forward
+from the last frame read only applies one delta.
+"""
+
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional
+
+from config import *
+from gitwars.snapshot import DELTA, KEYFRAME, RECORD, apply_delta, decode_body, diff, encode
+
+MAGIC = b"GWRP"
+INDEX_MAGIC = b"GWRI"
+VERSION = 1
+
+# magic, version, keyframe_interval, fps
+HEADER = struct.Struct("<4sHHH")
+# index_offset, frame_count, magic
+FOOTER = struct.Struct("<QI4s")
+INDEX_ENTRY = struct.Struct("<Q")
+
+# =============================================================================
+# WRITER
+# =============================================================================
+
+class ReplayWriter:
+    """Appends one snapshot per frame; the index is written on close()."""
+
+    def __init__(self, path: str, keyframe_interval: int = REPLAY_KEYFRAME_INTERVAL, fps: int = FPS):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.file = open(path, "wb")
+        self.keyframe_interval = keyframe_interval
+        self.offsets: List[int] = []
+        self.last_state: Optional[Dict] = None
+        self.file.write(HEADER.pack(MAGIC, VERSION, keyframe_interval, fps))
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.offsets)
+
+    def add_frame(self, state: Dict):
+        """Append a captured frame (keyframe or delta, by frame number)."""
+        frame = len(self.offsets)
+        self.offsets.append(self.file.tell())
+        if frame % self.keyframe_interval == 0:
+            self.file.write(encode(KEYFRAME, state))
+        else:
+            self.file.write(encode(DELTA, diff(self.last_state, state)))
+        self.last_state = state
+
+    def close(self):
+        """Write the index and footer."""
+        if self.file.closed:
+            return
+        index_offset = self.file.tell()
+        for offset in self.offsets:
+            self.file.write(INDEX_ENTRY.pack(offset))
+        self.file.write(FOOTER.pack(index_offset, self.frame_count, INDEX_MAGIC))
+        self.file.close()
+
+# =============================================================================
+# READER
+# =============================================================================
+
+class ReplayReader:
+    """Random access to the frames of a replay file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.keyframe_interval, self.fps = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a GitWars replay (v{VERSION})")
+
+        self.index_offset, self.frame_count, index_magic = FOOTER.unpack_from(
+            self.data, len(self.data) - FOOTER.size)
+        if index_magic != INDEX_MAGIC:
+            raise ValueError(f"{path} has no index (recording was not closed)")
+
+        # Last decoded frame, so stepping forward costs one delta
+        self._cached_frame = -1
+        self._cached_state: Optional[Dict] = None
+
+    def _record(self, frame: int):
+        """(kind, payload) of one frame's record."""
+        offset, = INDEX_ENTRY.unpack_from(self.data, self.index_offset + frame * INDEX_ENTRY.size)
+        kind, length = RECORD.unpack_from(self.data, offset)
+        start = offset + RECORD.size
+        return kind, decode_body(self.data[start:start + length])
+
+    def state_at(self, frame: int) -> Dict:
+        """Full state of a frame (clamped to the recording)."""
+        if self.frame_count == 0:
+            raise ValueError(f"{self.path} has no frames")
+        frame = max(0, min(self.frame_count - 1, frame))
+        keyframe = frame - frame % self.keyframe_interval
+
+        if keyframe <= self._cached_frame <= frame:
+            # Continue from the cached frame in the same keyframe block
+            current, state = self._cached_frame, self._cached_state
+        else:
+            _, state = self._record(keyframe)
+            current = keyframe
+
+        while current < frame:
+            current += 1
+            _, delta = self._record(current)
+            state = apply_delta(state, delta)
+
+        self._cached_frame, self._cached_state = frame, state
+        return state
+
+    def close(self):
+        self.data.close()
+        self._file.close()
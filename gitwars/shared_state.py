@@ -0,0 +1,331 @@
+"""
+GitWars - Shared-Memory World State
+===================================
+Publishes the per-frame world state into a multiprocessing.shared_memory
+block so out-of-process bot workers can read it without pickling.
+
+The engine owns a single WorldStatePublisher, named SHARED_STATE_NAME plus
+the engine's PID by default so several engines can run side by side; it
+hands publisher.name to its workers. Every frame it packs tanks,
+bullets, coins, walls, sensors, clearance and the Juggernaut into a fixed
+binary layout and bumps a sequence number. Workers attach a WorldStateView
+(read-only) and rebuild the familiar context dict for their own tank.
+
+Not published: the engine's per-bot analysis (enemies[].visible, threats,
+navigation). Workers that want it derive it from walls and bullets.
+Bullets and coins keep their stable ids, so delta-mode bots can run out of
+process too.
+
+Transfer cost per frame is one pack into the block, no matter how many
+workers are attached.
+
+Layout (little-endian, offsets fixed by the capacities below):
+
+    HEADER | TANKS[max_tanks] | BULLETS[max_bullets] | COINS[max_coins] | WALLS[max_walls]
+
+The header also records the four capacities, so a reader built with a
+different layout refuses to attach instead of reading garbage.
+
+The sequence number works as a seqlock: it is odd while the writer is
+packing and even once the frame is complete. Readers retry until they see
+the same even value before and after copying.
+"""
+
+import os
+import struct
+from multiprocessing import shared_memory
+from typing import Dict, Optional
+
+from config import (
+    SHARED_STATE_NAME,
+    SHARED_STATE_MAX_TANKS,
+    SHARED_STATE_MAX_BULLETS,
+    SHARED_STATE_MAX_COINS,
+    SHARED_STATE_MAX_WALLS,
+)
+
+# =============================================================================
+# BINARY LAYOUT
+# =============================================================================
+
+MAGIC = b"GWSS"
+LAYOUT_VERSION = 3
+
+# magic, version, flags, seq, frame, game_mode, time_left,
+# n_tanks, n_bullets, n_coins, n_walls,
+# juggernaut present, x, y, radius, weapon_phase, target_angle,
+# max_tanks, max_bullets, max_coins, max_walls
+HEADER = struct.Struct("<4sHHQQidIIIIidddidIIII")
+
+# id, alive, x, y, angle, health, ammo, coins, sensor front/left/right, clearance
+TANK = struct.Struct("<iiddddiidddd")
+
+# owner_id, id, x, y, vx, vy
+BULLET = struct.Struct("<iidddd")
+
+# id, pad, x, y
+COIN = struct.Struct("<iidd")
+
+# x, y, width, height
+WALL = struct.Struct("<dddd")
+
+# Offset of the sequence number inside the header (after magic/version/flags)
+SEQ = struct.Struct("<Q")
+SEQ_OFFSET = 8
+
+# Capacities at the end of the header
+CAPACITIES = struct.Struct("<IIII")
+CAPACITIES_OFFSET = HEADER.size - CAPACITIES.size
+
+
+def block_size(max_tanks: int = SHARED_STATE_MAX_TANKS,
+               max_bullets: int = SHARED_STATE_MAX_BULLETS,
+               max_coins: int = SHARED_STATE_MAX_COINS,
+               max_walls: int = SHARED_STATE_MAX_WALLS) -> int:
+    """Total size in bytes of a world-state block with the given capacities."""
+    return (HEADER.size + TANK.size * max_tanks + BULLET.size * max_bullets +
+            COIN.size * max_coins + WALL.size * max_walls)
+
+
+def _offsets(max_tanks: int, max_bullets: int, max_coins: int) -> Dict[str, int]:
+    """Start offset of each record section."""
+    tanks = HEADER.size
+    bullets = tanks + TANK.size * max_tanks
+    coins = bullets + BULLET.size * max_bullets
+    walls = coins + COIN.size * max_coins
+    return {"tanks": tanks, "bullets": bullets, "coins": coins, "walls": walls}
+
+
+# =============================================================================
+# WRITER (Engine side)
+# =============================================================================
+
+class WorldStatePublisher:
+    """Packs the engine's world state into shared memory once per frame."""
+
+    def __init__(self, name: Optional[str] = None,
+                 max_tanks: int = SHARED_STATE_MAX_TANKS,
+                 max_bullets: int = SHARED_STATE_MAX_BULLETS,
+                 max_coins: int = SHARED_STATE_MAX_COINS,
+                 max_walls: int = SHARED_STATE_MAX_WALLS):
+        if name is None:
+            name = f"{SHARED_STATE_NAME}_{os.getpid()}"
+        self.max_tanks = max_tanks
+        self.max_bullets = max_bullets
+        self.max_coins = max_coins
+        self.max_walls = max_walls
+        self.offsets = _offsets(max_tanks, max_bullets, max_coins)
+
+        size = block_size(max_tanks, max_bullets, max_coins, max_walls)
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Never take over a block that may belong to a live engine
+            raise FileExistsError(f"World-state block {name} already exists "
+                                  f"(another engine is publishing under that name)") from None
+
+        self.name = self.shm.name
+        self.seq = 0
+        self.frame = 0
+        self._write_header(0, 0, 0.0, (0, 0, 0, 0), None)
+
+    def _write_header(self, game_mode: int, frame: int, time_left: float,
+                      counts: tuple, juggernaut: Optional[Dict]):
+        """Pack the header (sequence number is written separately)."""
+        if juggernaut:
+            jugg = (1, juggernaut["x"], juggernaut["y"], juggernaut["radius"],
+                    juggernaut["weapon_phase"], juggernaut["target_angle"])
+        else:
+            jugg = (0, 0.0, 0.0, 0.0, 0, 0.0)
+        HEADER.pack_into(self.shm.buf, 0, MAGIC, LAYOUT_VERSION, 0, self.seq,
+                         frame, game_mode, time_left, *counts, *jugg,
+                         self.max_tanks, self.max_bullets, self.max_coins, self.max_walls)
+
+    def publish(self, engine, sensors: Dict[int, Dict[str, float]],
+                clearances: Optional[Dict[int, float]] = None):
+        """
+        Write one frame of world state.
+
+        `sensors` maps tank id -> sensor readings and `clearances` tank id ->
+        free space to the nearest wall, so the engine can reuse the ones it
+        already computed for in-process bots.
+        """
+        buf = self.shm.buf
+        offsets = self.offsets
+
+        # Mark frame as in-progress (odd sequence)
+        self.seq += 1
+        SEQ.pack_into(buf, SEQ_OFFSET, self.seq)
+
+        no_sensors = {"front": 0.0, "left": 0.0, "right": 0.0}
+        clearances = clearances or {}
+        tanks = engine.tanks[:self.max_tanks]
+        for i, tank in enumerate(tanks):
+            s = sensors.get(tank.id, no_sensors)
+            TANK.pack_into(buf, offsets["tanks"] + i * TANK.size,
+                           tank.id, int(tank.alive), tank.x, tank.y, tank.angle,
+                           tank.health, tank.ammo, tank.coins,
+                           s["front"], s["left"], s["right"], clearances.get(tank.id, 0.0))
+
+        bullets = engine.bullets[:self.max_bullets]
+        for i, bullet in enumerate(bullets):
+            BULLET.pack_into(buf, offsets["bullets"] + i * BULLET.size,
+                             bullet.owner_id, bullet.id, bullet.x, bullet.y, bullet.vx, bullet.vy)
+
+        coins = [c for c in engine.coins if not c.collected][:self.max_coins]
+        for i, coin in enumerate(coins):
+            COIN.pack_into(buf, offsets["coins"] + i * COIN.size, coin.id, 0, coin.x, coin.y)
+
+        walls = engine.walls[:self.max_walls]
+        for i, wall in enumerate(walls):
+            WALL.pack_into(buf, offsets["walls"] + i * WALL.size,
+                           wall.x, wall.y, wall.width, wall.height)
+
+        juggernaut = None
+        if engine.juggernaut and engine.game_mode == 3:
+            juggernaut = engine.juggernaut.get_context_data()
+
+        self.frame += 1
+        self._write_header(engine.game_mode, self.frame, engine.game_timer,
+                           (len(tanks), len(bullets), len(coins), len(walls)), juggernaut)
+
+        # Frame complete (even sequence)
+        self.seq += 1
+        SEQ.pack_into(buf, SEQ_OFFSET, self.seq)
+
+    def close(self):
+        """Release and remove the shared block."""
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# =============================================================================
+# READER (Bot worker side)
+# =============================================================================
+
+class WorldSnapshot:
+    """A consistent copy of one published frame."""
+
+    def __init__(self, data: bytes, offsets: Dict[str, int]):
+        header = HEADER.unpack_from(data, 0)
+        (_, _, _, self.seq, self.frame, self.game_mode, self.time_left,
+         n_tanks, n_bullets, n_coins, n_walls,
+         has_jugg, jx, jy, jr, jphase, jangle, *_) = header
+
+        self.tanks = [TANK.unpack_from(data, offsets["tanks"] + i * TANK.size)
+                      for i in range(n_tanks)]
+        self.bullets = [BULLET.unpack_from(data, offsets["bullets"] + i * BULLET.size)
+                        for i in range(n_bullets)]
+        self.coins = [COIN.unpack_from(data, offsets["coins"] + i * COIN.size)
+                      for i in range(n_coins)]
+        self.walls = [WALL.unpack_from(data, offsets["walls"] + i * WALL.size)
+                      for i in range(n_walls)]
+        self.juggernaut = None
+        if has_jugg:
+            self.juggernaut = {"x": jx, "y": jy, "radius": jr,
+                               "weapon_phase": jphase, "target_angle": jangle}
+
+    def context_for(self, tank_id: int) -> Optional[Dict]:
+        """
+        Build the context dict GitWarsEngine.build_context produces, without
+        the keys that are not published: enemies[].visible, threats and
+        navigation.
+        """
+        me = None
+        enemies = []
+        for (tid, alive, x, y, angle, health, ammo, coins,
+             front, left, right, clearance) in self.tanks:
+            if tid == tank_id:
+                me = {"x": x, "y": y, "angle": angle, "health": health,
+                      "ammo": ammo, "coins": coins}
+                sensors = {"front": front, "left": left, "right": right}
+                my_clearance = clearance
+            elif alive:
+                enemies.append({"x": x, "y": y, "id": tid})
+
+        if me is None:
+            return None
+
+        return {
+            "me": me,
+            "enemies": enemies,
+            "coins": ([{"id": cid, "x": x, "y": y} for cid, _, x, y in self.coins]
+                      if self.game_mode == 1 else []),
+            "walls": [{"x": x, "y": y, "width": w, "height": h} for x, y, w, h in self.walls],
+            "bullets": [{"id": bid, "x": x, "y": y, "vx": vx, "vy": vy}
+                        for owner, bid, x, y, vx, vy in self.bullets if owner != tank_id],
+            "sensors": sensors,
+            "clearance": my_clearance,
+            "juggernaut": self.juggernaut,
+            "game_mode": self.game_mode,
+            "time_left": self.time_left
+        }
+
+
+class WorldStateView:
+    """Read-only mapping of the engine's world-state block."""
+
+    def __init__(self, name: str,
+                 max_tanks: int = SHARED_STATE_MAX_TANKS,
+                 max_bullets: int = SHARED_STATE_MAX_BULLETS,
+                 max_coins: int = SHARED_STATE_MAX_COINS,
+                 max_walls: int = SHARED_STATE_MAX_WALLS):
+        self.shm = shared_memory.SharedMemory(name=name)
+        self._untrack()
+        self.buf = self.shm.buf.toreadonly()
+        self.offsets = _offsets(max_tanks, max_bullets, max_coins)
+        self.last_seq = 0
+
+        magic, version = struct.unpack_from("<4sH", self.buf, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self.close()
+            raise ValueError(f"Not a GitWars world-state block: {name}")
+
+        expected = (max_tanks, max_bullets, max_coins, max_walls)
+        found = CAPACITIES.unpack_from(self.buf, CAPACITIES_OFFSET)
+        if found != expected:
+            self.close()
+            raise ValueError(f"World-state block {name} has capacities "
+                             f"(tanks, bullets, coins, walls) {found}, expected {expected}")
+
+    def _untrack(self):
+        """Stop the resource tracker from unlinking a block this process doesn't own."""
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+        except Exception:
+            pass
+
+    def sequence(self) -> int:
+        """Current sequence number (cheap poll for new frames)."""
+        return SEQ.unpack_from(self.buf, SEQ_OFFSET)[0]
+
+    def has_new_frame(self) -> bool:
+        """True if a complete frame newer than the last snapshot is available."""
+        seq = self.sequence()
+        return seq != self.last_seq and seq % 2 == 0
+
+    def snapshot(self, max_retries: int = 100) -> Optional[WorldSnapshot]:
+        """Copy out a consistent frame, or None if the writer never settled."""
+        for _ in range(max_retries):
+            before = self.sequence()
+            if before % 2:
+                continue
+            data = bytes(self.buf)
+            if self.sequence() == before:
+                self.last_seq = before
+                return WorldSnapshot(data, self.offsets)
+        return None
+
+    def context_for(self, tank_id: int) -> Optional[Dict]:
+        """Shortcut: snapshot the latest frame and build one tank's context."""
+        snap = self.snapshot()
+        return snap.context_for(tank_id) if snap else None
+
+    def close(self):
+        """Detach from the block (the engine owns and unlinks it)."""
+        self.buf.release()
+        self.shm.close()
@@ -0,0 +1,212 @@
+"""
+GitWars - Frame Snapshots
+=========================
+Compact, renderable copies of the engine state, plus keyframe/delta
+encoding for streaming and replays.
+
+capture(engine) turns one frame into plain JSON-friendly data (positions
+rounded to 0.1 px). diff(prev, cur) keeps only what changed since the
+previous frame: unchanged top-level sections are dropped, and tanks are
+diffed per tank. apply_delta() rebuilds the next full state from a delta.
+
+encode() frames a state or delta as (decode_body() reverses it):
+
+    kind (b"K" keyframe / b"D" delta) | length (uint32) | zlib(JSON)
+
+Scene rebuilds lightweight objects from a state so gitwars.render can draw
+it exactly like a live engine, with local particles and screen shake for
+deaths.
+"""
+
+import json
+import struct
+import zlib
+from types import SimpleNamespace
+from typing import Dict, Optional, Tuple
+
+from config import *
+from gitwars.effects import Camera, ParticleSystem, Trail
+
+KEYFRAME = b"K"
+DELTA = b"D"
+RECORD = struct.Struct("<cI")
+
+# =============================================================================
+# CAPTURE
+# =============================================================================
+
+def _pack_color(color: Tuple[int, int, int]) -> int:
+    return (color[0] << 16) | (color[1] << 8) | color[2]
+
+
+def _unpack_color(value: int) -> Tuple[int, int, int]:
+    return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+
+
+def capture(engine) -> Dict:
+    """Renderable state of one frame (plain lists/dicts, JSON-friendly)."""
+    tanks = {}
+    meta = {}
+    for t in engine.tanks:
+        key = str(t.id)
+        tanks[key] = [round(t.x, 1), round(t.y, 1), round(t.angle, 1), round(t.health, 1),
+                      int(t.alive), t.coins, int(t.is_jammed), int(t.muzzle_flash_timer > 0),
+                      int(t.last_action == "LAG")]
+        meta[key] = [t.team_name, _pack_color(t.color), t.max_health]
+
+    jugg = None
+    if engine.game_mode == 3 and engine.juggernaut:
+        j = engine.juggernaut
+        jugg = [round(j.x, 1), round(j.y, 1), round(j.rotation % 360, 1), round(j.target_angle, 1),
+                j.weapon_phase, round(j.weapon_timer, 2)]
+
+    return {
+        "mode": engine.game_mode,
+        "timer": round(engine.game_timer, 1),
+        "over": engine.game_over,
+        "winner": engine.winner_text,
+        "zone": round(engine.zone.margin, 1),
+        "meta": meta,
+        "tanks": tanks,
+        "bullets": [[round(b.x, 1), round(b.y, 1), round(b.vx, 1), round(b.vy, 1),
+                     _pack_color(b.color), int(b.is_critical)] for b in engine.bullets],
+        "coins": [[round(c.x, 1), round(c.y, 1)] for c in engine.coins if not c.collected],
+        "walls": [[w.x, w.y, w.width, w.height] for w in engine.walls],
+        "danger": [[round(dz.x, 1), round(dz.y, 1), dz.radius, dz.phase, round(dz.pulse_time, 2)]
+                   for dz in engine.danger_zones] if engine.game_mode == 2 else [],
+        "jugg": jugg,
+        "feed": [[m["text"], m["alpha"]] for m in engine.kill_feed[:5]],
+    }
+
+# =============================================================================
+# DELTAS
+# =============================================================================
+
+def diff(prev: Dict, cur: Dict) -> Dict:
+    """Changes from prev to cur. Removed tanks are sent as None."""
+    delta = {}
+    for key, value in cur.items():
+        old = prev.get(key)
+        if value == old:
+            continue
+        if key == "tanks" and old is not None:
+            changed = {tid: rec for tid, rec in value.items() if old.get(tid) != rec}
+            for tid in old:
+                if tid not in value:
+                    changed[tid] = None
+            delta[key] = changed
+        else:
+            delta[key] = value
+    return delta
+
+
+def apply_delta(state: Dict, delta: Dict) -> Dict:
+    """New full state: state with delta applied (state is not modified)."""
+    new = dict(state)
+    for key, value in delta.items():
+        if key == "tanks":
+            tanks = dict(state.get("tanks", {}))
+            for tid, rec in value.items():
+                if rec is None:
+                    tanks.pop(tid, None)
+                else:
+                    tanks[tid] = rec
+            new[key] = tanks
+        else:
+            new[key] = value
+    return new
+
+
+def encode(kind: bytes, payload: Dict) -> bytes:
+    """One framed record (keyframe or delta)."""
+    body = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    return RECORD.pack(kind, len(body)) + body
+
+
+def decode_body(body: bytes) -> Dict:
+    """Payload of a record body (after the RECORD header)."""
+    return json.loads(zlib.decompress(body))
+
+# =============================================================================
+# SCENE (Renderable mirror of a state)
+# =============================================================================
+
+class Scene:
+    """
+    Engine-shaped view of a decoded state for gitwars.render.Renderer.
+    Only the attributes the renderer reads are provided.
+    """
+
+    def __init__(self):
+        self.camera = Camera()
+        self.particles = ParticleSystem()
+        self.state: Optional[Dict] = None
+
+        self.game_mode = GAME_MODE
+        self.game_timer = 0.0
+        self.game_over = False
+        self.winner_text = ""
+        self.zone = SimpleNamespace(margin=0)
+        self.tanks = []
+        self.bullets = []
+        self.coins = []
+        self.walls = []
+        self.danger_zones = []
+        self.juggernaut = None
+        self.kill_feed = []
+
+    def set_state(self, state: Dict):
+        """Show a new full state (spawns local death effects)."""
+        prev = self.state
+        self.state = state
+
+        self.game_mode = state["mode"]
+        self.game_timer = state["timer"]
+        self.game_over = state["over"]
+        self.winner_text = state["winner"]
+        self.zone.margin = state["zone"]
+
+        self.tanks = []
+        for tid, rec in state["tanks"].items():
+            x, y, angle, health, alive, coins, jammed, flash, lag = rec
+            name, color, max_health = state["meta"].get(tid, (f"Tank_{tid}", 0xFFFFFF, TANK_MAX_HEALTH))
+            tank = SimpleNamespace(
+                id=int(tid), x=x, y=y, angle=angle, health=health, alive=bool(alive),
+                coins=coins, is_jammed=bool(jammed), muzzle_flash_timer=flash,
+                last_action="LAG" if lag else None, team_name=name,
+                color=_unpack_color(color), max_health=max_health)
+            self.tanks.append(tank)
+
+            # Death effects are cosmetic - recreate them locally
+            if prev and not alive and prev["tanks"].get(tid, (0,) * 5)[4]:
+                self.particles.spawn_explosion(x, y, tank.color)
+                self.camera.shake()
+
+        self.bullets = []
+        for x, y, vx, vy, color, critical in state["bullets"]:
+            rgb = _unpack_color(color)
+            # Rebuild the trail backwards along the per-frame velocity
+            trail = Trail(rgb)
+            for i in range(trail.max_length - 1, -1, -1):
+                trail.add_point(x - vx * i, y - vy * i)
+            self.bullets.append(SimpleNamespace(x=x, y=y, color=rgb, is_critical=bool(critical),
+                                                trail=trail))
+
+        self.coins = [SimpleNamespace(x=x, y=y, collected=False, pulse_phase=self.game_timer * 5)
+                      for x, y in state["coins"]]
+        self.walls = [SimpleNamespace(x=x, y=y, width=w, height=h) for x, y, w, h in state["walls"]]
+        self.danger_zones = [SimpleNamespace(x=x, y=y, radius=r, phase=phase, pulse_time=pulse)
+                             for x, y, r, phase, pulse in state["danger"]]
+
+        self.juggernaut = None
+        if state["jugg"]:
+            x, y, rotation, target_angle, phase, timer = state["jugg"]
+            self.juggernaut = SimpleNamespace(x=x, y=y, rotation=rotation, target_angle=target_angle,
+                                              weapon_phase=phase, weapon_timer=timer)
+
+        self.kill_feed = [{"text": text, "alpha": alpha} for text, alpha in state["feed"]]
+
+    def update_effects(self, dt: float):
+        """Advance local cosmetic effects (call once per displayed frame)."""
+        self.camera.update(dt)
+        self.particles.update()
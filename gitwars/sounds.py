@@ -0,0 +1,80 @@
+"""
+GitWars - Sound Hooks
+=====================
+The simulation calls these to request sounds. They do nothing until
+enable_audio() is called, which lazily imports the mixer-backed modules
+(gitwars.audio, gitwars.assets). Headless runs never call it, so they never
+import or initialize any audio code.
+"""
+
+from typing import Optional
+
+from config import SFX_VOLUME
+
+# Sounds are referenced by asset name and decoded on first play
+SFX_SHOOT = "shoot.mp3"
+SFX_DEATH = "death.mp3"  # Was explosion.wav
+SFX_COIN = "coin.mp3"
+SFX_READY = "ready.mp3"
+SFX_WIN_1 = "win1.mp3"
+SFX_WIN_2 = "win2.mp3"
+SFX_WIN_3 = "win3.mp3"
+
+# Set by enable_audio(): the SfxDispatcher and the gitwars.assets module
+_backend = {"sfx": None, "assets": None}
+
+
+def enable_audio():
+    """Route sound requests to the real mixer from now on."""
+    if _backend["sfx"] is not None:
+        return
+
+    from gitwars import assets
+    from gitwars.audio import SfxDispatcher
+
+    _backend["assets"] = assets
+    _backend["sfx"] = SfxDispatcher(assets.get_sound)
+
+
+def audio_enabled() -> bool:
+    """True once enable_audio() has been called."""
+    return _backend["sfx"] is not None
+
+
+def play_sound(sound: Optional[str], volume: float = SFX_VOLUME, pitch_variation: bool = False):
+    """Queue a sound for this frame. Duplicates are merged and voices capped."""
+    if _backend["sfx"] is not None:
+        _backend["sfx"].request(sound, volume)
+
+
+def play_critical_sound(sound: Optional[str], volume: float = 1.0):
+    """Play a critical sound on a reserved channel. This ensures it won't be cut off."""
+    assets = _backend["assets"]
+    if assets is None or sound is None:
+        return
+
+    channel = assets.critical_channel()
+    sfx = assets.get_sound(sound)
+    if channel is None or sfx is None:
+        return
+
+    sfx.set_volume(volume)
+    channel.play(sfx)
+
+
+def flush():
+    """Play everything queued this frame. Call once per frame."""
+    if _backend["sfx"] is not None:
+        _backend["sfx"].flush()
+
+
+def play_music(*filenames: str):
+    """Loop the first existing music track (no restart if already playing)."""
+    if _backend["assets"] is not None:
+        _backend["assets"].play_music(*filenames)
+
+
+def stop_music():
+    """Stop the music stream."""
+    if _backend["assets"] is not None:
+        _backend["assets"].stop_music()
@@ -0,0 +1,166 @@
+"""
+GitWars - Live Spectator Stream
+===============================
+Streams the match over TCP so other machines can render it.
+
+The host (server.py, or main.py with SPECTATOR_STREAM_ENABLED) owns a
+SpectatorServer. Every frame it captures a snapshot (gitwars.snapshot) and
+sends each viewer either a keyframe (on connect and every
+SPECTATOR_KEYFRAME_INTERVAL frames) or a delta against the previous frame.
+Snapshots and deltas are built once per frame, however many viewers there are.
+
+Sockets are non-blocking: the host never waits on a slow viewer. Each
+viewer has an outgoing buffer; a viewer that falls more than
+SPECTATOR_MAX_BACKLOG bytes behind is disconnected.
+
+Viewers (viewer.py) use SpectatorClient to rebuild full states and draw
+them with the normal Renderer.
+"""
+
+import socket
+from typing import Dict, List, Optional
+
+from config import *
+from gitwars.snapshot import DELTA, KEYFRAME, RECORD, apply_delta, capture, decode_body, diff, encode
+
+# =============================================================================
+# SERVER (Simulation host)
+# =============================================================================
+
+class _Viewer:
+    """One connected viewer and its pending bytes."""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.pending = bytearray()
+        self.synced = False  # Has received a keyframe
+
+
+class SpectatorServer:
+    """Serves keyframes and deltas to any number of viewers."""
+
+    def __init__(self, host: str = SPECTATOR_HOST, port: int = SPECTATOR_PORT,
+                 keyframe_interval: int = SPECTATOR_KEYFRAME_INTERVAL):
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind((host, port))
+        self.listener.listen()
+        self.listener.setblocking(False)
+        self.address = self.listener.getsockname()
+
+        self.keyframe_interval = keyframe_interval
+        self.viewers: List[_Viewer] = []
+        self.frame = 0
+        self.last_state: Optional[Dict] = None
+
+    def _accept(self):
+        """Pick up newly connected viewers."""
+        while True:
+            try:
+                sock, _ = self.listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            sock.setblocking(False)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.viewers.append(_Viewer(sock))
+
+    def publish(self, engine):
+        """Capture this frame and queue it for every viewer."""
+        self._accept()
+        if not self.viewers:
+            self.last_state = None  # Next viewer starts from a keyframe anyway
+            return
+
+        state = capture(engine)
+        keyframe_due = self.last_state is None or self.frame % self.keyframe_interval == 0
+        needs_keyframe = keyframe_due or any(not v.synced for v in self.viewers)
+        keyframe = encode(KEYFRAME, state) if needs_keyframe else None
+        delta = None if keyframe_due else encode(DELTA, diff(self.last_state, state))
+
+        for viewer in self.viewers:
+            if keyframe_due or not viewer.synced:
+                viewer.pending += keyframe
+                viewer.synced = True
+            else:
+                viewer.pending += delta
+
+        self.last_state = state
+        self.frame += 1
+        self._flush()
+
+    def _flush(self):
+        """Send as much as each socket accepts; drop dead or lagging viewers."""
+        for viewer in self.viewers[:]:
+            try:
+                if viewer.pending:
+                    sent = viewer.sock.send(viewer.pending)
+                    del viewer.pending[:sent]
+            except (BlockingIOError, InterruptedError):
+                pass
+            except OSError:
+                self._drop(viewer)
+                continue
+
+            if len(viewer.pending) > SPECTATOR_MAX_BACKLOG:
+                self._drop(viewer)
+
+    def _drop(self, viewer: _Viewer):
+        viewer.sock.close()
+        self.viewers.remove(viewer)
+
+    def close(self):
+        """Disconnect all viewers and stop listening."""
+        for viewer in self.viewers[:]:
+            self._drop(viewer)
+        self.listener.close()
+
+# =============================================================================
+# CLIENT (Viewer)
+# =============================================================================
+
+class SpectatorClient:
+    """Connects to a SpectatorServer and rebuilds full frame states."""
+
+    def __init__(self, host: str, port: int = SPECTATOR_PORT):
+        self.sock = socket.create_connection((host, port))
+        self.sock.setblocking(False)
+        self.buffer = bytearray()
+        self.state: Optional[Dict] = None
+        self.connected = True
+
+    def poll(self) -> Optional[Dict]:
+        """
+        Read everything available and return the newest full state,
+        or None if no new frame arrived.
+        """
+        while True:
+            try:
+                chunk = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                chunk = b""
+            if not chunk:
+                self.connected = False
+                break
+            self.buffer += chunk
+
+        updated = False
+        while len(self.buffer) >= RECORD.size:
+            kind, length = RECORD.unpack_from(self.buffer)
+            end = RECORD.size + length
+            if len(self.buffer) < end:
+                break
+            payload = decode_body(bytes(self.buffer[RECORD.size:end]))
+            del self.buffer[:end]
+
+            if kind == KEYFRAME:
+                self.state = payload
+            elif self.state is not None:
+                self.state = apply_delta(self.state, payload)
+            updated = True
+
+        return self.state if updated else None
+
+    def close(self):
+        self.sock.close()
@@ -0,0 +1,131 @@
+"""
+GitWars - Config Parameter Sweeps
+=================================
+Runs seeded headless matches for many config.py override sets across a
+process pool and aggregates the outcomes.
+
+Every module does `from config import *`, so constants are copied at
+import time. Overrides are therefore applied in a fresh worker process
+(spawn start method, one task per process) before any gitwars module is
+imported. apply_overrides() re-runs config.py statement by statement with
+each overridden name pinned right after its own assignment, so derived
+constants (WORLD_WIDTH = SCREEN_WIDTH, MATCH_MAX_FRAMES = FPS * 300, ...)
+follow their inputs, just as if config.py had been edited.
+
+Results go through the match cache (gitwars.matches): the overrides are
+part of each key, so rerunning a sweep only simulates new combinations.
+"""
+
+import ast
+import itertools
+import multiprocessing
+import random
+import statistics
+from typing import Dict, List, Optional, Sequence
+
+import config
+
+# =============================================================================
+# OVERRIDE SETS
+# =============================================================================
+
+def grid(axes: Dict[str, Sequence]) -> List[Dict]:
+    """Every combination of the given values ({name: [values]})."""
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*(axes[n] for n in names))]
+
+
+def sample(axes: Dict[str, Sequence], count: int, seed: int = 0) -> List[Dict]:
+    """count distinct random combinations from the grid (all of it if smaller)."""
+    combos = grid(axes)
+    if count >= len(combos):
+        return combos
+    return random.Random(seed).sample(combos, count)
+
+def is_constant(name: str) -> bool:
+    """True if name is a config.py constant that can be overridden."""
+    return name.isupper() and hasattr(config, name)
+
+
+def apply_overrides(overrides: Dict):
+    """Re-evaluate config.py with overrides in place (derived constants follow)."""
+    unknown = [name for name in overrides if not is_constant(name)]
+    if unknown:
+        raise KeyError(f"Unknown config constant(s): {', '.join(unknown)}")
+
+    with open(config.__file__) as f:
+        tree = ast.parse(f.read(), config.__file__)
+    namespace = {"__name__": config.__name__, "__file__": config.__file__}
+    for node in tree.body:
+        exec(compile(ast.Module(body=[node], type_ignores=[]), config.__file__, "exec"), namespace)
+        for name, value in overrides.items():
+            if name in namespace:
+                namespace[name] = value
+
+    for name, value in namespace.items():
+        if name.isupper():
+            setattr(config, name, value)
+
+# =============================================================================
+# WORKER
+# =============================================================================
+
+def _run_task(task: Dict) -> Dict:
+    """Apply overrides, then play one match (runs in a fresh process)."""
+    import contextlib
+    import io
+
+    apply_overrides(task["overrides"])
+
+    from gitwars.matches import MatchCache, run_match
+
+    with contextlib.redirect_stdout(io.StringIO()):  # Bot load chatter
+        if task["use_cache"]:
+            result, _ = MatchCache().run(task["bots"], task["mode"], task["seed"])
+        else:
+            result = run_match(task["bots"], task["mode"], task["seed"])
+    return {"index": task["index"], "result": result}
+
+# =============================================================================
+# AGGREGATION
+# =============================================================================
+
+def summarize(results: List[Dict]) -> Dict:
+    """Mean outcome statistics over the matches of one override set."""
+    lengths, kills, spreads, survival = [], [], [], []
+    for result in results:
+        tanks = result["tanks"]
+        alive = sum(1 for t in tanks if t["alive"])
+        coins = [t["coins"] for t in tanks]
+        lengths.append(result["frames"] / config.FPS)
+        kills.append(len(tanks) - alive)
+        spreads.append(max(coins) - min(coins))
+        survival.append(alive / len(tanks))
+    return {
+        "matches": len(results),
+        "length_s": statistics.mean(lengths),
+        "kills": statistics.mean(kills),
+        "coin_spread": statistics.mean(spreads),
+        "survival": statistics.mean(survival),
+        "timeouts": sum(1 for r in results if r["timed_out"]),
+    }
+
+
+def run_sweep(override_sets: List[Dict], bots: List[str], mode: int, seeds: int,
+              workers: Optional[int] = None, use_cache: bool = True) -> List[Dict]:
+    """
+    Play `seeds` matches per override set in parallel.
+    Returns one row per set: {"overrides": ..., **summarize(...)}.
+    """
+    tasks = [{"index": i, "overrides": overrides, "bots": bots, "mode": mode,
+              "seed": seed, "use_cache": use_cache}
+             for i, overrides in enumerate(override_sets) for seed in range(seeds)]
+
+    per_set: Dict[int, List[Dict]] = {i: [] for i in range(len(override_sets))}
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=workers, maxtasksperchild=1) as pool:
+        for done in pool.imap_unordered(_run_task, tasks):
+            per_set[done["index"]].append(done["result"])
+
+    return [{"overrides": overrides, **summarize(per_set[i])}
+            for i, overrides in enumerate(override_sets)]
@@ -0,0 +1,86 @@
+"""
+GitWars - Math Utilities & Sensors
+==================================
+Small helpers shared by the simulation, renderer and tooling.
+"""
+
+import math
+from typing import Dict, List
+
+# =============================================================================
+# UTILITY FUNCTIONS
+# =============================================================================
+
+def lerp(a: float, b: float, t: float) -> float:
+    """Linear interpolation between a and b."""
+    return a + (b - a) * t
+
+def clamp(value: float, min_val: float, max_val: float) -> float:
+    """Clamp value between min and max."""
+    return max(min_val, min(max_val, value))
+
+def distance(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Calculate distance between two points."""
+    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+
+def angle_to(x1: float, y1: float, x2: float, y2: float) -> float:
+    """Calculate angle from point 1 to point 2 in degrees."""
+    return math.degrees(math.atan2(y2 - y1, x2 - x1))
+
+def normalize_angle(angle: float) -> float:
+    """Normalize angle to -180 to 180 range."""
+    while angle > 180:
+        angle -= 360
+    while angle < -180:
+        angle += 360
+    return angle
+
+# =============================================================================
+# SENSORS (Raycast whiskers)
+# =============================================================================
+
+SENSOR_MAX_RANGE = 300.0  # Max detection distance in pixels
+SENSOR_ANGLES = {
+    "front": 0,      # Straight ahead
+    "left": -30,     # 30 degrees to the left
+    "right": 30      # 30 degrees to the right
+}
+
+def get_sensor_readings(tank_x: float, tank_y: float, tank_angle: float, walls: List) -> Dict[str, float]:
+    """
+    Cast 3 rays (whiskers) from the tank to detect walls.
+    Uses pygame.Rect.clipline for efficient collision detection.
+
+    Returns: {"front": dist, "left": dist, "right": dist}
+    Max distance is SENSOR_MAX_RANGE (300). If no wall hit, returns 300.
+    """
+    readings = {}
+
+    for sensor_name, offset_angle in SENSOR_ANGLES.items():
+        # Calculate ray direction
+        ray_angle = math.radians(tank_angle + offset_angle)
+
+        # Ray start and end points
+        start_x = tank_x
+        start_y = tank_y
+        end_x = tank_x + math.cos(ray_angle) * SENSOR_MAX_RANGE
+        end_y = tank_y + math.sin(ray_angle) * SENSOR_MAX_RANGE
+
+        # Find shortest distance to any wall
+        min_dist = SENSOR_MAX_RANGE
+
+        for wall in walls:
+            wall_rect = wall.get_rect()
+            # clipline returns the segment of line inside the rect, or empty tuple
+            clipped = wall_rect.clipline((start_x, start_y), (end_x, end_y))
+
+            if clipped:
+                # clipped is ((x1, y1), (x2, y2)) - the segment inside the wall
+                hit_x, hit_y = clipped[0]  # First intersection point
+                dist = distance(start_x, start_y, hit_x, hit_y)
+                if dist < min_dist:
+                    min_dist = dist
+
+        readings[sensor_name] = round(min_dist, 1)
+
+    return readings
@@ -0,0 +1,130 @@
+"""
+GitWars - Wall Broadphase Grid
+==============================
+Static bucket grid over the arena's walls, built once per map.
+
+Each WALL_GRID_CELL_SIZE bucket lists the walls whose rectangles touch
+it, so a query only looks at the walls near the queried shape instead of
+the whole maze.
+
+Queries:
+- query_rects(rect, margin) wall rects that may overlap rect (grown by margin)
+- collides(rect)            does rect overlap any wall (bullets)
+- query_segment(...)        walls a segment passes through (cell walk)
+- line_of_sight(...)        no wall on the segment (tank visibility)
+
+The grid keeps its own copy of each wall's rect. Candidate lists come
+back in wall order. Resolving against them gives
+the same result as looping over every wall.
+"""
+
+import math
+from typing import List
+
+import pygame
+
+from config import *
+
+
+class WallGrid:
+    """Uniform bucket grid over static walls."""
+
+    def __init__(self, walls: List, width: int = WORLD_WIDTH, height: int = WORLD_HEIGHT,
+                 cell_size: int = WALL_GRID_CELL_SIZE):
+        self.walls = walls
+        self.rects = [wall.get_rect() for wall in walls]
+        self.cell_size = cell_size
+        self.cols = width // cell_size + 1
+        self.rows = height // cell_size + 1
+
+        # Wall indices per bucket, ascending (walls are added in order)
+        self.buckets: List[List[int]] = [[] for _ in range(self.cols * self.rows)]
+        for index, rect in enumerate(self.rects):
+            c0, r0, c1, r1 = self._cell_span(rect.left, rect.top, rect.right - 1, rect.bottom - 1)
+            for r in range(r0, r1 + 1):
+                row = r * self.cols
+                for c in range(c0, c1 + 1):
+                    self.buckets[row + c].append(index)
+
+    def _cell_span(self, x0: float, y0: float, x1: float, y1: float):
+        """Clamped bucket columns/rows covering [x0, x1] x [y0, y1]."""
+        cell = self.cell_size
+        c0 = min(self.cols - 1, max(0, int(x0 // cell)))
+        r0 = min(self.rows - 1, max(0, int(y0 // cell)))
+        c1 = min(self.cols - 1, max(0, int(x1 // cell)))
+        r1 = min(self.rows - 1, max(0, int(y1 // cell)))
+        return c0, r0, c1, r1
+
+    def _indices_in(self, x0: float, y0: float, x1: float, y1: float) -> List[int]:
+        """Ascending wall indices listed in the buckets covering a box."""
+        c0, r0, c1, r1 = self._cell_span(x0, y0, x1, y1)
+        if c0 == c1 and r0 == r1:
+            return self.buckets[r0 * self.cols + c0]  # Already ascending
+        found = set()
+        for r in range(r0, r1 + 1):
+            row = r * self.cols
+            for c in range(c0, c1 + 1):
+                found.update(self.buckets[row + c])
+        return sorted(found)
+
+    def query_rects(self, rect: pygame.Rect, margin: float = 0) -> List[pygame.Rect]:
+        """
+        Rects of the walls in the buckets touched by rect grown by margin on
+        each side, in wall order. A superset of the walls overlapping it.
+        The rects belong to the grid - treat them as read-only.
+        """
+        indices = self._indices_in(rect.left - margin, rect.top - margin,
+                                   rect.right - 1 + margin, rect.bottom - 1 + margin)
+        rects = self.rects
+        return [rects[i] for i in indices]
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        """True if rect overlaps any wall."""
+        rects = self.rects
+        for i in self._indices_in(rect.left, rect.top, rect.right - 1, rect.bottom - 1):
+            if rect.colliderect(rects[i]):
+                return True
+        return False
+
+    def query_segment(self, x0: float, y0: float, x1: float, y1: float) -> List:
+        """Walls the segment (x0, y0) -> (x1, y1) passes through, in wall order."""
+        cell = self.cell_size
+        dx, dy = x1 - x0, y1 - y0
+        c, r = int(x0 // cell), int(y0 // cell)
+        c_end, r_end = int(x1 // cell), int(y1 // cell)
+        step_c = 1 if dx > 0 else -1
+        step_r = 1 if dy > 0 else -1
+
+        # Parametric distance (0..1) to the next bucket boundary, and per bucket
+        if dx:
+            next_x = (c + (step_c > 0)) * cell
+            t_max_x, t_delta_x = (next_x - x0) / dx, cell / abs(dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy:
+            next_y = (r + (step_r > 0)) * cell
+            t_max_y, t_delta_y = (next_y - y0) / dy, cell / abs(dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        # Walk every bucket the segment crosses (Amanatides-Woo)
+        candidates = set()
+        while True:
+            if 0 <= c < self.cols and 0 <= r < self.rows:
+                candidates.update(self.buckets[r * self.cols + c])
+            if (c == c_end and r == r_end) or min(t_max_x, t_max_y) > 1.0:
+                break
+            if t_max_x < t_max_y:
+                c += step_c
+                t_max_x += t_delta_x
+            else:
+                r += step_r
+                t_max_y += t_delta_y
+
+        rects = self.rects
+        return [self.walls[i] for i in sorted(candidates)
+                if rects[i].clipline((x0, y0), (x1, y1))]
+
+    def line_of_sight(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        """True if no wall blocks the segment between two points."""
+        return not self.query_segment(x0, y0, x1, y1)
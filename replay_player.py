@@ -0,0 +1,97 @@
+"""
+GitWars - Replay Player
+=======================
+Scrub through a recorded match (replays/*.gwr). Matches are only
+recorded with REPLAY_RECORD_ENABLED = True in config.py.
+
+Run with: python replay_player.py replays/match_....gwr
+
+Controls:
+    SPACE          Pause / resume
+    LEFT / RIGHT   Step one frame (paused) or jump 5 seconds (playing)
+    UP / DOWN      Double / halve playback speed (1/8x .. 16x)
+    HOME / END     First / last frame
+    ESC            Quit
+"""
+
+import argparse
+import sys
+
+import pygame
+
+from config import *
+from gitwars.render import Renderer
+from gitwars.replay import ReplayReader
+from gitwars.snapshot import Scene
+
+MIN_SPEED = 0.125
+MAX_SPEED = 16.0
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="GitWars replay player")
+    parser.add_argument("path")
+    parser.add_argument("--speed", type=float, default=1.0)
+    args = parser.parse_args()
+
+    reader = ReplayReader(args.path)
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption(f"{TITLE} - Replay")
+    clock = pygame.time.Clock()
+    renderer = Renderer(screen)
+    scene = Scene()
+
+    position = 0.0  # Fractional frame (allows slow motion)
+    speed = args.speed
+    paused = False
+    last = reader.frame_count - 1
+
+    running = True
+    while running:
+        dt = clock.tick(FPS) / 1000.0
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    paused = not paused
+                elif event.key == pygame.K_RIGHT:
+                    position += 1 if paused else 5 * reader.fps
+                elif event.key == pygame.K_LEFT:
+                    position -= 1 if paused else 5 * reader.fps
+                elif event.key == pygame.K_UP:
+                    speed = min(MAX_SPEED, speed * 2)
+                elif event.key == pygame.K_DOWN:
+                    speed = max(MIN_SPEED, speed / 2)
+                elif event.key == pygame.K_HOME:
+                    position = 0
+                elif event.key == pygame.K_END:
+                    position = last
+
+        if not paused:
+            position += dt * reader.fps * speed
+        position = max(0.0, min(float(last), position))
+
+        scene.set_state(reader.state_at(int(position)))
+        scene.update_effects(dt)
+        renderer.draw(scene, clock.get_fps())
+
+        status = f"{int(position)}/{last}  {speed:g}x" + ("  PAUSED" if paused else "")
+        text = renderer.font_small.render(status, True, COLOR_TEXT)
+        screen.blit(text, (20, SCREEN_HEIGHT - 30))
+        pygame.display.flip()
+
+    reader.close()
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == "__main__":
+    main()
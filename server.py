@@ -0,0 +1,53 @@
+"""
+GitWars - Headless Match Host
+=============================
+Runs the simulation without a window and streams every frame to remote
+viewers (viewer.py). Rendering is left to the projector machines.
+
+Run with: python server.py [--mode 1|2|3] [--port 47800]
+
+The match runs in real time at FPS. Once it ends, the final frame keeps
+streaming until Ctrl+C.
+"""
+
+import argparse
+import time
+
+from config import *
+from gitwars.engine import GitWarsEngine
+from gitwars.spectate import SpectatorServer
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Headless GitWars host with spectator stream")
+    parser.add_argument("--mode", type=int, default=GAME_MODE, choices=(1, 2, 3))
+    parser.add_argument("--host", default=SPECTATOR_HOST)
+    parser.add_argument("--port", type=int, default=SPECTATOR_PORT)
+    args = parser.parse_args()
+
+    # The engine streams through this server instead of opening its own
+    engine = GitWarsEngine(game_mode=args.mode, spectator_server=SpectatorServer(args.host, args.port))
+    print(f"Streaming mode {args.mode} on {args.host}:{args.port} (Ctrl+C to stop)")
+
+    dt = 1.0 / FPS
+    next_frame = time.perf_counter()
+    try:
+        while True:
+            engine.update(dt)
+
+            # Fixed real-time pace for the viewers
+            next_frame += dt
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame = time.perf_counter()  # Running behind - don't try to catch up
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.shutdown()
+
+
+if __name__ == "__main__":
+    main()
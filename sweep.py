@@ -0,0 +1,83 @@
+"""
+GitWars - Balance Sweep Runner (Headless)
+=========================================
+Plays seeded matches for a grid (or random sample) of config overrides in
+parallel and prints outcome statistics per combination.
+
+Run with:
+    python sweep.py --mode 2 --set BULLET_SPEED=8,10,12 --set JAM_CHANCE=0,0.01
+    python sweep.py --mode 3 --set JUGGERNAUT_SPEED=40,60,80 --set JUGGERNAUT_MELEE_DAMAGE=1,2 --sample 4
+
+Values are Python literals. Constants derived from an overridden one
+(e.g. WORLD_WIDTH from SCREEN_WIDTH) are recomputed. Columns are means over --seeds matches:
+match length (s), kills, coin spread (max - min), survival (fraction alive)
+and how many matches hit MATCH_MAX_FRAMES.
+"""
+
+import argparse
+import ast
+import glob
+import os
+import time
+
+from config import *
+from gitwars.sweep import grid, is_constant, run_sweep, sample
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_axis(text: str):
+    """NAME=v1,v2,... -> (NAME, [v1, v2, ...])"""
+    name, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=v1,v2,... got {text!r}")
+    return name.strip(), [ast.literal_eval(v.strip()) for v in values.split(",")]
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Parallel GitWars config sweep")
+    parser.add_argument("--set", dest="axes", type=parse_axis, action="append", required=True,
+                        metavar="NAME=v1,v2", help="Config constant and values to try (repeatable)")
+    parser.add_argument("--sample", type=int, default=None, help="Random combinations instead of the full grid")
+    parser.add_argument("--mode", type=int, default=GAME_MODE, choices=(1, 2, 3))
+    parser.add_argument("--bots", default=os.path.join(ROOT_DIR, "bots", "bot_*.py"),
+                        help="Glob of bot files (all play in every match)")
+    parser.add_argument("--seeds", type=int, default=3, help="Matches per combination")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    axes = dict(args.axes)
+    unknown = [name for name in axes if not is_constant(name)]
+    if unknown:
+        parser.error(f"unknown config constant(s): {', '.join(unknown)}")
+
+    bots = sorted(glob.glob(args.bots))
+    if args.mode == 3:
+        bots = bots[:2]  # Duel is 1v1
+    if not bots:
+        parser.error("no bots found")
+
+    combos = sample(axes, args.sample) if args.sample else grid(axes)
+    print(f"{len(combos)} combinations x {args.seeds} seeds, mode {args.mode}, {len(bots)} bots")
+
+    start = time.perf_counter()
+    rows = run_sweep(combos, bots, args.mode, args.seeds, args.workers, use_cache=not args.no_cache)
+
+    names = list(axes)
+    header = [*names, "length_s", "kills", "coin_spread", "survival", "timeouts"]
+    table = [[repr(row["overrides"][n]) for n in names] +
+             [f"{row['length_s']:.1f}", f"{row['kills']:.2f}", f"{row['coin_spread']:.1f}",
+              f"{row['survival']:.2f}", str(row["timeouts"])] for row in rows]
+    widths = [max(len(h), *(len(r[i]) for r in table)) for i, h in enumerate(header)]
+
+    print()
+    print("  ".join(h.rjust(w) for h, w in zip(header, widths)))
+    for r in table:
+        print("  ".join(c.rjust(w) for c, w in zip(r, widths)))
+    print(f"\nDone in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Bot loading and execution (gitwars.bots)."""
+
+from types import SimpleNamespace
+
+import gitwars.bots
+from gitwars.bots import BotLoader, DeltaContext, ThinkScheduler
+
+
+def _loader(tmp_path, source):
+    path = tmp_path / "bot_test.py"
+    path.write_text(source)
+    return BotLoader(str(path))
+
+
+CONTEXT = {"walls": [], "enemies": [], "bullets": [], "coins": []}
+
+
+def test_new_plan_does_not_inherit_previous_action(tmp_path):
+    bot = _loader(tmp_path, (
+        "calls = 0\n"
+        "def update(context):\n"
+        "    global calls\n"
+        "    calls += 1\n"
+        "    if calls == 1:\n"
+        "        yield ('SHOOT', None)\n"
+        "        return\n"
+        "    yield None\n"
+    ))
+    assert bot.execute(CONTEXT) == ("SHOOT", None)
+    assert bot.execute(CONTEXT) == ("SHOOT", None)  # Plan ends: SHOOT is held
+    assert bot.plan is None
+    # The second plan finishes without acting; the first plan's SHOOT is stale
+    assert bot.execute(CONTEXT) == (None, None)
+
+
+def test_plan_yielding_an_action_each_frame_is_stepped_once_per_frame(tmp_path):
+    bot = _loader(tmp_path, (
+        "steps = []\n"
+        "def update(context):\n"
+        "    while True:\n"
+        "        steps.append(context['n'])\n"
+        "        context = yield ('MOVE', (context['n'], 0))\n"
+    ))
+    for n in range(5):
+        assert bot.execute(dict(CONTEXT, n=n)) == ("MOVE", (n, 0))
+    module = bot.update_func.__globals__
+    assert module["steps"] == [0, 1, 2, 3, 4]
+
+
+def test_plan_keeps_working_through_none_within_a_frame(tmp_path):
+    bot = _loader(tmp_path, (
+        "def update(context):\n"
+        "    for _ in range(3):\n"
+        "        yield None\n"
+        "    context = yield ('STOP', None)\n"
+        "    yield ('MOVE', (context['n'], 0))\n"
+    ))
+    assert bot.execute(dict(CONTEXT, n=0)) == ("STOP", None)
+    assert bot.execute(dict(CONTEXT, n=1)) == ("MOVE", (1, 0))
+
+
+def test_plan_return_value_is_its_final_action(tmp_path):
+    bot = _loader(tmp_path, (
+        "def update(context):\n"
+        "    yield None\n"
+        "    return ('MOVE', (1, 0))\n"
+    ))
+    assert bot.execute(CONTEXT) == ("MOVE", (1, 0))
+    assert bot.plan is None
+
+
+def _due_frames(scheduler, tank_id, frames):
+    due = []
+    for frame in range(frames):
+        scheduler.frame = frame
+        if scheduler.due(tank_id):
+            due.append(frame)
+    return due
+
+
+def test_scheduler_staggers_bots_with_the_same_interval():
+    bots = {i: SimpleNamespace(think_interval=3) for i in range(3)}
+    bots[3] = SimpleNamespace(think_interval=1)
+    scheduler = ThinkScheduler(bots)
+    # One interval-3 bot per frame, each every third frame; interval 1 every frame
+    assert _due_frames(scheduler, 0, 9) == [0, 3, 6]
+    assert _due_frames(scheduler, 1, 9) == [2, 5, 8]
+    assert _due_frames(scheduler, 2, 9) == [1, 4, 7]
+    assert _due_frames(scheduler, 3, 9) == list(range(9))
+
+
+def test_scheduler_advance_moves_to_next_frame():
+    scheduler = ThinkScheduler({0: SimpleNamespace(think_interval=2)})
+    assert scheduler.due(0)
+    scheduler.advance()
+    assert not scheduler.due(0)
+    scheduler.advance()
+    assert scheduler.due(0)
+
+
+def _frame(enemies, coins=(), time_left=60.0):
+    return {"me": {"x": 0.0, "y": 0.0}, "walls": [{"x": 1, "y": 1, "width": 2, "height": 2}],
+            "enemies": list(enemies), "bullets": [], "coins": list(coins), "time_left": time_left}
+
+
+def test_delta_context_first_frame_is_full():
+    frame = _frame([{"id": 1, "x": 5.0, "y": 5.0}])
+    context = DeltaContext().build(frame)
+    assert context["full"] is True
+    assert context["enemies"] == frame["enemies"]
+    assert context["walls"] == frame["walls"]
+
+
+def test_delta_context_reports_added_removed_and_moved():
+    delta = DeltaContext()
+    delta.build(_frame([{"id": 1, "x": 5.0, "y": 5.0}, {"id": 2, "x": 9.0, "y": 9.0}],
+                       coins=[{"id": 7, "x": 3.0, "y": 3.0}]))
+    context = delta.build(_frame([{"id": 1, "x": 6.0, "y": 5.0}, {"id": 3, "x": 0.0, "y": 1.0}],
+                                 coins=[{"id": 7, "x": 3.0, "y": 3.0}], time_left=59.0))
+    assert context["full"] is False
+    assert "walls" not in context
+    assert context["time_left"] == 59.0
+    assert context["enemies"] == {"added": [{"id": 3, "x": 0.0, "y": 1.0}], "removed": [2],
+                                  "moved": [{"id": 1, "x": 6.0, "y": 5.0}]}
+    assert context["coins"] == {"added": [], "removed": [], "moved": []}
+    assert context["bullets"] == {"added": [], "removed": [], "moved": []}
+
+
+INIT_BOT = (
+    "seen = []\n"
+    "def init(static_context):\n"
+    "    if static_context.get('fail'):\n"
+    "        raise RuntimeError('init failed')\n"
+    "def update(context):\n"
+    "    seen.append(sorted(context))\n"
+    "    return ('STOP', None)\n"
+)
+FRAME = dict(CONTEXT, game_mode=2, time_left=10.0)
+
+
+def _seen(bot):
+    return bot.update_func.__globals__["seen"]
+
+
+def test_static_keys_are_dropped_after_init(tmp_path):
+    bot = _loader(tmp_path, INIT_BOT)
+    bot.initialize({"walls": [], "arena": {"width": 1, "height": 1}, "game_mode": 2, "my_id": 0})
+    assert bot.execute(FRAME) == ("STOP", None)
+    assert "walls" not in _seen(bot)[0] and "game_mode" not in _seen(bot)[0]
+    assert "time_left" in _seen(bot)[0]
+
+
+def test_failed_init_keeps_full_contexts(tmp_path):
+    bot = _loader(tmp_path, INIT_BOT)
+    bot.initialize({"walls": [], "game_mode": 2, "fail": True})
+    assert bot.execute(FRAME) == ("STOP", None)
+    assert _seen(bot)[0] == sorted(FRAME)
+
+
+def test_init_overrun_gives_exactly_one_lag(tmp_path, monkeypatch):
+    monkeypatch.setattr(gitwars.bots, "BOT_INIT_TIMEOUT_MS", -1)  # Any init() overruns
+    bot = _loader(tmp_path, INIT_BOT)
+    bot.initialize({"walls": [], "game_mode": 2})
+    assert [bot.execute(FRAME) for _ in range(3)] == [("LAG", None), ("STOP", None), ("STOP", None)]
+    assert len(_seen(bot)) == 2  # update() is not called on the LAG frame
@@ -0,0 +1,60 @@
+"""Tank broadphase (gitwars.broadphase)."""
+
+import random
+
+from config import *
+from gitwars.broadphase import SweepAndPrune
+from gitwars.entities import Tank, Wall
+from gitwars.wall_grid import WallGrid
+
+
+def _all_pairs(tanks, slack=0.0):
+    """Live pairs overlapping by more than slack, by brute force."""
+    live = [t for t in tanks if t.alive]
+    size = TANK_SIZE - slack
+    return sum(1 for i, a in enumerate(live) for b in live[i + 1:]
+               if abs(a.x - b.x) < size and abs(a.y - b.y) < size)
+
+
+def _jitter(tanks, rng, amount):
+    for tank in tanks:
+        tank.x = tank.pos.x = tank.x + rng.uniform(-amount, amount)
+        tank.y = tank.pos.y = tank.y + rng.uniform(-amount, amount)
+        tank.sync_rect()
+
+
+def test_sweep_finds_the_same_pairs_as_all_pairs(monkeypatch):
+    monkeypatch.setattr(SweepAndPrune, "_separate", lambda self, a, b, dx, dy: None)
+    rng = random.Random(0)
+    tanks = [Tank(i, rng.uniform(40, 800), rng.uniform(40, 600), (255, 0, 0)) for i in range(80)]
+    sap = SweepAndPrune()
+    for frame in range(100):
+        _jitter(tanks, rng, 3)
+        if frame == 40:
+            tanks[3].alive = False
+        assert sap.resolve(tanks) == _all_pairs(tanks)
+
+
+def test_jittered_frames_leave_no_pair_overlapping():
+    rng = random.Random(1)
+    tanks = [Tank(i, rng.uniform(100, 1000), rng.uniform(100, 700), (255, 0, 0)) for i in range(30)]
+    sap = SweepAndPrune()
+    sap.resolve(tanks)
+    for _ in range(200):
+        _jitter(tanks, rng, 2)
+        sap.resolve(tanks)
+        assert _all_pairs(tanks, slack=1e-9) == 0  # Separated pairs end up touching
+
+
+def test_tank_pressed_against_a_wall_is_not_pushed_into_it():
+    wall = Wall(200, 0, 20, 400)
+    sap = SweepAndPrune(wall_grid=WallGrid([wall]))
+    # Right tank touches the wall's left face; the left tank overlaps it by 10 px
+    right = Tank(1, 200 - TANK_SIZE // 2 - 1, 200, (255, 0, 0))
+    left = Tank(0, right.x - TANK_SIZE + 10, 200, (0, 0, 255))
+    right_x = right.x
+
+    assert sap.resolve([left, right]) == 1
+    assert right.x == right_x                   # Blocked: it stays put
+    assert not right.get_rect().colliderect(wall.get_rect())
+    assert right.x - left.x >= TANK_SIZE        # Left tank took the whole push
@@ -0,0 +1,44 @@
+"""Wall distance field (gitwars.distance_field)."""
+
+import random
+
+import pygame
+
+from config import *
+from gitwars.distance_field import DistanceField
+from gitwars.entities import Wall
+from gitwars.maze import generate_maze_layout
+from gitwars.utils import get_sensor_readings
+
+
+def _mazes(count):
+    for seed in range(count):
+        walls = [Wall(x, y, w, h) for x, y, w, h in generate_maze_layout(seed)]
+        yield walls, DistanceField(walls)
+
+
+def test_sensor_readings_match_the_brute_force_raycast():
+    rng = random.Random(0)
+    for walls, field in _mazes(8):
+        for _ in range(500):
+            x, y = rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT)
+            angle = rng.uniform(-180, 180)
+            assert field.sensor_readings(x, y, angle) == get_sensor_readings(x, y, angle, walls)
+
+
+def test_distance_never_exceeds_the_true_distance():
+    rng = random.Random(1)
+    for walls, field in _mazes(8):
+        rects = [wall.get_rect() for wall in walls]
+        for _ in range(500):
+            x, y = rng.uniform(0, WORLD_WIDTH), rng.uniform(0, WORLD_HEIGHT)
+            # The tank early-out: beyond TANK_SIZE, a tank here touches no wall
+            if field.distance(x, y) > TANK_SIZE:
+                tank = pygame.Rect(0, 0, TANK_SIZE, TANK_SIZE)
+                tank.center = (x, y)
+                assert tank.collidelist(rects) == -1
+            # Clearance never reports free space where there is a wall
+            probe = pygame.Rect(0, 0, 1, 1)
+            probe.center = (x, y)
+            if field.clearance(x, y) > 1:
+                assert probe.collidelist(rects) == -1
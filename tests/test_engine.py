@@ -0,0 +1,120 @@
+"""Engine frame loop (gitwars.engine)."""
+
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+import gitwars.bots
+from config import *
+from gitwars.engine import GitWarsEngine
+
+THINKER = (
+    "THINK_INTERVAL = 3\n"
+    "calls = 0\n"
+    "def init(static_context):\n"
+    "    pass\n"
+    "def update(context):\n"
+    "    global calls\n"
+    "    calls += 1\n"
+    "    return ('MOVE', (1, 0))\n"
+)
+
+
+def _engine(tmp_path, source, count=2):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"bot_{i}.py"
+        path.write_text(source)
+        paths.append(str(path))
+    return GitWarsEngine(game_mode=1, bot_paths=paths, record_replays=False)
+
+
+def _actions(engine, tank, frames):
+    actions = []
+    for _ in range(frames):
+        engine.update(1 / 60)
+        actions.append(tank.last_action)
+    return actions
+
+
+def test_decision_is_repeated_between_think_frames(tmp_path):
+    engine = _engine(tmp_path, THINKER)
+    try:
+        tank = engine.tanks[0]
+        assert _actions(engine, tank, 7) == ["MOVE"] * 7
+        assert engine.bots[tank.id].update_func.__globals__["calls"] == 3  # Frames 0, 3, 6
+    finally:
+        engine.shutdown()
+
+
+def test_init_overrun_lags_exactly_one_frame(tmp_path, monkeypatch):
+    monkeypatch.setattr(gitwars.bots, "BOT_INIT_TIMEOUT_MS", -1)  # Every init() overruns
+    engine = _engine(tmp_path, THINKER)
+    try:
+        tank = engine.tanks[0]
+        assert _actions(engine, tank, 7) == ["LAG", None, None, "MOVE", "MOVE", "MOVE", "MOVE"]
+    finally:
+        engine.shutdown()
+
+
+def test_maze_spawns_are_clear_of_walls(tmp_path, monkeypatch):
+    import gitwars.engine
+    import gitwars.maze
+    monkeypatch.setattr(gitwars.maze, "CACHE_DIR", str(tmp_path / "mazes"))
+    monkeypatch.setattr(gitwars.engine, "MAZE_PROCEDURAL", True)
+    path = tmp_path / "bot_idle.py"
+    path.write_text("def update(context):\n    return ('STOP', None)\n")
+    for seed in range(12):
+        monkeypatch.setattr(gitwars.engine, "MAZE_SEED", seed)
+        engine = GitWarsEngine(game_mode=2, bot_paths=[str(path)] * 6, record_replays=False)
+        try:
+            for tank in engine.tanks:
+                assert not engine.wall_grid.collides(tank.get_rect()), (seed, tank.id)
+        finally:
+            engine.shutdown()
+
+
+def _threats(bullet, tank_velocity=(0.0, 0.0)):
+    """Threats against one tank at (500, 300) from one bullet (velocities per frame)."""
+    tank = SimpleNamespace(id=0, x=500.0, y=300.0, alive=True,
+                           velocity=pygame.math.Vector2(tank_velocity[0] * FPS, tank_velocity[1] * FPS))
+    bx, by, vx, vy, owner = bullet
+    world = SimpleNamespace(tanks=[tank], bullets=[SimpleNamespace(id=7, x=bx, y=by, vx=vx, vy=vy,
+                                                                   owner_id=owner)])
+    GitWarsEngine.update_threats(world)
+    return world.threats[0]
+
+
+def test_head_on_bullet_is_a_hit():
+    (threat,) = _threats((400.0, 300.0, 5.0, 0.0, 1))  # 100 px away at 5 px/frame
+    assert threat["id"] == 7
+    assert threat["time"] == pytest.approx(20 / FPS, abs=1e-3)
+    assert threat["miss_distance"] == 0.0
+    assert threat["will_hit"] is True
+
+
+def test_passing_bullet_is_a_near_miss():
+    (threat,) = _threats((400.0, 300.0 - THREAT_HIT_RADIUS - 10, 5.0, 0.0, 1))
+    assert threat["miss_distance"] == THREAT_HIT_RADIUS + 10
+    assert threat["will_hit"] is False
+
+
+def test_bullet_moving_away_is_ignored():
+    assert _threats((400.0, 300.0, -5.0, 0.0, 1)) == []
+
+
+def test_own_bullet_is_ignored():
+    assert _threats((400.0, 300.0, 5.0, 0.0, 0)) == []
+
+
+def test_bullet_beyond_the_horizon_is_ignored():
+    frames = THREAT_HORIZON * FPS
+    assert _threats((500.0 - 2 * frames, 300.0, 1.0, 0.0, 1)) == []   # Arrives after the horizon
+    assert len(_threats((500.0 - 0.5 * frames, 300.0, 1.0, 0.0, 1))) == 1
+
+
+def test_zero_relative_velocity_is_ignored():
+    # Tank moving exactly with the bullet, and a bullet at rest next to a tank at rest
+    assert _threats((400.0, 300.0, 5.0, 0.0, 1), tank_velocity=(5.0, 0.0)) == []
+    assert _threats((450.0, 300.0, 0.0, 0.0, 1)) == []
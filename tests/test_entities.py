@@ -0,0 +1,13 @@
+"""Simulation entities (gitwars.entities)."""
+
+from gitwars.entities import Wall
+from gitwars.wall_grid import WallGrid
+
+
+def test_wall_rect_cannot_be_moved_through_get_rect():
+    wall = Wall(100, 200, 40, 20)
+    grid = WallGrid([wall])
+    rect = wall.get_rect()
+    rect.move_ip(500, 500)
+    assert wall.get_rect() == (100, 200, 40, 20)
+    assert grid.query_rects(wall.get_rect()) == [(100, 200, 40, 20)]
@@ -0,0 +1,64 @@
+"""Batched hazard evaluation (gitwars.hazards)."""
+
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from config import *
+from gitwars.effects import ParticleSystem
+from gitwars.hazards import DangerZone, Juggernaut, Zone, evaluate_hazards
+from gitwars.utils import angle_to, distance
+
+
+def per_hazard(tank, dt, zone, danger_zones, juggernaut):
+    """Reference: the original one-hazard-at-a-time checks, summed."""
+    damage = knock_x = knock_y = 0.0
+    if not tank.alive:
+        return damage, knock_x, knock_y
+    if zone.is_in_danger(tank.x, tank.y):
+        damage += LABYRINTH_ZONE_DAMAGE * dt
+    hits = [(dz.x, dz.y, DANGER_ZONE_DAMAGE, DANGER_ZONE_KNOCKBACK) for dz in danger_zones
+            if dz.phase == DangerZone.PHASE_ACTIVE and distance(dz.x, dz.y, tank.x, tank.y) < dz.radius]
+    if distance(juggernaut.x, juggernaut.y, tank.x, tank.y) < juggernaut.radius + TANK_SIZE // 2:
+        hits.append((juggernaut.x, juggernaut.y, JUGGERNAUT_MELEE_DAMAGE, JUGGERNAUT_MELEE_KNOCKBACK))
+    for x, y, hit_damage, force in hits:
+        damage += hit_damage
+        angle = math.radians(angle_to(x, y, tank.x, tank.y))
+        knock_x += math.cos(angle) * force
+        knock_y += math.sin(angle) * force
+    return damage, knock_x, knock_y
+
+
+def test_matches_per_hazard_checks():
+    rng = random.Random(3)
+    particles = ParticleSystem()
+    zone = Zone()
+    zone.margin = 120
+    danger_zones = []
+    for phase in (DangerZone.PHASE_ACTIVE, DangerZone.PHASE_ACTIVE, DangerZone.PHASE_WARNING):
+        dz = DangerZone(rng.uniform(200, 800), rng.uniform(200, 600), particles)
+        dz.phase = phase
+        danger_zones.append(dz)
+    juggernaut = Juggernaut(500, 400, particles)
+
+    tanks = [SimpleNamespace(x=rng.uniform(0, WORLD_WIDTH), y=rng.uniform(0, WORLD_HEIGHT),
+                             alive=rng.random() > 0.1) for _ in range(400)]
+    # Exactly on a hazard center
+    tanks.append(SimpleNamespace(x=juggernaut.x, y=juggernaut.y, alive=True))
+
+    results = evaluate_hazards(tanks, 1 / 60, zone=zone, danger_zones=danger_zones,
+                               juggernaut=juggernaut)
+    assert len(results) == len(tanks)
+    hit = 0
+    for tank, got in zip(tanks, results):
+        expected = per_hazard(tank, 1 / 60, zone, danger_zones, juggernaut)
+        assert got == pytest.approx(expected, abs=1e-9)
+        hit += got[0] > 0
+    assert hit > 0
+
+
+def test_no_hazards_is_harmless():
+    tanks = [SimpleNamespace(x=100.0, y=100.0, alive=True)]
+    assert evaluate_hazards(tanks, 1 / 60) == [(0.0, 0.0, 0.0)]
@@ -0,0 +1,40 @@
+"""Match cache keys (gitwars.matches)."""
+
+import config
+from gitwars.matches import match_key, simulation_config
+
+
+def _bot(tmp_path, name="bot_a.py", source="def update(context):\n    return ('STOP', None)\n"):
+    path = tmp_path / name
+    path.write_text(source)
+    return str(path)
+
+
+def test_key_is_stable(tmp_path):
+    bots = [_bot(tmp_path)]
+    assert match_key(bots, 2, 7) == match_key(bots, 2, 7)
+
+
+def test_key_changes_with_mode_seed_and_bot_source(tmp_path):
+    bot = _bot(tmp_path)
+    key = match_key([bot], 2, 7)
+    assert match_key([bot], 3, 7) != key
+    assert match_key([bot], 2, 8) != key
+    edited = _bot(tmp_path, "bot_b.py", "def update(context):\n    return ('MOVE', (1, 0))\n")
+    assert match_key([edited], 2, 7) != key
+
+
+def test_key_changes_with_match_length(tmp_path, monkeypatch):
+    bots = [_bot(tmp_path)]
+    key = match_key(bots, 2, 7)
+    monkeypatch.setattr(config, "MATCH_MAX_FRAMES", config.MATCH_MAX_FRAMES + 1)
+    assert "MATCH_MAX_FRAMES" in simulation_config()
+    assert match_key(bots, 2, 7) != key
+
+
+def test_key_ignores_presentation_settings(tmp_path, monkeypatch):
+    bots = [_bot(tmp_path)]
+    key = match_key(bots, 2, 7)
+    monkeypatch.setattr(config, "SHAKE_INTENSITY", config.SHAKE_INTENSITY + 1)
+    monkeypatch.setattr(config, "MATCH_CACHE_DIR", "elsewhere")
+    assert match_key(bots, 2, 7) == key
@@ -0,0 +1,36 @@
+"""Maze layout helpers (gitwars.maze)."""
+
+import random
+
+from gitwars.maze import merge_rectangles
+
+
+def _covered(rects, width, height):
+    """Coverage count per block."""
+    counts = [[0] * width for _ in range(height)]
+    for col, row, w, h in rects:
+        for y in range(row, row + h):
+            for x in range(col, col + w):
+                counts[y][x] += 1
+    return counts
+
+
+def test_rectangles_cover_each_wall_block_exactly_once():
+    rng = random.Random(4)
+    for _ in range(50):
+        width, height = rng.randrange(1, 12), rng.randrange(1, 12)
+        grid = [[rng.random() < 0.5 for _ in range(width)] for _ in range(height)]
+        counts = _covered(merge_rectangles(grid), width, height)
+        assert counts == [[int(cell) for cell in row] for row in grid]
+
+
+def test_solid_and_empty_grids():
+    assert merge_rectangles([[True] * 4 for _ in range(3)]) == [(0, 0, 4, 3)]
+    assert merge_rectangles([[False] * 4 for _ in range(3)]) == []
+
+
+def test_l_shape_is_two_rectangles():
+    grid = [[True, True, True],
+            [True, False, False],
+            [True, False, False]]
+    assert merge_rectangles(grid) == [(0, 0, 3, 1), (0, 1, 1, 2)]
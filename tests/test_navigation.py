@@ -0,0 +1,50 @@
+"""Flow fields (gitwars.navigation)."""
+
+from gitwars.entities import Wall
+from gitwars.navigation import FlowField, NavGrid
+
+CELL = 40
+
+
+def _grid(walls=()):
+    # 10 x 5 cells
+    return NavGrid(list(walls), width=400, height=200, cell_size=CELL)
+
+
+def test_open_grid_distances_are_manhattan():
+    grid = _grid()
+    source = grid.cell_of(20, 20)
+    field = FlowField(grid, [source])
+    for i in range(grid.size):
+        assert field.dist[i] == i % grid.cols + i // grid.cols
+
+
+def test_thin_wall_forces_a_detour():
+    # Vertical wall on the x = 200 lattice line, open only in the bottom row
+    grid = _grid([Wall(198, 0, 4, 160)])
+    field = FlowField(grid, [grid.cell_of(180, 20)])
+    # Right next door, but 4 rows down, 1 across and 4 back up
+    assert field.dist[grid.cell_of(220, 20)] == 9
+
+
+def test_next_cell_steps_toward_the_source():
+    grid = _grid([Wall(198, 0, 4, 160)])
+    field = FlowField(grid, [grid.cell_of(20, 20), grid.cell_of(380, 180)])
+    for i in range(grid.size):
+        if field.dist[i] > 0:
+            assert field.dist[field.next_cell[i]] == field.dist[i] - 1
+            assert field.next_cell[i] in grid.neighbors[i]
+
+
+def test_lookup():
+    grid = _grid()
+    field = FlowField(grid, [grid.cell_of(20, 20)])
+    assert field.lookup(25, 30) == {"distance": 0, "direction": None}
+    assert field.lookup(100, 20) == {"distance": 2 * CELL, "direction": (-1.0, 0.0)}
+
+
+def test_walled_off_cells_are_unreachable():
+    # Box around the top-left cell
+    grid = _grid([Wall(0, 38, 42, 4), Wall(38, 0, 4, 42)])
+    field = FlowField(grid, [grid.cell_of(300, 100)])
+    assert field.lookup(20, 20) is None
@@ -0,0 +1,55 @@
+"""Replay files (gitwars.replay)."""
+
+import random
+
+import pytest
+
+from gitwars.replay import ReplayReader, ReplayWriter
+
+
+def _states(count, seed=1):
+    """Frames that change a little each step, with tanks joining and leaving."""
+    rng = random.Random(seed)
+    tanks = {"0": [10.0, 10.0, 0.0], "1": [50.0, 50.0, 90.0]}
+    states = []
+    for frame in range(count):
+        tanks = {tid: [x + rng.choice((0, 1)), y, a] for tid, (x, y, a) in tanks.items()}
+        if frame == 7:
+            tanks["2"] = [90.0, 90.0, 180.0]
+        if frame == 19:
+            del tanks["0"]
+        states.append({"timer": frame // 4, "tanks": tanks, "bullets": [[frame, frame]] * (frame % 3)})
+    return states
+
+
+def _record(path, states, keyframe_interval):
+    writer = ReplayWriter(str(path), keyframe_interval=keyframe_interval)
+    for state in states:
+        writer.add_frame(state)
+    writer.close()
+    return ReplayReader(str(path))
+
+
+def test_state_at_matches_every_frame_across_keyframes(tmp_path):
+    states = _states(37)
+    reader = _record(tmp_path / "match.gwr", states, keyframe_interval=10)
+    try:
+        assert reader.frame_count == 37
+        # Forward steps, then seeks back and forth over keyframe boundaries
+        order = list(range(37)) + [35, 3, 10, 9, 29, 30, 0, 36, 21, 20, 19]
+        for frame in order:
+            assert reader.state_at(frame) == states[frame]
+        assert reader.state_at(-5) == states[0]
+        assert reader.state_at(100) == states[-1]
+    finally:
+        reader.close()
+
+
+def test_empty_replay_raises_value_error(tmp_path):
+    reader = _record(tmp_path / "empty.gwr", [], keyframe_interval=10)
+    try:
+        assert reader.frame_count == 0
+        with pytest.raises(ValueError, match="no frames"):
+            reader.state_at(0)
+    finally:
+        reader.close()
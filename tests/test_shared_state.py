@@ -0,0 +1,90 @@
+"""Shared-memory world state (gitwars.shared_state)."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from gitwars.shared_state import WorldStatePublisher, WorldStateView
+
+
+def _engine():
+    tank = SimpleNamespace(id=0, alive=True, x=10.0, y=20.0, angle=90.0,
+                           health=80.0, ammo=3, coins=1)
+    enemy = SimpleNamespace(id=1, alive=True, x=30.0, y=40.0, angle=0.0,
+                            health=100.0, ammo=5, coins=0)
+    bullet = SimpleNamespace(id=7, owner_id=1, x=1.0, y=2.0, vx=3.0, vy=4.0)
+    coin = SimpleNamespace(id=9, collected=False, x=5.0, y=6.0)
+    return SimpleNamespace(tanks=[tank, enemy], bullets=[bullet], coins=[coin], walls=[],
+                           juggernaut=None, game_mode=1, game_timer=12.5)
+
+
+@pytest.fixture
+def publisher(monkeypatch):
+    # Views normally live in worker processes; here they share the publisher's
+    # resource tracker, which must keep its registration for the unlink
+    monkeypatch.setattr(WorldStateView, "_untrack", lambda self: None)
+    pub = WorldStatePublisher(name=f"gwss_test_{os.getpid()}", max_tanks=4,
+                              max_bullets=8, max_coins=8, max_walls=8)
+    yield pub
+    pub.close()
+
+
+def test_view_reads_published_frame(publisher):
+    sensors = {0: {"front": 1.0, "left": 2.0, "right": 3.0}}
+    publisher.publish(_engine(), sensors, {0: 4.5})
+    view = WorldStateView(publisher.name, max_tanks=4, max_bullets=8, max_coins=8, max_walls=8)
+    try:
+        context = view.context_for(0)
+    finally:
+        view.close()
+    assert context["me"]["health"] == 80.0
+    assert context["sensors"] == sensors[0]
+    assert context["clearance"] == 4.5
+    assert context["enemies"] == [{"x": 30.0, "y": 40.0, "id": 1}]
+    # Stable ids, so DeltaContext works on worker contexts too
+    assert context["bullets"] == [{"id": 7, "x": 1.0, "y": 2.0, "vx": 3.0, "vy": 4.0}]
+    assert context["coins"] == [{"id": 9, "x": 5.0, "y": 6.0}]
+    assert context["time_left"] == 12.5
+
+
+def test_view_rejects_other_capacities(publisher):
+    with pytest.raises(ValueError, match="capacities"):
+        WorldStateView(publisher.name, max_tanks=4, max_bullets=16, max_coins=8, max_walls=8)
+
+
+def test_engine_publishes_sensors_at_the_published_pose(monkeypatch, tmp_path):
+    import gitwars.engine
+    from gitwars.engine import GitWarsEngine
+    monkeypatch.setattr(WorldStateView, "_untrack", lambda self: None)
+    monkeypatch.setattr(gitwars.engine, "SHARED_STATE_ENABLED", True)
+    bot = tmp_path / "bot_mover.py"
+    bot.write_text("def update(context):\n    return ('MOVE', (1, 0.5))\n")
+    engine = GitWarsEngine(game_mode=2, bot_paths=[str(bot)] * 6, record_replays=False)
+    try:
+        view = WorldStateView(engine.state_publisher.name)
+        try:
+            for _ in range(120):
+                engine.update(1 / 60)
+                snap = view.snapshot()
+                for tank in engine.tanks:
+                    expected = engine.distance_field.sensor_readings(tank.x, tank.y, tank.angle)
+                    assert snap.context_for(tank.id)["sensors"] == expected
+        finally:
+            view.close()
+    finally:
+        engine.shutdown()
+
+
+def test_second_publisher_does_not_take_over_a_live_block(publisher):
+    with pytest.raises(FileExistsError, match="already exists"):
+        WorldStatePublisher(name=publisher.name, max_tanks=4, max_bullets=8, max_coins=8, max_walls=8)
+    assert publisher.shm.buf is not None
+
+
+def test_default_names_are_per_process():
+    publisher = WorldStatePublisher(max_tanks=1, max_bullets=1, max_coins=1, max_walls=1)
+    try:
+        assert publisher.name.endswith(f"_{os.getpid()}")
+    finally:
+        publisher.close()
@@ -0,0 +1,37 @@
+"""Frame snapshots and deltas (gitwars.snapshot)."""
+
+import os
+
+from gitwars.snapshot import DELTA, KEYFRAME, RECORD, apply_delta, capture, decode_body, diff, encode
+
+BOTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bots")
+BOTS = [os.path.join(BOTS_DIR, name) for name in ("bot_dummy.py", "my_bot.py")]
+
+
+def test_diff_then_apply_rebuilds_the_next_state():
+    prev = {"timer": 1.0, "tanks": {"0": [1, 2], "1": [3, 4]}, "coins": [[5, 5]], "over": False}
+    cur = {"timer": 1.1, "tanks": {"0": [1, 3], "2": [7, 7]}, "coins": [[5, 5]], "over": False}
+    delta = diff(prev, cur)
+    # Unchanged sections and tanks are left out; removed tanks are None
+    assert delta == {"timer": 1.1, "tanks": {"0": [1, 3], "2": [7, 7], "1": None}}
+    assert apply_delta(prev, delta) == cur
+    assert prev["tanks"] == {"0": [1, 2], "1": [3, 4]}  # Not modified
+
+
+def test_engine_frames_round_trip_through_records():
+    from gitwars.engine import GitWarsEngine
+    engine = GitWarsEngine(game_mode=2, bot_paths=BOTS, record_replays=False)
+    try:
+        state = None
+        for _ in range(90):
+            engine.update(1 / 60)
+            cur = capture(engine)
+            kind = KEYFRAME if state is None else DELTA
+            record = encode(kind, cur if state is None else diff(state, cur))
+            got_kind, length = RECORD.unpack_from(record, 0)
+            payload = decode_body(record[RECORD.size:RECORD.size + length])
+            state = payload if got_kind == KEYFRAME else apply_delta(state, payload)
+            assert got_kind == kind
+            assert state == cur
+    finally:
+        engine.shutdown()
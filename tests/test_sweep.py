@@ -0,0 +1,39 @@
+"""Config sweeps (gitwars.sweep)."""
+
+import importlib
+
+import pytest
+
+import config
+from gitwars.sweep import apply_overrides, grid, is_constant
+
+
+@pytest.fixture
+def fresh_config():
+    yield
+    importlib.reload(config)  # Undo the overrides for later tests
+
+
+def test_derived_constants_follow_overrides(fresh_config):
+    apply_overrides({"FPS": 30, "SCREEN_WIDTH": 800, "TANK_SIZE": 20})
+    assert config.MATCH_MAX_FRAMES == 30 * 300
+    assert config.WORLD_WIDTH == 800
+    assert config.THREAT_HIT_RADIUS == 20 // 2 + config.BULLET_SIZE
+
+
+def test_derived_constant_can_be_overridden_directly(fresh_config):
+    apply_overrides({"MATCH_MAX_FRAMES": 123, "FPS": 30})
+    assert config.MATCH_MAX_FRAMES == 123
+    assert config.FPS == 30
+
+
+def test_only_upper_case_config_names_are_constants(fresh_config):
+    assert is_constant("BULLET_SPEED")
+    assert not is_constant("main")
+    assert not is_constant("os")
+    with pytest.raises(KeyError):
+        apply_overrides({"main": 1})
+
+
+def test_grid_covers_every_combination():
+    assert grid({"A": [1, 2], "B": [3]}) == [{"A": 1, "B": 3}, {"A": 2, "B": 3}]
@@ -0,0 +1,37 @@
+"""Wall broadphase grid (gitwars.wall_grid)."""
+
+import random
+
+import pygame
+
+from gitwars.entities import Wall
+from gitwars.wall_grid import WallGrid
+
+
+def _walls(rng, count=40):
+    return [Wall(rng.randrange(0, 900), rng.randrange(0, 700),
+                 rng.randrange(10, 160), rng.randrange(10, 160)) for _ in range(count)]
+
+
+def test_segment_queries_match_every_wall():
+    rng = random.Random(5)
+    walls = _walls(rng)
+    grid = WallGrid(walls, width=1000, height=800, cell_size=80)
+    for _ in range(500):
+        x0, y0, x1, y1 = (rng.uniform(0, 1000), rng.uniform(0, 800),
+                          rng.uniform(0, 1000), rng.uniform(0, 800))
+        brute = [w for w in walls if w.get_rect().clipline((x0, y0), (x1, y1))]
+        assert grid.query_segment(x0, y0, x1, y1) == brute
+        assert grid.line_of_sight(x0, y0, x1, y1) == (not brute)
+
+
+def test_rect_queries_cover_every_overlap():
+    rng = random.Random(6)
+    walls = _walls(rng)
+    grid = WallGrid(walls, width=1000, height=800, cell_size=80)
+    for _ in range(500):
+        rect = pygame.Rect(rng.randrange(0, 980), rng.randrange(0, 780), 30, 30)
+        overlapping = [w.get_rect() for w in walls if rect.colliderect(w.get_rect())]
+        candidates = grid.query_rects(rect)
+        assert all(r in candidates for r in overlapping)
+        assert grid.collides(rect) == bool(overlapping)
@@ -0,0 +1,78 @@
+"""
+GitWars - Tournament Runner (Headless)
+======================================
+Plays every matchup of a bracket without a window and prints standings.
+
+Run with: python tournament.py [--mode 3] [--seeds 3] [--group-size 2]
+
+Results are cached by content (see gitwars.matches): after a team pushes
+a fix, rerunning the bracket only simulates the matchups that include
+their bot. Use --no-cache to force every match to run.
+
+Scoring: in a match of N bots, 1st place earns N - 1 points, last earns 0.
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import itertools
+import os
+import time
+
+from gitwars.matches import MatchCache, run_match
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Headless GitWars tournament")
+    parser.add_argument("--mode", type=int, default=3, choices=(1, 2, 3))
+    parser.add_argument("--bots", default=os.path.join(ROOT_DIR, "bots", "bot_*.py"),
+                        help="Glob of bot files")
+    parser.add_argument("--seeds", type=int, default=1, help="Matches per matchup (seeds 0..N-1)")
+    parser.add_argument("--group-size", type=int, default=None,
+                        help="Bots per match (default: 2 for Duel, everyone otherwise)")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--verbose", action="store_true", help="Show bot output")
+    args = parser.parse_args()
+
+    bots = sorted(glob.glob(args.bots))
+    group_size = args.group_size or (2 if args.mode == 3 else len(bots))
+    if len(bots) < group_size or group_size < 1:
+        parser.error(f"need at least {group_size} bots, found {len(bots)}")
+
+    cache = None if args.no_cache else MatchCache()
+    points = {os.path.basename(b): 0 for b in bots}
+    matchups = list(itertools.combinations(bots, group_size))
+    simulated = 0
+    start = time.perf_counter()
+
+    for group in matchups:
+        for seed in range(args.seeds):
+            quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+            with quiet:
+                if cache:
+                    result, cached = cache.run(list(group), args.mode, seed)
+                else:
+                    result, cached = run_match(list(group), args.mode, seed), False
+            simulated += not cached
+
+            ranking = [os.path.basename(group[slot]) for slot in result["ranking"]]
+            for place, bot in enumerate(ranking):
+                points[bot] += len(ranking) - 1 - place
+
+            label = " vs ".join(os.path.basename(b) for b in group)
+            print(f"  [{'cached' if cached else 'ran   '}] seed {seed}: {label} -> {ranking[0]}")
+
+    total = len(matchups) * args.seeds
+    print(f"\n{total} matches ({simulated} simulated, {total - simulated} cached) "
+          f"in {time.perf_counter() - start:.1f}s\n")
+    print("STANDINGS")
+    for rank, (bot, score) in enumerate(sorted(points.items(), key=lambda kv: -kv[1]), 1):
+        print(f"  {rank:2d}. {bot:30s} {score}")
+
+
+if __name__ == "__main__":
+    main()
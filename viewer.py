@@ -0,0 +1,62 @@
+"""
+GitWars - Spectator Viewer
+==========================
+Renders a match streamed by server.py (or main.py with
+SPECTATOR_STREAM_ENABLED) on another machine.
+
+Run with: python viewer.py [host] [--port 47800]
+
+Only the display is used; no bots or simulation run here.
+"""
+
+import argparse
+import sys
+
+import pygame
+
+from config import *
+from gitwars.render import Renderer
+from gitwars.snapshot import Scene
+from gitwars.spectate import SpectatorClient
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="GitWars spectator viewer")
+    parser.add_argument("host", nargs="?", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=SPECTATOR_PORT)
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption(f"{TITLE} - Spectator ({args.host})")
+    clock = pygame.time.Clock()
+
+    renderer = Renderer(screen)
+    scene = Scene()
+    client = SpectatorClient(args.host, args.port)
+
+    running = True
+    while running and client.connected:
+        dt = clock.tick(FPS) / 1000.0
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+
+        state = client.poll()
+        if state is not None:
+            scene.set_state(state)
+        scene.update_effects(dt)
+
+        if scene.state is not None:
+            renderer.draw(scene, clock.get_fps())
+            pygame.display.flip()
+
+    client.close()
+    pygame.quit()
+    sys.exit()
+
+
+if __name__ == "__main__":
+    main()